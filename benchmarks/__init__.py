@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+성능 측정 모음: heartowiki.xlsx와 같은 모양의 합성 통합문서(workbook)를 원하는 배율로 만들고,
+그 데이터로 주요 경로(xlsx 파싱, 캐시 쓰기/읽기, 메모리, 조회, 수집정보 읽기/저장, get_app_data 직렬화)를 잽니다.
+결과는 JSON으로 출력해 커밋 사이에 비교할 수 있습니다.
+
+  python -m benchmarks [--scales 1,10,100] [--only parse,query] [--out 결과.json]
+  python -m benchmarks.workbook --scale 10 -o 합성.xlsx
+"""
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+성능 측정 모음 실행: 배율마다 합성 통합문서(benchmarks.workbook)를 만들어 아래 항목을 재고 JSON으로 출력합니다.
+앱 데이터 폴더는 임시 폴더를 홈으로 두고 만들므로 실제 수집정보·캐시는 건드리지 않습니다.
+
+  parse       _xlsx_to_creatures_data (통합문서 크기, 파싱 시간)
+  cache       cache.json(indent=2)·cache.bin 크기와 쓰기/읽기 시간
+  memory      행 dict 목록 vs catalog_store 열 배열의 메모리 (tracemalloc, 남은 양·최대)
+  query       Api.query 색인 만들기와 필터·검색어(초성 포함) 조합 조회 시간
+  collection  별이 도감 행 수만큼 있는 수집정보의 load_collection / save_user_data_from_app (1% 변경, 같은 값)
+  app_data    get_app_data(전체 / lazy) 응답 JSON 크기와 직렬화까지의 시간
+
+시간은 repeat번 중 가장 짧은 값(ms). 결과: { meta: { commit, python, platform, ... }, results: { 항목: [배율별 dict] } }
+
+사용법: python -m benchmarks [--scales 1,10,100] [--only parse,cache] [--repeat 3] [--out 결과.json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks import workbook
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return round(best * 1000, 3)
+
+
+def _commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(ROOT), capture_output=True, text=True)
+        return out.stdout.strip()
+    except Exception:
+        return ""
+
+
+def bench_parse(ctx: dict) -> dict:
+    main = ctx["main"]
+    raw = ctx["raw"]
+    return {"xlsx_bytes": len(raw), "parse_ms": _best(lambda: main._xlsx_to_creatures_data(raw), ctx["repeat"])}
+
+
+def bench_cache(ctx: dict) -> dict:
+    import cache_store
+    import catalog_store
+
+    data = ctx["data"]
+    tmp = ctx["tmp"]
+    json_path = tmp / "bench_cache.json"
+    bin_path = tmp / "bench_cache.bin"
+
+    def write_json():
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def read_json():
+        with open(json_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def read_bin():
+        header, strings, categories = cache_store.load_columns(bin_path)
+        return catalog_store.from_columns(strings, categories, header.get("meta"))
+
+    result = {
+        "json_write_ms": _best(write_json, ctx["repeat"]),
+        "json_read_ms": _best(read_json, ctx["repeat"]),
+        "bin_write_ms": _best(lambda: cache_store.dump(data, bin_path), ctx["repeat"]),
+        "bin_read_ms": _best(read_bin, ctx["repeat"]),
+        "json_bytes": json_path.stat().st_size,
+        "bin_bytes": bin_path.stat().st_size,
+    }
+    assert catalog_store.plain(read_bin()) == read_json()
+    return result
+
+
+def _traced(load):
+    """(결과, 남은 바이트, 최대 바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    value = load()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, current, peak
+
+
+def bench_memory(ctx: dict) -> dict:
+    import cache_store
+    import catalog_store
+
+    path = ctx["tmp"] / "bench_memory.bin"
+    cache_store.dump(ctx["data"], path)
+
+    def columns():
+        header, strings, categories = cache_store.load_columns(path)
+        return catalog_store.from_columns(strings, categories, header.get("meta"))
+
+    dicts, d_now, d_peak = _traced(lambda: cache_store.load(path))
+    compact, c_now, c_peak = _traced(columns)
+    assert catalog_store.plain(compact) == dicts
+    return {"dict_bytes": d_now, "dict_peak_bytes": d_peak, "columns_bytes": c_now, "columns_peak_bytes": c_peak,
+            "ratio": round(c_now / d_now, 3) if d_now else None}
+
+
+def _queries(index, rnd: random.Random, categories) -> list:
+    import catalog_query
+
+    out = []
+    for cat in categories:
+        rows = index.category(cat).items
+        locations = sorted({r.get("지역") for r in rows if r.get("지역")}) or [""]
+        levels = sorted({r.get("레벨") for r in rows if r.get("레벨")}) or [""]
+        words = [r.get("명칭", "")[:2] for r in rows[:20]] + ["ㄱㄹ", "ㅂㄷ", "황금", "바다", "나비"]
+        for _ in range(50):
+            out.append((cat, {
+                "search": rnd.choice(words + [""] * 25),
+                "location": rnd.choice(locations + ["", ""]),
+                "level": rnd.choice(levels + ["", ""]),
+                "weather": rnd.choice(["", "", "비", "무지개", "맑은 날"]),
+                "hide_completed": rnd.random() < 0.3,
+                "sort": rnd.choice(catalog_query.SORTS),
+            }))
+        out.append((cat, {}))  # 필터 없음 (전체 목록)
+    return out
+
+
+def bench_query(ctx: dict) -> dict:
+    import catalog_query
+    import catalog_store
+
+    main = ctx["main"]
+    data = catalog_store.compact(ctx["data"])
+    rnd = random.Random(0)
+    stars = ctx["stars"]
+    t = time.perf_counter()
+    index = catalog_query.CatalogIndex(data, {})
+    index.warm()
+    for cat in main.CATEGORIES:
+        for sort in catalog_query.SORTS:
+            index.category(cat).space(sort)
+    build = (time.perf_counter() - t) * 1000
+    queries = _queries(index, rnd, main.CATEGORIES)
+    for cat, options in queries:  # 검색 색인·수집 완료 비트셋 등 첫 계산 제외
+        index.query(cat, stars=stars, stars_revision=1, **options)
+    times = []
+    for cat, options in queries:
+        t = time.perf_counter()
+        index.query(cat, stars=stars, stars_revision=1, **options)
+        times.append((time.perf_counter() - t) * 1000)
+    times.sort()
+    return {"index_ms": round(build, 3), "queries": len(times), "mean_ms": round(statistics.fmean(times), 4),
+            "p95_ms": round(times[int(len(times) * 0.95)], 4), "max_ms": round(times[-1], 4)}
+
+
+def bench_collection(ctx: dict) -> dict:
+    main = ctx["main"]
+    stars = ctx["stars"]
+    main.close_collection()
+    main._collection = None
+    for path in (main.COLLECTION_PATH, main.COLLECTION_JOURNAL_PATH):
+        if path.exists():
+            path.unlink()
+    main.COLLECTION_PATH.write_text(json.dumps({"stars": stars, "userCreatures": {}}, ensure_ascii=False),
+                                    encoding="utf-8")
+
+    def load():
+        main._collection = None
+        return main.load_collection()
+
+    load_ms = _best(load, ctx["repeat"])
+    assert len(main.load_collection()["stars"]) == len(stars)
+    keys = list(stars)
+    changed = dict(stars)
+    for key in keys[::100]:
+        changed[key] = (changed[key] + 1) % 6
+    save_ms = _best(lambda: main.save_user_data_from_app(stars=changed), 1)
+    same_ms = _best(lambda: main.save_user_data_from_app(stars=changed), ctx["repeat"])
+    t = time.perf_counter()
+    main.close_collection()  # 저널 → collection.json
+    close_ms = (time.perf_counter() - t) * 1000
+    main._collection = None
+    return {"stars": len(stars), "collection_bytes": main.COLLECTION_PATH.stat().st_size, "load_ms": load_ms,
+            "save_changed_ms": save_ms, "save_same_ms": same_ms, "close_ms": round(close_ms, 3)}
+
+
+def bench_app_data(ctx: dict) -> dict:
+    import catalog_store
+
+    main = ctx["main"]
+    main._cached_base = catalog_store.compact(ctx["data"])
+    main._catalog_index().warm()  # get_app_data가 띄우는 색인 스레드가 측정에 끼지 않도록 미리 만듦
+    result = {}
+    for label, lazy in (("full", False), ("lazy", True)):
+        payload = json.dumps(main.get_app_data(lazy=lazy), ensure_ascii=False)
+        result[f"{label}_bytes"] = len(payload.encode("utf-8"))
+        result[f"{label}_ms"] = _best(lambda: json.dumps(main.get_app_data(lazy=lazy), ensure_ascii=False),
+                                      ctx["repeat"])
+    main._cached_base = None
+    main._query_index = None
+    return result
+
+
+BENCHMARKS = {
+    "parse": bench_parse,
+    "cache": bench_cache,
+    "memory": bench_memory,
+    "query": bench_query,
+    "collection": bench_collection,
+    "app_data": bench_app_data,
+}
+
+
+def run(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", default="1,10,100", help="쉼표로 구분한 배율 (예: 1,10,100,1000)")
+    parser.add_argument("--only", default="", help="쉼표로 구분한 항목 (기본: 전부) — " + ", ".join(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, help="결과 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+    scales = [float(s) for s in args.scales.split(",") if s.strip()]
+    names = [n.strip() for n in args.only.split(",") if n.strip()] or list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        parser.error("알 수 없는 항목: " + ", ".join(unknown))
+
+    results = {name: [] for name in names}
+    with tempfile.TemporaryDirectory() as home:
+        if "main" in sys.modules:
+            print("main이 이미 import되어 있어 임시 데이터 폴더를 쓸 수 없습니다.", file=sys.stderr)
+            return 1
+        os.environ["HOME"] = os.environ["USERPROFILE"] = home
+        import main
+
+        main.get_data_dir()
+        for scale in scales:
+            t = time.perf_counter()
+            raw = workbook.generate(scale, args.seed)
+            data = main._xlsx_to_creatures_data(raw)
+            rows = sum(len(v) for v in data.values() if isinstance(v, list))
+            rnd = random.Random(args.seed)
+            ctx = {
+                "main": main,
+                "raw": raw,
+                "data": data,
+                "tmp": Path(home),
+                "repeat": args.repeat,
+                "stars": {f"{c}_{r['명칭']}": rnd.randint(0, 5) for c in main.CATEGORIES for r in data[c]},
+            }
+            print(f"{scale:g}×: {rows:,}행 준비 {time.perf_counter() - t:.1f}s", file=sys.stderr)
+            for name in names:
+                t = time.perf_counter()
+                results[name].append({"scale": scale, "rows": rows, **BENCHMARKS[name](ctx)})
+                print(f"  {name}: {time.perf_counter() - t:.1f}s", file=sys.stderr)
+        main.close_collection()
+        main.close_settings()
+
+    report = {
+        "meta": {
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
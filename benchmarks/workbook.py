@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+heartowiki.xlsx 모양의 합성 통합문서 생성: 같은 시트 이름·헤더(도감 정보, 어류 관찰, 새 관찰 일지, 곤충 이야기, 미식 라이프)에
+한국어 명칭·지역·날씨·시간대와 숫자 레벨/시즌 레벨(꿈의명암, 빙설시즌, 획득불가)을 섞은 행을 채웁니다.
+scale=1이면 실제 도감과 비슷한 행 수(347행), scale=N이면 N배. 같은 seed면 같은 내용.
+
+사용법: python -m benchmarks.workbook [--scale 10] [--seed 0] [-o 합성.xlsx]
+"""
+
+import argparse
+import io
+import random
+import sys
+from pathlib import Path
+
+# 시트별 scale=1 행 수 (실제 heartowiki.xlsx와 비슷하게)
+ROWS = {"어류 관찰": 107, "새 관찰 일지": 73, "곤충 이야기": 74, "미식 라이프": 93}
+HEADERS = {
+    "도감 정보": ("도감 버전", "마지막 업데이트"),
+    "어류 관찰": ("이름", "레벨", "위치", "크기", "가격", "시간대", "날씨", "비고"),
+    "새 관찰 일지": ("이름", "레벨", "위치", "세부위치", "시간대", "날씨"),
+    "곤충 이야기": ("이름", "레벨", "위치", "세부위치", "시간대", "날씨"),
+    "미식 라이프": ("이름", "레벨", "재료", "레시피", "가격", "비고"),
+}
+
+_PREFIXES = ("민물", "바다", "무지개", "황금", "은빛", "붉은", "푸른", "얼룩", "줄무늬", "점박이", "유럽", "북극",
+             "작은", "큰", "긴꼬리", "꼬마")
+_NAMES = {
+    "어류 관찰": ("붕어", "잉어", "송어", "연어", "농어", "도미", "참치", "고등어", "쏘가리", "메기", "뱀장어", "개구리",
+              "가재", "복어", "가자미", "우럭", "해마", "문어"),
+    "새 관찰 일지": ("참새", "박새", "울새", "굴뚝새", "딱따구리", "까치", "비둘기", "갈매기", "백로", "두루미", "올빼미",
+                "물총새", "제비"),
+    "곤충 이야기": ("나비", "잠자리", "나방", "딱정벌레", "사슴벌레", "풍뎅이", "매미", "메뚜기", "무당벌레", "반딧불이",
+               "사마귀", "꿀벌"),
+}
+_DISHES = (("버섯", "감자", "토마토", "딸기", "블루베리", "연어", "치즈", "꿀", "사과", "호박", "당근", "옥수수"),
+           ("수프", "파이", "잼", "샐러드", "스튜", "케이크", "구이", "주스", "리조또", "샌드위치"))
+_WATER = ("강", "호수", "근교 호수", "숲속 호수", "바다낚시", "잔잔한 바다", "고래 바다", "구해", "동해", "온천 산수")
+_LAND = ("숲", "도시", "도시 근교", "도심", "꽃밭", "순록탑", "온천산", "어촌", "영혼의 참나무숲", "고래산", "홈")
+_SUB = ("", "", "", "북쪽 언덕", "폭포 아래", "등대 근처", "광장")
+_WEATHER = ("무관",) * 6 + ("무지개", "맑은 날/무지개", "비/무지개", "맑음/무지개", "비")
+_TIME = ("종일",) * 6 + ("0~6/18~24", "12~24", "0~6/12~24", "6~24", "6~18", "0~12/18~24")
+_SIZE = ("소", "소", "중", "중", "대", "길다", "특수", "")
+_FISH_PRICE = (50, 75, 100, 150, 230, 320, 610, 850, 1200)
+_FISH_NOTE = ("",) * 8 + ("집어기 사용시 등장", "이벤트 한정", "획득 불가")
+_SEASONS = ("꿈의명암", "빙설시즌", "획득불가")
+
+
+def _names(rnd: random.Random, prefixes, bases, count: int):
+    """서로 다른 명칭 count개 (조합을 다 쓰면 뒤에 번호)."""
+    combos = [p + b for p in prefixes for b in bases]
+    rnd.shuffle(combos)
+    for i in range(count):
+        name = combos[i % len(combos)]
+        yield name if i < len(combos) else f"{name} {i // len(combos) + 1}"
+
+
+def _level(rnd: random.Random, season: float):
+    if rnd.random() < season:
+        return rnd.choice(_SEASONS)
+    return float(min(12, int(rnd.expovariate(0.3)) + 1))  # 낮은 레벨이 많음 (엑셀 숫자 셀)
+
+
+def _rows(sheet: str, rnd: random.Random, count: int):
+    if sheet == "미식 라이프":
+        for i, name in enumerate(_names(rnd, *_DISHES, count)):
+            if i < 2:
+                yield ("괴상한 음식" if i == 0 else "괴상한 음료", 1.0, "", "x", 20.0 + 10 * i, "")
+                continue
+            a, b = rnd.sample(_DISHES[0], 2)
+            dish = next(d for d in _DISHES[1] if name.split(" ")[0].endswith(d))
+            yield (name, _level(rnd, 0.35), f"{a} ×{rnd.randint(1, 4)}, {b} ×{rnd.randint(1, 2)}",
+                   f"{dish} 레시피", float(rnd.randrange(100, 700, 10)), rnd.choice(("",) * 10 + ("획득 불가",)))
+        return
+    names = _names(rnd, _PREFIXES, _NAMES[sheet], count)
+    if sheet == "어류 관찰":
+        for name in names:
+            yield (name, _level(rnd, 0.03), rnd.choice(_WATER), rnd.choice(_SIZE), float(rnd.choice(_FISH_PRICE)),
+                   rnd.choice(_TIME), rnd.choice(_WEATHER), rnd.choice(_FISH_NOTE))
+        return
+    for name in names:
+        yield (name, _level(rnd, 0.07), rnd.choice(_LAND), rnd.choice(_SUB), rnd.choice(_TIME), rnd.choice(_WEATHER))
+
+
+def generate(scale: float = 1, seed: int = 0) -> bytes:
+    """합성 통합문서 바이트 (openpyxl write_only)."""
+    from openpyxl import Workbook
+
+    rnd = random.Random(seed)
+    wb = Workbook(write_only=True)
+    for sheet, header in HEADERS.items():
+        ws = wb.create_sheet(sheet)
+        ws.append(header)
+        if sheet == "도감 정보":
+            ws.append((f"bench-{scale:g}x", "2026-01-01"))
+            continue
+        for row in _rows(sheet, rnd, max(1, int(ROWS[sheet] * scale))):
+            ws.append(row)
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def row_count(scale: float) -> int:
+    """generate(scale)의 도감 행 수."""
+    return sum(max(1, int(n * scale)) for n in ROWS.values())
+
+
+def run(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--out", type=Path, default=Path("synthetic.xlsx"))
+    args = parser.parse_args(argv)
+    raw = generate(args.scale, args.seed)
+    args.out.write_bytes(raw)
+    print(f"{args.out}: {row_count(args.scale):,}행, {len(raw):,} 바이트")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+도감 데이터 캐시 파일(cache.bin) 형식: 카테고리별 열(column) 배열 + 공용 문자열 표.
+지역·날씨·시간대·레벨처럼 반복되는 값은 문자열 표에 한 번만 저장하고, 각 열은 문자열 번호(uint32) 배열입니다.
+
+  MAGIC(8) | 헤더 길이(uint32) | 헤더 JSON | (4바이트 정렬) | 문자열 오프셋(uint32 × (n+1)) | 문자열 UTF-8 | 열 배열들
+  | derived 지역(문자열 번호) | derived 열 배열들
+
+헤더에는 형식 버전, data_hash, data_version 등과 각 구역의 오프셋이 들어 있어 mmap으로 연 뒤 필요한 부분만 읽습니다.
+records.derive 결과(meta의 derived)는 헤더 JSON이 아니라 본문에 숫자 열로 저장합니다 (열마다 형식 코드:
+정수는 uint32 'I' 또는 int64 'q', 소수·None이 있으면 float64 'd'이고 None은 NaN). 읽을 때 meta["derived"]로 되돌립니다.
+"""
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+
+MAGIC = b"HWCACHE\0"
+FORMAT_VERSION = 2
+READ_VERSIONS = (1, 2)  # 1: derived가 헤더 JSON의 meta 안에 있음
+ABSENT = 0xFFFFFFFF  # 해당 행에 없는 필드
+
+
+def _align(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def _u32(values) -> bytes:
+    arr = array("I", values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _typecode(values) -> str:
+    """derived 열 하나의 배열 형식 코드."""
+    if any(v is None or isinstance(v, float) for v in values):
+        return "d"
+    if all(0 <= v < ABSENT for v in values):
+        return "I"
+    return "q"
+
+
+def _numbers(values, typecode: str) -> bytes:
+    try:
+        arr = array(typecode, (math.nan if v is None else v for v in values))
+    except (TypeError, OverflowError) as e:
+        raise ValueError(f"derived 열을 cache.bin에 저장할 수 없습니다: {e}")
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _derived_blobs(derived, categories: list, sid):
+    """meta의 derived → (헤더 항목, [지역 바이트, 카테고리별 열 바이트...]). 행 수가 맞지 않는 카테고리는 빼고 저장
+    (읽은 쪽에서 records.ensure가 다시 계산)."""
+    rows_of = {cat["name"]: cat["rows"] for cat in categories}
+    regions = derived.get("regions") or []
+    info = {"version": derived.get("version"), "regions": len(regions), "categories": []}
+    blobs = [_u32(sid(str(name)) for name in regions)]
+    for name, columns in derived.items():
+        if not isinstance(columns, dict) or name not in rows_of:
+            continue
+        if any(len(values) != rows_of[name] for values in columns.values()):
+            continue
+        fields = [[field, _typecode(values)] for field, values in columns.items()]
+        info["categories"].append({"name": name, "columns": fields})
+        blobs.append(b"".join(_numbers(columns[field], code) for field, code in fields))
+    return info, blobs
+
+
+def dumps(data: dict) -> bytes:
+    """도감 dict → cache.bin 바이트. 행 값이 문자열이 아니면 ValueError (JSON 캐시를 써야 함)."""
+    strings = []
+    string_ids = {}
+    meta = {}
+    categories = []
+    column_blobs = []
+
+    def sid(value: str) -> int:
+        i = string_ids.get(value)
+        if i is None:
+            i = string_ids[value] = len(strings)
+            strings.append(value)
+        return i
+
+    for key, rows in data.items():
+        if not isinstance(rows, list):
+            meta[key] = rows
+            continue
+        fields = []
+        for row in rows:
+            if not isinstance(row, Mapping):
+                raise ValueError(f"{key}: 행이 dict가 아닙니다.")
+            for field in row:
+                if field not in fields:
+                    fields.append(field)
+        columns = []
+        for field in fields:
+            col = []
+            for row in rows:
+                if field not in row:
+                    col.append(ABSENT)
+                    continue
+                value = row[field]
+                if not isinstance(value, str):
+                    raise ValueError(f"{key}.{field}: 문자열이 아닌 값은 cache.bin에 저장할 수 없습니다.")
+                col.append(sid(value))
+            columns.append(col)
+        categories.append({"name": key, "rows": len(rows), "fields": fields})
+        column_blobs.append(_u32(v for col in columns for v in col))
+    derived = meta.pop("derived", None)
+    if isinstance(derived, dict):
+        derived_info, derived_blobs = _derived_blobs(derived, categories, sid)
+    else:
+        derived_info, derived_blobs = None, []
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = [0]
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    offsets_blob = _u32(offsets)
+    strings_blob = b"".join(encoded)
+
+    # 오프셋은 헤더 바로 뒤(4바이트 정렬) 본문 시작 기준
+    pos = 0
+    strings_info = {"count": len(strings), "offsets": pos}
+    pos += len(offsets_blob)
+    strings_info["data"] = pos
+    strings_info["bytes"] = len(strings_blob)
+    pos = _align(pos + len(strings_blob))
+    for cat, blob in zip(categories, column_blobs):
+        cat["offset"] = pos
+        pos = _align(pos + len(blob))
+    blobs = list(column_blobs)
+    offsets_at = [cat["offset"] for cat in categories]
+    if derived_info is not None:
+        # float64 열도 있으므로 derived 구역은 8바이트 정렬
+        for entry, blob in zip([derived_info] + derived_info["categories"], derived_blobs):
+            pos = (pos + 7) & ~7
+            entry["offset"] = pos
+            offsets_at.append(pos)
+            blobs.append(blob)
+            pos += len(blob)
+    header = {
+        "format": FORMAT_VERSION,
+        "data_hash": meta.get("data_hash", ""),
+        "data_version": meta.get("data_version", ""),
+        "meta": meta,
+        "categories": categories,
+        "strings": strings_info,
+    }
+    if derived_info is not None:
+        header["derived"] = derived_info
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    out = bytearray(MAGIC)
+    out += struct.pack("<I", len(header_bytes)) + header_bytes
+    body = _align(len(out))
+    out += b"\0" * (body - len(out))
+    out += offsets_blob + strings_blob
+    for offset, blob in zip(offsets_at, blobs):
+        out += b"\0" * (body + offset - len(out))
+        out += blob
+    return bytes(out)
+
+
+def dump(data: dict, path: Path) -> None:
+    """cache.bin 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 꺼져도 기존 파일은 유지)."""
+    raw = dumps(data)
+    tmp = Path(str(path) + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(raw)
+    os.replace(tmp, path)
+
+
+def _read_header(buf) -> dict:
+    if bytes(buf[:len(MAGIC)]) != MAGIC:
+        raise ValueError("cache.bin 형식이 아닙니다.")
+    (size,) = struct.unpack_from("<I", buf, len(MAGIC))
+    start = len(MAGIC) + 4
+    header = json.loads(bytes(buf[start:start + size]).decode("utf-8"))
+    if header.get("format") not in READ_VERSIONS:
+        raise ValueError(f"지원하지 않는 cache.bin 버전: {header.get('format')}")
+    header["body"] = _align(start + size)  # 본문 시작 위치 (오프셋 기준)
+    return header
+
+
+def _u32_view(buf, offset: int, count: int):
+    view = memoryview(buf)[offset:offset + 4 * count].cast("I")
+    if sys.byteorder != "little":
+        arr = array("I", view)
+        view.release()
+        arr.byteswap()
+        return arr
+    return view
+
+
+def read_header(path: Path) -> dict:
+    """헤더만 읽기 (data_hash, data_version 확인용)."""
+    with open(path, "rb") as f:
+        head = f.read(len(MAGIC) + 4)
+        if len(head) < len(MAGIC) + 4:
+            raise ValueError("cache.bin 형식이 아닙니다.")
+        (size,) = struct.unpack_from("<I", head, len(MAGIC))
+        return _read_header(head + f.read(size))
+
+
+def _numbers_at(buf, offset: int, typecode: str, count: int) -> list:
+    arr = array(typecode)
+    arr.frombytes(bytes(buf[offset:offset + arr.itemsize * count]))
+    if sys.byteorder != "little":
+        arr.byteswap()
+    if typecode != "d":
+        return arr.tolist()
+    # records.derive와 같이: NaN → None, 정수 값은 int
+    return [None if v != v else (int(v) if v.is_integer() else v) for v in arr.tolist()]
+
+
+def _read_derived(buf, body: int, header: dict, strings: list) -> dict:
+    """본문의 derived 구역 → { version, regions: [...], 카테고리: { 열: [...] } } (records.derive와 같은 모양)."""
+    info = header["derived"]
+    rows_of = {cat["name"]: cat["rows"] for cat in header["categories"]}
+    region_ids = _numbers_at(buf, body + info["offset"], "I", info["regions"])
+    derived = {"version": info.get("version"), "regions": [strings[i] for i in region_ids]}
+    for cat in info["categories"]:
+        rows = rows_of[cat["name"]]
+        offset = body + cat["offset"]
+        columns = {}
+        for field, code in cat["columns"]:
+            columns[field] = _numbers_at(buf, offset, code, rows)
+            offset += array(code).itemsize * rows
+        derived[cat["name"]] = columns
+    return derived
+
+
+def load_columns(path: Path):
+    """cache.bin → (헤더, 문자열 목록, { 카테고리: (필드 목록, [열별 문자열 번호 array('I')]) })."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header = _read_header(mm)
+        body = header["body"]
+        info = header["strings"]
+        count = info["count"]
+        offsets = _u32_view(mm, body + info["offsets"], count + 1)
+        data_start = body + info["data"]
+        blob = bytes(mm[data_start:data_start + info["bytes"]])
+        strings = [sys.intern(blob[offsets[i]:offsets[i + 1]].decode("utf-8")) for i in range(count)]
+        if isinstance(offsets, memoryview):
+            offsets.release()
+        categories = {}
+        for cat in header["categories"]:
+            rows = cat["rows"]
+            fields = cat["fields"]
+            view = _u32_view(mm, body + cat["offset"], rows * len(fields))
+            columns = []
+            for i in range(len(fields)):
+                column = array("I")
+                column.frombytes(view[i * rows:(i + 1) * rows].tobytes())
+                columns.append(column)
+            if isinstance(view, memoryview):
+                view.release()
+            categories[cat["name"]] = (fields, columns)
+        if "derived" in header:
+            header["meta"] = {**(header.get("meta") or {}), "derived": _read_derived(mm, body, header, strings)}
+    return header, strings, categories
+
+
+def load(path: Path) -> dict:
+    """cache.bin → 도감 dict (cache.json을 읽은 것과 같은 구조)."""
+    header, strings, categories = load_columns(path)
+    data = {}
+    for name, (fields, columns) in categories.items():
+        rows = []
+        for i in range(len(columns[0]) if columns else 0):
+            row = {}
+            for field, col in zip(fields, columns):
+                sid = col[i]
+                if sid != ABSENT:
+                    row[field] = strings[sid]
+            rows.append(row)
+        data[name] = rows
+    data.update(header.get("meta") or {})
+    return data
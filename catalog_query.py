@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+도감 필터·정렬 색인 (Api.query 용).
+카테고리마다 한 번 색인을 만들고, 검색어·지역·레벨·날씨·수집 완료 숨김 조건은 비트셋(int) AND로 계산합니다.
+
+  - 지역: 지역 값 → 해당 행 비트셋
+  - 레벨: 레벨 묶음(숫자면 같은 숫자끼리, 아니면 같은 문자열끼리) → 비트셋 (index.html levelsMatchFilter와 같은 기준)
+  - 날씨: 행마다 비/해/무지개/맑음 비트마스크, 날씨별 비트셋
+  - 정렬: excel(원래 순서), level-asc/desc, price-asc/desc 순열을 미리 계산. 정렬마다 그 순서의 비트셋을 따로 두어
+    결과를 다시 정렬하지 않고 비트 순서대로 꺼냄
+  - 검색어: search_index(bigram·초성 색인). 검색 중에는 일치 → 앞부분 일치 → 중간 일치 순.
+    정렬마다 검색어별 결과 비트셋(일치 순위별로 나눔)을 캐시해, 같은 검색어로 필터만 바꾸면 비트셋 AND만 함
+
+행 번호는 카테고리 안에서 [기본 데이터 행 ..., 사용자 추가 생물 ...] 순서이고, 결과 id는 명칭입니다.
+"""
+
+from itertools import compress
+
+import records
+import search_index
+from records import WEATHERS, parse_float
+
+SORTS = ("excel", "level-asc", "level-desc", "price-asc", "price-desc")
+NO_REGION_CATEGORIES = ("요리",)  # 지역·날씨 필터가 없는 카테고리
+SPARSE_RATIO = 64  # 켜진 비트가 전체의 1/64보다 적으면 select가 켜진 비트만 찾아감
+
+_TO_BIN = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_BIN = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def bits_from_flags(flags: bytes) -> int:
+    """행별 0/1 바이트 → 비트셋 (i번째 비트 = i번째 행)."""
+    if not flags:
+        return 0
+    return int(flags.translate(_TO_BIN)[::-1], 2)
+
+
+def bits_from_positions(positions, size: int) -> int:
+    """켜진 위치 목록 → 비트셋 (size/8 바이트만 만들어 켜진 위치 수만큼만 돎)."""
+    buf = bytearray((size + 7) >> 3)
+    for p in positions:
+        buf[p >> 3] |= 1 << (p & 7)
+    return int.from_bytes(buf, "little")
+
+
+def select(mask: int, seq: list) -> list:
+    """비트셋에서 켜진 위치의 seq 값들 (순서 유지)."""
+    if mask <= 0:
+        return []
+    text = bin(mask)[:1:-1]
+    if mask.bit_count() * SPARSE_RATIO < len(text):
+        # 드문 결과: 켜진 비트만 str.find로 건너뛰며 찾음 (전체를 훑는 compress보다 빠름)
+        out = []
+        i = text.find("1")
+        while i != -1:
+            out.append(seq[i])
+            i = text.find("1", i + 1)
+        return out
+    return list(compress(seq, text.encode("ascii").translate(_FROM_BIN)))
+
+
+def _level_key(level, tag: int, value):
+    if tag == records.LEVEL_NONE:
+        return None
+    return ("n", level) if level is not None else ("s", records.level_label(value))
+
+
+def level_key(value):
+    """레벨 필터 묶음 키: 숫자면 ("n", 값), 아니면 ("s", NFC 정규화 문자열). 빈 값은 None."""
+    return _level_key(*records.parse_level(value), value)
+
+
+def _level_option_order(value: str):
+    # updateFilters 레벨 목록 순서: 숫자 오름차순, 그 뒤 문자열
+    n = parse_float(value)
+    return (0, n, "") if n is not None else (1, 0.0, value)
+
+
+class _OrderedSpace:
+    """한 정렬 순서로 늘어놓은 행들의 비트셋 모음."""
+
+    def __init__(self, perm: list, cat: "CategoryIndex"):
+        self.perm = perm
+        self.rank = [0] * len(perm)
+        for r, p in enumerate(perm):
+            self.rank[p] = r
+        self.names = [cat.names[p] for p in perm]
+        self.all = self._bits(p for p in perm if p not in cat.removed)
+        self.locations = {}
+        self.levels = {}
+        self.weathers = {}
+        for value, positions in cat.location_rows.items():
+            self.locations[value] = self._bits(positions) & self.all
+        for key, positions in cat.level_rows.items():
+            self.levels[key] = self._bits(positions) & self.all
+        for _name, _needle, bit in WEATHERS:
+            self.weathers[bit] = self._bits([p for p, m in enumerate(cat.weather) if m & bit]) & self.all
+        self.completed = 0
+        self.completed_revision = None
+        self._searches = {}  # 정규화된 검색어 → (검색 결과 비트셋, [일치 순위별 비트셋 ...(순위 순)])
+
+    def _bits(self, positions) -> int:
+        rank = self.rank
+        return bits_from_positions((rank[p] for p in positions), len(self.perm))
+
+    def search(self, query: str, hits: dict):
+        """검색 결과의 (비트셋, 일치 순위(단계, 필드)별 비트셋 목록). 검색어마다 한 번만 계산
+        (SearchIndex 결과 캐시와 같은 크기로 보관). 순위별 비트셋을 차례로 꺼내면 순위 → 정렬 순서가 됨."""
+        cached = self._searches.pop(query, None)
+        if cached is None:
+            groups = {}
+            for p, rank in hits.items():
+                groups.setdefault(rank, []).append(p)
+            cached = (self._bits(hits), [self._bits(groups[rank]) for rank in sorted(groups)])
+            if len(self._searches) >= search_index.CACHE_SIZE:
+                del self._searches[next(iter(self._searches))]
+        self._searches[query] = cached
+        return cached
+
+
+class CategoryIndex:
+    """카테고리 하나의 색인. 행은 add로 뒤에 붙이고 remove로 빼며(번호 유지), 정렬별 비트셋은 다음 조회 때 다시 만듦."""
+
+    def __init__(self, category: str, items: list, typed: list = None, regions: records.Regions = None):
+        self.category = category
+        self.regions = regions or records.Regions()
+        self.items = []
+        self.records = []  # 행별 records.Record (레벨·가격·날씨·지역을 다시 해석하지 않음)
+        self.names = []
+        self.location_rows = {}
+        self.level_rows = {}
+        self.weather = []
+        self.removed = set()
+        self._search = None  # 처음 검색할 때(또는 미리 데우기에서) 만듦
+        self.user_rows = []  # 사용자 추가 생물 행 번호 (userCreatures 순서)
+        self._level_values = None
+        self._spaces = {}
+        for i, item in enumerate(items):
+            self.add(item, record=typed[i] if typed is not None else None)
+
+    def add(self, item: dict, user: bool = False, record: records.Record = None) -> int:
+        pos = len(self.items)
+        has_regions = self.category not in NO_REGION_CATEGORIES
+        record = record or records.from_item(item, self.regions)
+        self.items.append(item)
+        self.records.append(record)
+        self.names.append(item.get("명칭", ""))
+        if has_regions and record.region:
+            self.location_rows.setdefault(self.regions.names[record.region], []).append(pos)
+        key = _level_key(record.level, record.level_tag, item.get("레벨"))
+        if key is not None:
+            self.level_rows.setdefault(key, []).append(pos)
+        self.weather.append(record.weather if has_regions else 0)
+        if self._search is not None:
+            self._search.add(item)
+        if user:
+            self.user_rows.append(pos)
+        self._level_values = None
+        self._spaces = {}
+        return pos
+
+    def remove(self, pos: int) -> None:
+        self.removed.add(pos)
+        if self._search is not None:
+            self._search.remove(pos)
+        if pos in self.user_rows:
+            self.user_rows.remove(pos)
+        self._level_values = None
+        self._spaces = {}
+
+    def sync_user_creatures(self, items: list) -> None:
+        """사용자 추가 생물 목록에 맞춤: 없어진 행은 빼고 새 행은 뒤에 붙임 (기본 데이터 행은 그대로)."""
+        current = [(self.items[p], p) for p in self.user_rows]
+        if [item for item, _p in current] == list(items):
+            return
+        wanted = list(items)
+        kept = []
+        for item, p in current:
+            if item in wanted[len(kept):len(kept) + 1]:
+                kept.append(p)
+            else:
+                self.remove(p)
+        for item in wanted[len(kept):]:
+            self.add(item, user=True)
+
+    @property
+    def search(self) -> search_index.SearchIndex:
+        if self._search is None:
+            index = search_index.SearchIndex()
+            for item in self.items:
+                index.add(item)
+            for pos in self.removed:
+                index.remove(pos)
+            self._search = index
+        return self._search
+
+    def level_values(self) -> dict:
+        """레벨 원래 값 → 묶음 키 (드롭다운 목록 순서, 빠진 행 제외)."""
+        if self._level_values is None:
+            values = {}
+            for pos, item in enumerate(self.items):
+                raw = item.get("레벨")
+                if pos in self.removed or not raw:
+                    continue
+                record = self.records[pos]
+                key = _level_key(record.level, record.level_tag, raw)
+                if key is not None:
+                    values.setdefault(raw, key)
+            ordered = sorted(values, key=lambda v: _level_option_order(str(v)))
+            self._level_values = {v: values[v] for v in ordered}
+        return self._level_values
+
+    def space(self, sort: str) -> _OrderedSpace:
+        if sort not in SORTS:
+            sort = "excel"
+        space = self._spaces.get(sort)
+        if space is None:
+            n = len(self.items)
+            if sort == "excel":
+                perm = list(range(n))
+            else:
+                sign = -1 if sort.endswith("desc") else 1
+                if sort.startswith("level"):
+                    keys = [(sign * r.sort_level, self.names[i]) for i, r in enumerate(self.records)]
+                else:
+                    keys = [(sign * r.price, self.names[i]) for i, r in enumerate(self.records)]
+                perm = sorted(range(n), key=keys.__getitem__)
+            space = self._spaces[sort] = _OrderedSpace(perm, self)
+        return space
+
+    def query(self, search="", location="", level="", weather="", hide_completed=False, sort="excel",
+              stars=None, stars_revision=None) -> dict:
+        space = self.space(sort)
+        has_regions = self.category not in NO_REGION_CATEGORIES
+        query = search_index.normalize(search)
+        hits = self.search.search(query) if query else None
+
+        masks = {}
+        if hits is not None:
+            masks["search"], tiers = space.search(query, hits)
+        if level:
+            masks["level"] = space.levels.get(level_key(level), 0)
+        if has_regions and location:
+            masks["location"] = space.locations.get(location, 0)
+        if has_regions and weather:
+            bit = next((b for name, _needle, b in WEATHERS if name == weather), None)
+            masks["weather"] = space.weathers.get(bit, 0) if bit else space.all
+        if hide_completed:
+            masks["completed"] = space.all & ~self._completed(space, stars or {}, stars_revision)
+
+        def combined(skip=None) -> int:
+            mask = space.all
+            for name, m in masks.items():
+                if name != skip:
+                    mask &= m
+            return mask
+
+        mask = combined()
+        if hits:
+            # 검색 중이면 일치 → 앞부분 → 중간 순, 같은 순위 안에서는 정렬 순서 유지
+            ids = []
+            for tier in tiers:
+                if mask & tier:
+                    ids.extend(select(mask & tier, space.names))
+        elif mask == space.all and not self.removed:
+            ids = list(space.names)  # 조건 없음: 전체 목록
+        else:
+            ids = select(mask, space.names)
+        facets = {"level": self._level_facets(space, combined("level"))}
+        if has_regions:
+            base = combined("location")
+            facets["location"] = [
+                [v, (base & m).bit_count()] for v, m in sorted(space.locations.items()) if m
+            ]
+            base = combined("weather")
+            facets["weather"] = [
+                [name, (base & space.weathers[bit]).bit_count()]
+                for name, _needle, bit in sorted(WEATHERS)
+                if space.weathers[bit]
+            ]
+        else:
+            facets["location"] = []
+            facets["weather"] = []
+        return {"ids": ids, "total": len(ids), "facets": facets}
+
+    def _level_facets(self, space: _OrderedSpace, base: int) -> list:
+        levels = space.levels
+        return [[v, (base & levels[key]).bit_count()] for v, key in self.level_values().items()]
+
+    def _completed(self, space: _OrderedSpace, stars: dict, revision) -> int:
+        if revision is None or space.completed_revision != revision:
+            prefix = self.category + "_"
+            flags = bytes(1 if _star_count(stars.get(prefix + name)) > 0 else 0 for name in space.names)
+            space.completed = bits_from_flags(flags)
+            space.completed_revision = revision
+        return space.completed
+
+
+def _star_count(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class CatalogIndex:
+    """도감 전체(기본 데이터 + 사용자 추가 생물) 색인. 카테고리별 색인은 처음 조회할 때 만듦."""
+
+    def __init__(self, base: dict, user_creatures: dict):
+        self.base = base
+        self.user_creatures = user_creatures
+        self.regions = records.regions_of(base or {})  # 기본 데이터 derived의 지역 번호 + 사용자 생물 지역
+        self._categories = {}
+
+    def category(self, category: str) -> CategoryIndex:
+        index = self._categories.get(category)
+        if index is None:
+            typed = records.load(self.base or {}, category, self.regions)
+            index = self._categories[category] = CategoryIndex(
+                category, list((self.base or {}).get(category) or []), typed, self.regions)
+            index.sync_user_creatures(list((self.user_creatures or {}).get(category) or []))
+        return index
+
+    def sync_user_creatures(self, user_creatures: dict) -> None:
+        """사용자 추가 생물이 바뀌었을 때: 이미 만든 카테고리 색인에 추가/삭제만 반영."""
+        self.user_creatures = user_creatures
+        for category, index in self._categories.items():
+            index.sync_user_creatures(list((user_creatures or {}).get(category) or []))
+
+    def query(self, category: str, **options) -> dict:
+        return self.category(category).query(**options)
+
+    def warm(self) -> None:
+        """모든 카테고리의 색인·검색 색인을 미리 만듦 (백그라운드에서 호출)."""
+        for category in self.base or {}:
+            if isinstance(self.base[category], list):
+                self.category(category).search
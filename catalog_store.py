@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+메모리 안의 도감 데이터 (_cached_base): 카테고리별 열(column) 배열 + 공용 문자열 표.
+행마다 dict를 두면 명칭·지역·세부지역·이미지·비고 키와 같은 지역·날씨 문자열이 행 수만큼 반복되므로,
+값은 문자열 표에 한 번만 두고 각 열은 문자열 번호 배열(array 'I')로 보관합니다 (cache.bin과 같은 구조).
+
+  - compact(base): 도감 dict → 같은 모양의 dict. 카테고리 값은 RowView 목록 (읽기 전용, dict처럼 get/[]/items)
+  - from_columns(...): cache.bin 열을 행 dict로 풀지 않고 그대로 사용
+  - plain(value): RowView를 일반 dict로 바꾼 값 (pywebview로 페이지에 보내기 전, JSON 저장 전)
+
+카테고리를 가려내는 기존 코드(isinstance(값, list))와 행을 dict처럼 읽는 코드(catalog_query, search_index, data_delta,
+records)는 그대로 동작합니다.
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping
+
+ABSENT = 0xFFFFFFFF  # 해당 행에 없는 필드
+
+
+class StringPool:
+    """문자열 ↔ 번호 (같은 문자열은 하나만 보관)."""
+
+    __slots__ = ("strings", "ids")
+
+    def __init__(self, strings=None):
+        self.strings = []
+        self.ids = {}
+        for s in strings or ():
+            self.id(s)
+
+    def id(self, value: str) -> int:
+        i = self.ids.get(value)
+        if i is None:
+            i = self.ids[value] = len(self.strings)
+            self.strings.append(sys.intern(value))
+        return i
+
+
+class CategoryColumns:
+    """카테고리 하나: 필드 목록 + 필드별 문자열 번호 배열."""
+
+    __slots__ = ("fields", "positions", "columns", "strings", "rows")
+
+    def __init__(self, fields: list, columns: list, strings: list):
+        self.fields = list(fields)
+        self.positions = {field: i for i, field in enumerate(self.fields)}
+        self.columns = [c if isinstance(c, array) else array("I", c) for c in columns]
+        self.strings = strings
+        self.rows = len(self.columns[0]) if self.columns else 0
+
+    def value(self, row: int, field: str):
+        """값 또는 ABSENT가 아니면 문자열, 없으면 KeyError."""
+        sid = self.columns[self.positions[field]][row]
+        if sid == ABSENT:
+            raise KeyError(field)
+        return self.strings[sid]
+
+    def views(self) -> list:
+        return [RowView(self, i) for i in range(self.rows)]
+
+
+class RowView(Mapping):
+    """열 배열의 한 행을 dict처럼 읽는 보기 (읽기 전용)."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: CategoryColumns, row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, field):
+        try:
+            return self._table.value(self._row, field)
+        except KeyError:
+            raise KeyError(field) from None
+
+    def __iter__(self):
+        row = self._row
+        table = self._table
+        for field, column in zip(table.fields, table.columns):
+            if column[row] != ABSENT:
+                yield field
+
+    def __len__(self) -> int:
+        row = self._row
+        return sum(1 for column in self._table.columns if column[row] != ABSENT)
+
+    def get(self, field, default=None):
+        table = self._table
+        i = table.positions.get(field)
+        if i is None:
+            return default
+        sid = table.columns[i][self._row]
+        return default if sid == ABSENT else table.strings[sid]
+
+    def to_dict(self) -> dict:
+        table = self._table
+        row = self._row
+        strings = table.strings
+        return {f: strings[c[row]] for f, c in zip(table.fields, table.columns) if c[row] != ABSENT}
+
+    def __repr__(self) -> str:
+        return f"RowView({self.to_dict()!r})"
+
+
+def is_compact(base) -> bool:
+    """compact/from_columns로 만든 도감 데이터인지 (행이 RowView)."""
+    if not isinstance(base, dict):
+        return False
+    return any(isinstance(rows, list) and rows and isinstance(rows[0], RowView) for rows in base.values())
+
+
+def compact(base: dict) -> dict:
+    """도감 dict → 카테고리 값이 RowView 목록인 dict (나머지 값은 그대로). 문자열이 아닌 값이 있으면 base 그대로."""
+    if not isinstance(base, dict) or is_compact(base):
+        return base
+    pool = StringPool()
+    out = {}
+    for key, rows in base.items():
+        if not isinstance(rows, list):
+            out[key] = rows
+            continue
+        fields = []
+        seen = set()
+        for row in rows:
+            if not isinstance(row, Mapping):
+                return base
+            for field in row:
+                if field not in seen:
+                    seen.add(field)
+                    fields.append(field)
+        columns = []
+        for field in fields:
+            column = array("I")
+            for row in rows:
+                value = row.get(field)
+                if value is None and field not in row:
+                    column.append(ABSENT)
+                elif isinstance(value, str):
+                    column.append(pool.id(value))
+                else:
+                    return base
+            columns.append(column)
+        out[key] = CategoryColumns(fields, columns, pool.strings).views()
+    return out
+
+
+def from_columns(strings: list, categories: dict, meta: dict) -> dict:
+    """cache_store.load_columns 결과 → compact와 같은 모양의 dict."""
+    out = {}
+    for name, (fields, columns) in categories.items():
+        out[name] = CategoryColumns(fields, columns, strings).views()
+    out.update(meta or {})
+    return out
+
+
+def plain(value):
+    """RowView를 일반 dict로 바꾼 값 (dict·list 안쪽까지). RowView가 없는 list·그 밖의 값은 같은 객체 그대로."""
+    if isinstance(value, RowView):
+        return value.to_dict()
+    if isinstance(value, list):
+        if any(isinstance(v, (RowView, list, dict)) for v in value):
+            return [plain(v) for v in value]
+        return value
+    if isinstance(value, dict):
+        return {k: plain(v) for k, v in value.items()}
+    return value
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+메모리 안 도감 데이터(catalog_store) 확인: heartowiki.xlsx를 행 dict로 읽은 결과와 열 배열 경로가 같은지 봅니다.
+
+  1) compact: plain(compact(행 dict)) == 행 dict, 행마다 RowView의 get/[]/len/순회가 dict와 같은지
+  2) cache.bin: 저장한 파일을 load_columns → from_columns(앱이 읽는 경로)로 읽어 plain한 값 == 행 dict (derived 포함)
+  3) cache.bin 1판 → 2판: derived를 헤더 JSON에 둔 1판 파일을 읽어 같은 값인지, 그것을 다시 저장하면 2판이 되고
+     읽은 값도 그대로인지. derived가 맞지 않는 1판(행 수가 다름)은 records.ensure가 다시 계산하는지
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_catalog_store.py [xlsx경로]
+"""
+
+import argparse
+import json
+import struct
+import sys
+import tempfile
+from pathlib import Path
+
+import cache_store
+import catalog_store
+import records
+import xlsx_fast
+from main import _records_from_sheets
+
+ROOT = Path(__file__).resolve().parent
+
+
+def _dumps_v1(data: dict) -> bytes:
+    """1판 cache.bin: 본문은 2판과 같은 문자열·열 배열이고, derived는 헤더 JSON의 meta 안에 둠."""
+    rows_only = {k: v for k, v in data.items() if k != "derived"}
+    raw = cache_store.dumps(rows_only)
+    start = len(cache_store.MAGIC) + 4
+    (size,) = struct.unpack_from("<I", raw, len(cache_store.MAGIC))
+    header = json.loads(raw[start:start + size].decode("utf-8"))
+    body = raw[cache_store._align(start + size):]
+    header["format"] = 1
+    header["meta"]["derived"] = data["derived"]
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    out = bytearray(cache_store.MAGIC) + struct.pack("<I", len(header_bytes)) + header_bytes
+    out += b"\0" * (cache_store._align(len(out)) - len(out))
+    return bytes(out) + body
+
+
+def _read(path: Path) -> dict:
+    """main._read_cache_file의 cache.bin 경로와 같게 읽기."""
+    header, strings, categories = cache_store.load_columns(path)
+    return records.ensure(catalog_store.from_columns(strings, categories, header.get("meta")))
+
+
+def _first_difference(a: dict, b: dict) -> str:
+    for key in sorted(set(a) | set(b), key=str):
+        if a.get(key) == b.get(key):
+            continue
+        x, y = a.get(key), b.get(key)
+        if isinstance(x, list) and isinstance(y, list):
+            for i, (p, q) in enumerate(zip(x, y)):
+                if p != q:
+                    return f"{key}[{i}]: {p!r} / {q!r}"
+            return f"{key}: 개수 {len(x)} / {len(y)}"
+        return f"{key}: {str(x)[:80]} / {str(y)[:80]}"
+    return ""
+
+
+def _compare(label: str, got: dict, expected: dict) -> bool:
+    same = got == expected
+    print(f"{label}: {'같음' if same else '다름'}")
+    if not same:
+        print(f"  → 실패: {_first_difference(got, expected)}")
+    return same
+
+
+def _row_views_match(base: dict, compacted: dict) -> bool:
+    """RowView를 dict처럼 읽은 값이 행 dict와 같은지 (없는 필드는 get 기본값·KeyError)."""
+    for key, rows in base.items():
+        if not isinstance(rows, list):
+            continue
+        fields = {field for row in rows for field in row} | {"없는 필드"}
+        for row, view in zip(rows, compacted[key]):
+            if dict(view) != row or len(view) != len(row) or list(view) != list(row):
+                return False
+            for field in fields:
+                if view.get(field, "기본값") != row.get(field, "기본값") or (field in view) != (field in row):
+                    return False
+                if field in row and view[field] != row[field]:
+                    return False
+    return True
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("xlsx", nargs="?", default=str(ROOT / "heartowiki.xlsx"))
+    args = parser.parse_args(argv)
+    with xlsx_fast.FastWorkbook(Path(args.xlsx).read_bytes()) as wb:
+        base = _records_from_sheets(wb.sheetnames, wb.iter_rows)
+    base["data_hash"] = "0" * 64
+    counts = ", ".join(f"{k} {len(v)}행" for k, v in base.items() if isinstance(v, list))
+    print(f"도감 데이터: {counts}")
+    ok = True
+
+    compacted = catalog_store.compact(base)
+    ok &= catalog_store.is_compact(compacted)
+    ok &= _compare("compact → plain", catalog_store.plain(compacted), base)
+    views_ok = _row_views_match(base, compacted)
+    print(f"RowView를 dict처럼 읽기: {'같음' if views_ok else '다름'}")
+    ok &= views_ok
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cache.bin"
+        cache_store.dump(compacted, path)
+        ok &= _compare("cache.bin 2판 (열 배열 그대로)", catalog_store.plain(_read(path)), base)
+        ok &= _compare("cache.bin 2판 (행 dict로 풀기)", cache_store.load(path), base)
+
+        path.write_bytes(_dumps_v1(base))
+        version = cache_store.read_header(path)["format"]
+        from_v1 = _read(path)
+        ok &= _compare(f"cache.bin {version}판 읽기", catalog_store.plain(from_v1), base) and version == 1
+        cache_store.dump(from_v1, path)
+        version = cache_store.read_header(path)["format"]
+        ok &= version == cache_store.FORMAT_VERSION
+        ok &= _compare(f"1판에서 읽어 다시 저장한 {version}판", catalog_store.plain(_read(path)), base)
+
+        stale = dict(base, derived={**base["derived"], "어류": {c: v[:-1] for c, v in base["derived"]["어류"].items()}})
+        path.write_bytes(_dumps_v1(stale))
+        ok &= _compare("행 수가 맞지 않는 1판 derived (다시 계산)", catalog_store.plain(_read(path)), base)
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+수집 정보 저널(collection_journal) 점검: 임시 폴더에서
+  1) 저널 다시 적용: 스냅샷 없이 기록만 남기고 끈 뒤 다시 열면 같은 상태인지
+  2) 잘린 마지막 줄: 저널 끝에 쓰다 만 줄을 붙여도 그 앞까지만 적용하고, 파일도 그 앞까지 잘리는지
+  3) 합치기와 기록이 겹칠 때: 백그라운드 합치기가 도는 동안 여러 스레드가 별을 기록하고 close()까지 해도
+     다시 열었을 때 기록이 하나도 빠지지 않는지 (임시 파일도 남지 않는지)
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_collection_journal.py [--threads 4] [--writes 2000]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import collection_journal
+
+
+def _open(folder: Path, compact_every: int = collection_journal.COMPACT_EVERY):
+    return collection_journal.CollectionJournal(folder / "collection.json", folder / "collection.journal", compact_every)
+
+
+def _reopen(folder: Path) -> dict:
+    """다시 열어 읽은 상태 (다시 적용한 기록의 백그라운드 합치기가 끝나도록 닫음)."""
+    j = _open(folder)
+    try:
+        return j.state()
+    finally:
+        j.close()
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--writes", type=int, default=2000, help="스레드마다 기록할 별 수")
+    args = parser.parse_args(argv)
+    ok = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        j = _open(folder, compact_every=10 ** 9)
+        for i in range(50):
+            j.set_star(f"어류_붕어{i}", i % 6)
+        j.add_creature("어류", {"명칭": "새 물고기"})
+        j.set_star("어류_붕어0", None)
+        expected = j.state()
+        j._file.close()  # close()를 부르지 않고 종료 (스냅샷 없음)
+        replayed = _reopen(folder)
+        same = replayed == expected
+        print(f"다시 적용: 별 {len(replayed['stars'])}개, 사용자 생물 {len(replayed['userCreatures']['어류'])}개 → "
+              f"{'같음' if same else '다름'}")
+        if not same:
+            ok = False
+            print("  → 실패: 저널만으로 같은 상태가 되어야 함")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        j = _open(folder, compact_every=10 ** 9)
+        for i in range(10):
+            j.set_star(f"곤충_나비{i}", 3)
+        j._file.close()
+        journal = folder / "collection.journal"
+        good = journal.stat().st_size
+        with open(journal, "ab") as f:
+            f.write('{"seq": 11, "op": "star", "key": "곤충_잘림", "n'.encode("utf-8"))
+        j = _open(folder)
+        state = j.state()
+        size = journal.stat().st_size  # 닫으면 합치기로 저널이 비므로 그 전에 잼
+        j.close()
+        torn_ok = len(state["stars"]) == 10 and "곤충_잘림" not in state["stars"]
+        print(f"잘린 마지막 줄: 별 {len(state['stars'])}개, 저널 {size}/{good} 바이트")
+        if not torn_ok or size != good:
+            ok = False
+            print("  → 실패: 잘린 줄은 버리고 온전한 기록만 적용해야 함")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        j = _open(folder, compact_every=64)  # 자주 백그라운드 합치기
+        expected = {}
+
+        def writer(t: int):
+            for i in range(args.writes):
+                j.set_star(f"조류_참새{t}_{i}", (i % 5) + 1)
+
+        threads = [threading.Thread(target=writer, args=(t,)) for t in range(args.threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for t in range(args.threads):
+            for i in range(args.writes):
+                expected[f"조류_참새{t}_{i}"] = (i % 5) + 1
+        j.compact_in_background()
+        j.close()  # 백그라운드 합치기와 겹치는 종료
+        state = _reopen(folder)
+        missing = [k for k in expected if state["stars"].get(k) != expected[k]]
+        leftovers = sorted(p.name for p in folder.glob("*.tmp"))
+        print(f"합치기와 기록 동시: 기대 {len(expected)}개, 다시 열었을 때 {len(state['stars'])}개, 빠짐 {len(missing)}개, "
+              f"임시 파일 {leftovers or '없음'}")
+        if missing or leftovers:
+            ok = False
+            print("  → 실패: 합치기가 겹쳐도 기록이 빠지면 안 됨")
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
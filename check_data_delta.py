@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+도감 데이터 차이(data_delta) 왕복 확인: heartowiki.xlsx를 읽은 도감 데이터를 고쳐 새 버전을 만들고
+apply(old, diff(old, new)) == new 인지 봅니다. 페이지로 보낼 때처럼 JSON을 거친 차이로도 적용하고,
+메모리 안 형식(catalog_store.compact)끼리 비교한 차이도 plain으로 바꿔 적용합니다.
+
+  - 행 추가 / 삭제 / 필드 변경 (값 바꾸기, 필드 빼기), 순서 바꾸기
+  - 같은 명칭이 두 번 있는 카테고리 (replace로 보내야 함)
+  - 지역 번호가 바뀌는 경우 (앞 행에 새 지역 → derived.regions와 뒤 행의 region 열 번호가 모두 밀림)
+  - meta만 바뀐 경우 (data_version), 바뀐 것이 없는 경우 (빈 차이)
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_data_delta.py [xlsx경로]
+"""
+
+import argparse
+import copy
+import json
+import sys
+from pathlib import Path
+
+import catalog_store
+import data_delta
+import records
+import xlsx_fast
+from main import _records_from_sheets
+
+ROOT = Path(__file__).resolve().parent
+
+
+def _first_region_row(rows: list) -> int:
+    return next(i for i, row in enumerate(rows) if row.get("지역"))
+
+
+def _cases(base: dict) -> list:
+    """[(이름, 새 버전을 만드는 함수(base 복사본 → 고침), 차이에 있어야 할 키)]"""
+    fish = "어류"
+
+    def add(b):
+        b[fish].append({**b[fish][0], "명칭": "새 물고기", "가격": "12345"})
+
+    def remove(b):
+        del b[fish][3]
+        del b["곤충"][-1]
+
+    def change(b):
+        b[fish][5]["가격"] = "999999"
+        b[fish][6].pop("비고", None)
+        b[fish][6]["날씨영향"] = "비"
+
+    def reorder(b):
+        b[fish].reverse()
+
+    def duplicate(b):
+        b["조류"].append(dict(b["조류"][0]))
+
+    def regions(b):
+        i = _first_region_row(b[fish])
+        b[fish][i]["지역"] = "처음 보는 지역"
+
+    def insert_region(b):
+        b[fish].insert(0, {**b[fish][0], "명칭": "맨 앞 물고기", "지역": "새 지역"})
+
+    def meta(b):
+        b["data_version"] = "검사용"
+
+    def mixed(b):
+        add(b)
+        remove(b)
+        change(b)
+        b["요리"].reverse()
+        meta(b)
+
+    return [
+        ("행 추가", add, "categories"),
+        ("행 삭제", remove, "categories"),
+        ("필드 변경·삭제", change, "categories"),
+        ("순서 바꾸기", reorder, "categories"),
+        ("같은 명칭 (replace)", duplicate, "categories"),
+        ("지역 바뀜", regions, "derived"),
+        ("새 지역 행을 맨 앞에", insert_region, "derived"),
+        ("meta만", meta, "meta"),
+        ("섞어서", mixed, "categories"),
+        ("바뀐 것 없음", lambda b: None, None),
+    ]
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("xlsx", nargs="?", default=str(ROOT / "heartowiki.xlsx"))
+    args = parser.parse_args(argv)
+    with xlsx_fast.FastWorkbook(Path(args.xlsx).read_bytes()) as wb:
+        old = _records_from_sheets(wb.sheetnames, wb.iter_rows)
+    ok = True
+
+    for name, mutate, key in _cases(old):
+        new = copy.deepcopy(old)
+        mutate(new)
+        records.attach(new)
+        delta = data_delta.diff(old, new)
+        sent = json.loads(json.dumps(delta, ensure_ascii=False))  # 페이지로 보내는 모양
+        compact_delta = catalog_store.plain(data_delta.diff(catalog_store.compact(old), catalog_store.compact(new)))
+        results = {
+            "dict": data_delta.apply(old, delta) == new,
+            "JSON": data_delta.apply(old, sent) == new,
+            "compact": data_delta.apply(old, compact_delta) == new,
+        }
+        shape = key is None and data_delta.is_empty(delta) or key is not None and bool(delta.get(key))
+        if name.startswith("같은 명칭"):
+            shape = shape and "replace" in delta["categories"].get("조류", {})
+        if name.startswith("새 지역"):
+            shape = shape and "regions" in delta["derived"] and "region" in delta["derived"].get("어류", {})
+        size = len(json.dumps(delta, ensure_ascii=False).encode("utf-8"))
+        print(f"{name}: 차이 {size:,} 바이트, " + ", ".join(f"{k} {'같음' if v else '다름'}" for k, v in results.items()))
+        if not all(results.values()):
+            ok = False
+            print("  → 실패: 차이를 적용한 결과가 새 버전과 같아야 함")
+        if not shape:
+            ok = False
+            print(f"  → 실패: 차이 모양이 예상과 다름 {sorted(delta['categories'])} {sorted(delta['derived'])}")
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+도감 데이터 조건부 다운로드 확인: ETag를 지원하는 로컬 서버에서 _fetch_data_from_github를 실행해
+  1) 처음: 200으로 받아 파싱하고 검증자와 data_hash를 저장하는지
+  2) 다시: If-None-Match를 보내 304를 받고 파싱 없이 캐시를 그대로 쓰는지
+  3) 다른 브랜치를 받아 캐시가 바뀐 뒤 돌아오면: 이전 ETag를 보내지 않고 200으로 다시 받는지
+  4) 캐시 파일이 없으면: 검증자 없이 200으로 받는지
+를 봅니다. 앱 데이터 폴더는 임시 폴더를 홈으로 두고 만듭니다. 하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_data_fetch.py
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from benchmarks import workbook
+
+ROOT = Path(__file__).resolve().parent
+
+
+def _serve(files: dict, log: list):
+    """files: { 경로: 바이트 }. ETag는 내용의 SHA-256, If-None-Match가 같으면 304. log에 (경로, 보낸 ETag, 상태)."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = files.get(self.path)
+            if body is None:
+                log.append((self.path, None, 404))
+                self.send_response(404)
+                self.end_headers()
+                return
+            etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+            sent = self.headers.get("If-None-Match")
+            status = 304 if sent == etag else 200
+            log.append((self.path, sent, status))
+            self.send_response(status)
+            self.send_header("ETag", etag)
+            if status == 304:
+                self.end_headers()
+                return
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args(argv)
+    if "main" in sys.modules:
+        print("main이 이미 import되어 있어 임시 데이터 폴더를 쓸 수 없습니다.", file=sys.stderr)
+        return 1
+    ok = True
+    a = (ROOT / "heartowiki.xlsx").read_bytes()
+    b = workbook.generate(1, seed=1)
+    hashes = {"A": hashlib.sha256(a).hexdigest(), "B": hashlib.sha256(b).hexdigest()}
+    log = []
+    server, base = _serve({"/o/r/A/heartowiki.xlsx": a, "/o/r/B/heartowiki.xlsx": b}, log)
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = os.environ["USERPROFILE"] = home
+        import main
+
+        main.get_data_dir()
+        main.GITHUB_RAW_BASE = base
+        parses = []
+        parse = main._parse_xlsx_cached
+        main._parse_xlsx_cached = lambda raw: parses.append(len(raw)) or parse(raw)
+
+        def fetch(branch: str, label: str, expect_status: int, expect_sent: bool) -> None:
+            nonlocal ok
+            del log[:], parses[:]
+            data = main._fetch_data_from_github("o/r", branch)
+            main._write_cache(data)
+            path, sent, status = log[-1] if log else ("", None, 0)
+            same = data.get("data_hash") == hashes[branch]
+            print(f"{label}: 요청 {len(log)}번, 검증자 {'보냄' if sent else '없음'}, 상태 {status}, "
+                  f"파싱 {len(parses)}번, 데이터 {'맞음' if same else '다름'}")
+            if status != expect_status or bool(sent) != expect_sent or not same:
+                ok = False
+                print(f"  → 실패: 상태 {expect_status}, 검증자 {'보냄' if expect_sent else '없음'}, {branch} 데이터여야 함")
+
+        try:
+            fetch("A", "처음 받기", 200, False)
+            entry = main._load_http_cache().get(f"{base}/o/r/A/heartowiki.xlsx") or {}
+            if entry.get("data_hash") != hashes["A"]:
+                ok = False
+                print("  → 실패: 검증자와 함께 data_hash를 저장해야 함")
+            fetch("A", "다시 받기", 304, True)
+            if parses:
+                ok = False
+                print("  → 실패: 304면 파싱하지 않아야 함")
+            fetch("B", "다른 브랜치", 200, False)
+            fetch("A", "원래 브랜치로", 200, False)
+            for path in (main.CACHE_BIN_PATH, main.CACHE_PATH):
+                if path.exists():
+                    path.unlink()
+            del log[:]
+            data = main._fetch_data_from_github("o/r", "A")
+            sent = log[-1][1] if log else None
+            print(f"캐시 없음: 검증자 {'보냄' if sent else '없음'}, 상태 {log[-1][2] if log else 0}")
+            if sent or data.get("data_hash") != hashes["A"]:
+                ok = False
+                print("  → 실패: 캐시가 없으면 검증자 없이 받아야 함")
+        finally:
+            server.shutdown()
+            main.close_collection()
+            main.close_settings()
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+주기 확인 스레드(freshness.FreshnessScheduler) 동작 확인: 짧은 간격으로 돌려
+  1) 성공하면 간격(±지터)마다 확인하는지
+  2) 실패가 이어지면 간격이 두 배씩 늘고(최대 max_backoff), 성공하면 원래 간격으로 돌아오는지
+  3) 창이 숨겨진 동안은 확인하지 않고, 다시 보이면 밀린 확인을 바로 하는지
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_freshness.py [--interval 0.1]
+"""
+
+import argparse
+import sys
+import time
+
+import freshness
+
+
+def _gaps(times: list) -> list:
+    return [round(b - a, 3) for a, b in zip(times, times[1:])]
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interval", type=float, default=0.1)
+    args = parser.parse_args(argv)
+    interval = args.interval
+    ok = True
+
+    times = []
+    s = freshness.FreshnessScheduler(lambda: times.append(time.monotonic()), interval=interval, jitter=0.2)
+    started = time.monotonic()
+    s.start()
+    time.sleep(interval * 5.5)
+    s.stop()
+    gaps = _gaps([started] + times)
+    print(f"성공: 확인 {len(times)}번, 간격 {gaps}")
+    if not 4 <= len(times) <= 6 or any(not interval * 0.75 <= g <= interval * 1.5 for g in gaps):
+        ok = False
+        print("  → 실패: 간격(±20%)마다 확인해야 함")
+
+    times = []
+    results = [False, False, False, True, True]
+
+    def flaky():
+        times.append(time.monotonic())
+        if not results.pop(0):
+            raise ConnectionError("오프라인")
+
+    s = freshness.FreshnessScheduler(flaky, interval=interval, jitter=0, max_backoff=interval * 4)
+    started = time.monotonic()
+    s.start()
+    while results and time.monotonic() - started < interval * 20:
+        time.sleep(interval / 10)
+    s.stop()
+    gaps = _gaps([started] + times)
+    expected = [1, 2, 4, 4, 1]  # 실패 3번 → 2배, 4배, 최대 4배 / 성공 뒤 원래 간격
+    print(f"실패 3번 뒤 성공: 간격 {gaps} (기대 {[interval * e for e in expected]}), {s.stats()}")
+    if len(gaps) != len(expected) or any(abs(g - interval * e) > interval * 0.5 for g, e in zip(gaps, expected)):
+        ok = False
+        print("  → 실패: 실패하면 간격이 두 배씩(최대 max_backoff) 늘고 성공하면 돌아와야 함")
+
+    times = []
+    s = freshness.FreshnessScheduler(lambda: times.append(time.monotonic()), interval=interval, jitter=0)
+    s.start()
+    s.set_visible(False)
+    time.sleep(interval * 3)
+    hidden = len(times)
+    shown = time.monotonic()
+    s.set_visible(True)
+    time.sleep(interval / 2)
+    s.stop()
+    print(f"숨김: 숨긴 동안 확인 {hidden}번, 다시 보인 뒤 {len(times) - hidden}번 "
+          f"({(times[hidden] - shown) * 1000:.0f} ms 뒤)" if len(times) > hidden else
+          f"숨김: 숨긴 동안 확인 {hidden}번, 다시 보인 뒤 0번")
+    if hidden != 0 or len(times) != 1 or times[0] - shown > interval / 4:
+        ok = False
+        print("  → 실패: 숨긴 동안은 멈추고, 다시 보이면 밀린 확인을 바로 해야 함")
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
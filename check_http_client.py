@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+http_client 확인 (로컬 대역 서버):
+  1) 5xx 두 번 뒤 200 → 재시도로 성공
+  2) 연결이 안 되는 주소 → 재시도 후 실패, 실패가 쌓이면 회로 차단기가 열려 다음 요청은 곧바로 CircuitOpenError
+  3) 쿨다운이 지나면 시험 요청 한 번, 성공하면 차단기가 닫힘
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_http_client.py
+"""
+
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import http_client
+
+
+def _serve(fail_first: int):
+    hits = {"n": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits["n"] += 1
+            status = 503 if hits["n"] <= fail_first else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/", hits
+
+
+def _closed_port() -> int:
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+def check() -> int:
+    http_client.BACKOFF_BASE = 0.05  # 확인용으로 대기 시간만 줄임
+    ok = True
+
+    server, url, hits = _serve(fail_first=2)
+    r = http_client.get(url)
+    print(f"503 두 번 뒤: 상태 {r.status_code}, 요청 {hits['n']}번")
+    if r.status_code != 200 or hits["n"] != 3:
+        ok = False
+        print("  → 실패: 재시도로 200을 받아야 함")
+    server.shutdown()
+
+    dead = f"http://127.0.0.1:{_closed_port()}/"
+    errors = []
+    t0 = time.perf_counter()
+    for _ in range(3):
+        try:
+            http_client.get(dead)
+        except Exception as e:
+            errors.append(type(e).__name__)
+    elapsed = time.perf_counter() - t0
+    t1 = time.perf_counter()
+    try:
+        http_client.get(dead)
+        fast = None
+    except http_client.CircuitOpenError:
+        fast = time.perf_counter() - t1
+    except Exception:
+        fast = None
+    print(f"연결 불가 주소: {errors} ({elapsed * 1000:.0f} ms), 차단 후 요청 {fast * 1000 if fast is not None else -1:.1f} ms")
+    if errors[-1] != "CircuitOpenError" or fast is None or fast > 0.01:
+        ok = False
+        print("  → 실패: 연속 실패 후에는 차단기가 바로 실패시켜야 함")
+
+    # 쿨다운 경과 → 시험 요청: 같은 호스트에 서버를 띄워 성공시키면 닫힘
+    breaker = http_client.CircuitBreaker(threshold=2, cooldown=0.2)
+    breaker.failure("h")
+    breaker.failure("h")
+    blocked = not breaker.allow("h")
+    time.sleep(0.25)
+    trial = breaker.allow("h")
+    second = breaker.allow("h")  # 시험 요청 결과가 나오기 전에는 막힘
+    breaker.success("h")
+    closed = breaker.allow("h")
+    print(f"차단기: 열림 {blocked}, 쿨다운 후 시험 {trial}, 시험 중 다른 요청 {second}, 성공 후 {closed}")
+    if not (blocked and trial and not second and closed):
+        ok = False
+        print("  → 실패: 반열림 동작이 다름")
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+opensheet 동시 요청 확인: 로컬 대역 서버(시트별 지연 주입)로 _fetch_opensheet를 실행해
+전체 시간이 가장 느린 시트 하나의 지연에 가까운지(순서대로 받으면 지연의 합), 실패한 시트가 보고되는지,
+전체 제한 시간(deadline)을 넘는 시트를 기다리지 않는지 봅니다. 하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_opensheet_fetch.py [--delay 0.4]
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import main
+
+SHEET_ROWS = {
+    2: [{"이름": "붕어", "위치": "강"}, {"이름": "잉어", "위치": "호수"}],
+    3: [{"이름": "참새"}],
+    4: [{"이름": "나비"}],
+    5: [{"이름": "잼"}],
+}
+
+
+def _serve(delays: dict, failing: set):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            sheet = int(self.path.rstrip("/").rsplit("/", 1)[-1])
+            time.sleep(delays.get(sheet, 0))
+            if sheet in failing:
+                self.send_response(500)
+                self.end_headers()
+                return
+            body = json.dumps(SHEET_ROWS.get(sheet, []), ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _run(delays: dict, failing=(), deadline=main.OPENSHEET_DEADLINE):
+    server, base = _serve(delays, set(failing))
+    try:
+        t0 = time.perf_counter()
+        try:
+            data = main._fetch_opensheet("SHEET", base=base, deadline=deadline)
+        except ValueError as e:
+            data = {"error": str(e)}
+        return data, time.perf_counter() - t0, dict(main._last_sheet_errors)
+    finally:
+        server.shutdown()
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--delay", type=float, default=0.4, help="가장 느린 시트 지연(초)")
+    args = parser.parse_args(argv)
+    slow = args.delay
+    delays = {2: slow * 0.5, 3: slow * 0.75, 4: slow, 5: slow * 0.25}
+    ok = True
+
+    data, wall, errors = _run(delays)
+    rows = {k: len(v) for k, v in data.items() if isinstance(v, list)}
+    serial = sum(delays.values())
+    print(f"동시 요청: {wall * 1000:.0f} ms (가장 느린 시트 {slow * 1000:.0f} ms, 순서대로면 {serial * 1000:.0f} ms) 행 {rows}")
+    if errors or wall > slow + (serial - slow) / 2:
+        ok = False
+        print("  → 실패: 가장 느린 시트보다 너무 오래 걸림" if not errors else f"  → 실패: {errors}")
+
+    data, wall, errors = _run(delays, failing={3})
+    print(f"시트 하나 실패: {wall * 1000:.0f} ms, 오류 {errors}")
+    if set(errors) != {"조류"} or not data.get("어류"):
+        ok = False
+        print("  → 실패: 실패한 시트만 보고되고 나머지는 합쳐져야 함")
+
+    data, wall, errors = _run({**delays, 4: slow * 5}, deadline=slow * 2)
+    print(f"제한 시간 {slow * 2 * 1000:.0f} ms, 한 시트 {slow * 5 * 1000:.0f} ms: {wall * 1000:.0f} ms, 오류 {errors}")
+    if set(errors) != {"곤충"} or wall > slow * 3 or not data.get("어류"):
+        ok = False
+        print("  → 실패: 제한 시간을 넘은 시트는 기다리지 않아야 함")
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
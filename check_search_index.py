@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+검색 색인(search_index) 확인: heartowiki.xlsx의 모든 카테고리에서 여러 검색어를 색인으로 찾은 결과를
+색인 없이 모든 행·필드를 한 글자씩 맞춰 보는 단순 검색과 비교합니다.
+
+  - 검색어: 명칭 전체, 필드의 한두 글자·중간 조각, 초성만("ㄹㅁㅇ"), 완성 글자와 초성 섞기("로ㅁ"),
+    공백을 넣거나 뺀 검색어("고래바다" ↔ "고래 바다"), 없는 검색어
+  - 결과: 행마다 (순위 단계, 필드 순번)가 같은지, Api.query 목록이 일치 → 앞부분 → 중간 순
+    (같은 순위 안에서는 엑셀 순서)인지
+  - 몇 가지는 기대 결과를 직접 확인: "고래바다"가 "고래 바다"·"고래바다" 지역을 모두 일치로 찾는지,
+    ㄹㅁㅇ·로ㅁ이 로메인 타코를 찾는지
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_search_index.py [xlsx경로] [--queries 300] [--seed 1]
+"""
+
+import argparse
+import random
+import sys
+import unicodedata
+from pathlib import Path
+
+import catalog_query
+import search_index
+import xlsx_fast
+from main import _records_from_sheets
+
+ROOT = Path(__file__).resolve().parent
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+EXACT, PREFIX, INFIX = 0, 1, 2  # 일치(필드 전체) → 앞부분 → 중간
+
+
+def _plain(text) -> str:
+    return "".join(unicodedata.normalize("NFC", str(text or "")).lower().split())
+
+
+def _initial(ch: str) -> str:
+    code = ord(ch) - 0xAC00
+    return CHOSEONG[code // 588] if 0 <= code < 11172 else ch
+
+
+def _matches_at(text: str, query: str, start: int) -> bool:
+    if start + len(query) > len(text):
+        return False
+    for q, ch in zip(query, text[start:]):
+        if ch != q and not (q in CHOSEONG and _initial(ch) == q):
+            return False
+    return True
+
+
+def brute_search(rows: list, text) -> dict:
+    """색인 없이: { 행 번호: (순위 단계, 필드 순번) } (SearchIndex.search와 같은 모양)."""
+    query = _plain(text)
+    hits = {}
+    if not query:
+        return hits
+    for pos, row in enumerate(rows):
+        best = None
+        for i, field in enumerate(search_index.FIELDS):
+            value = _plain(row.get(field))
+            if not value:
+                continue
+            if _matches_at(value, query, 0):
+                tier = EXACT if len(value) == len(query) else PREFIX
+            elif any(_matches_at(value, query, s) for s in range(1, len(value))):
+                tier = INFIX
+            else:
+                continue
+            if best is None or (tier, i) < best:
+                best = (tier, i)
+        if best is not None:
+            hits[pos] = best
+    return hits
+
+
+def _queries(rows: list, count: int, rng: random.Random) -> list:
+    texts = [_plain(row.get(f)) for row in rows for f in search_index.FIELDS]
+    texts = [t for t in texts if t]
+    names = [str(row.get("명칭") or "") for row in rows if row.get("명칭")]
+    out = []
+    for _ in range(count):
+        name = rng.choice(names)
+        text = rng.choice(texts)
+        start = rng.randrange(len(text))
+        piece = text[start:start + rng.randint(1, 4)]
+        cho = "".join(map(_initial, piece))
+        k = rng.randrange(len(piece))
+        out += [
+            name,
+            piece,
+            cho,
+            piece[:k] + cho[k:],  # 완성 글자 뒤에 초성
+            " ".join(piece),  # 글자 사이 공백
+            name.replace(" ", ""),
+            piece + "없는글자",
+        ]
+    return out
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("xlsx", nargs="?", default=str(ROOT / "heartowiki.xlsx"))
+    parser.add_argument("--queries", type=int, default=300, help="카테고리마다 만들 검색어 묶음 수")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    with xlsx_fast.FastWorkbook(Path(args.xlsx).read_bytes()) as wb:
+        base = _records_from_sheets(wb.sheetnames, wb.iter_rows)
+    rng = random.Random(args.seed)
+    catalog = catalog_query.CatalogIndex(base, {})
+    ok = True
+
+    for category, rows in base.items():
+        if not isinstance(rows, list):
+            continue
+        index = search_index.SearchIndex()
+        for row in rows:
+            index.add(row)
+        queries = _queries(rows, args.queries, rng)
+        wrong_hits = wrong_order = found = 0
+        for text in queries:
+            expected = brute_search(rows, text)
+            got = index.search(text)
+            if got != expected:
+                wrong_hits += 1
+                if wrong_hits <= 3:
+                    diff = sorted(p for p in set(expected) | set(got) if expected.get(p) != got.get(p))[:3]
+                    detail = ", ".join(f"{rows[p]['명칭']} {got.get(p)} / {expected.get(p)}" for p in diff)
+                    print(f"  [불일치] {category} {text!r}: {detail} (색인 / 단순 검색)")
+            found += bool(expected)
+            order = sorted(expected, key=lambda p: (expected[p], p))
+            ids = catalog.query(category, search=text)["ids"]
+            if ids != [rows[p]["명칭"] for p in order]:
+                wrong_order += 1
+                if wrong_order <= 3:
+                    print(f"  [순서 다름] {category} {text!r}: {ids[:5]} / {[rows[p]['명칭'] for p in order[:5]]}")
+        print(f"{category}: 검색어 {len(queries)}개 (결과 있음 {found}개), 결과 다름 {wrong_hits}개, 순서 다름 {wrong_order}개")
+        if wrong_hits or wrong_order:
+            ok = False
+
+    fish = base["어류"]
+    sea = [p for p, row in enumerate(fish) if _plain(row.get("지역")) == "고래바다"]
+    spaced = {str(fish[p].get("지역")) for p in sea}
+    fish_index = search_index.SearchIndex()
+    for row in fish:
+        fish_index.add(row)
+    for text in ("고래바다", "고래 바다", "고 래 바 다"):
+        result = fish_index.search(text)
+        exact = all(result.get(p) == (EXACT, 1) for p in sea)
+        print(f"{text!r}: 지역 {sorted(spaced)} {len(sea)}행 → {'모두 일치' if exact else '빠짐'}")
+        if not exact or len(spaced) < 2:
+            ok = False
+            print("  → 실패: 공백이 있든 없든 같은 지역을 일치로 찾아야 함")
+
+    dishes = catalog.query("요리", search="로메인")["ids"]
+    for text in ("ㄹㅁㅇ", "로ㅁ", "로ㅁㅇ"):
+        ids = catalog.query("요리", search=text)["ids"]
+        first = ids[0] if ids else ""
+        print(f"{text!r}: {len(ids)}개, 처음 {first!r}")
+        if first != "로메인 타코" or not set(dishes) <= set(ids):
+            ok = False
+            print("  → 실패: 로메인 타코가 맨 앞이고 '로메인' 결과를 모두 포함해야 함")
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+설정 지연 저장(settings_store.SettingsWriter) 확인: 임시 폴더에서
+  1) 연달아 저장: 한 간격 안에 다른 값 여러 번 + 같은 값 여러 번을 보내면 파일 쓰기는 한 번이고
+     identical·coalesced·writes 수가 맞는지, 파일에는 마지막 값이 있는지
+  2) A → B → A: 간격 안에 바뀌었다 돌아오면 쓰지 않는지
+  3) 종료: 간격이 지나기 전에 close()하면 남은 변경을 바로 쓰는지, 다시 열면 그 값인지
+를 봅니다 (파일 쓰기 수는 write_json_atomic 호출을 직접 셈). 하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_settings_store.py [--burst 200] [--interval 1.0]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import settings_store
+
+
+def _wait_writes(writer: settings_store.SettingsWriter, count: int, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while writer.stats()["writes"] < count:
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--burst", type=int, default=200, help="한 간격 안에 보낼 서로 다른 설정 수")
+    parser.add_argument("--interval", type=float, default=1.0, help="쓰기 간격(초)")
+    args = parser.parse_args(argv)
+    writes = []
+    write = settings_store.write_json_atomic
+    settings_store.write_json_atomic = lambda path, data: writes.append(data) or write(path, data)
+    ok = True
+
+    def expect(label: str, got: dict, want: dict) -> None:
+        nonlocal ok
+        same = all(got.get(k) == v for k, v in want.items())
+        print(f"{label}: " + ", ".join(f"{k} {got.get(k)}" for k in want) + (" (맞음)" if same else ""))
+        if not same:
+            ok = False
+            print("  → 실패: 기대 " + ", ".join(f"{k} {v}" for k, v in want.items()))
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "settings.json"
+            writer = settings_store.SettingsWriter(path, args.interval)
+            settings = writer.get()
+            # 처음 저장은 바로 쓰이므로, 먼저 한 번 쓴 뒤 간격 안에서 연달아 저장
+            settings["colors"] = {"어류": "#ff0000"}
+            writer.update(settings)
+            if not _wait_writes(writer, 1, args.interval + 2):
+                ok = False
+                print("  → 실패: 첫 저장이 쓰이지 않음")
+            del writes[:]
+            started = time.monotonic()
+            for i in range(args.burst):
+                settings = {**settings, "sortBy": f"level-{i}"}
+                writer.update(settings)
+                writer.update(dict(settings))  # 화면을 다시 그릴 때 오는 같은 값
+            elapsed = time.monotonic() - started
+            last = settings
+            _wait_writes(writer, 2, args.interval + 2)
+            time.sleep(args.interval / 2)  # 더 쓰지 않는지
+            on_disk = json.loads(path.read_text(encoding="utf-8"))
+            print(f"연달아 저장 {args.burst * 2}번 ({elapsed * 1000:.1f} ms): 파일 쓰기 {len(writes)}번, "
+                  f"파일 {'마지막 값' if on_disk == last else '다른 값'}")
+            expect("  카운터", writer.stats(), {"updates": 1 + args.burst * 2, "identical": args.burst,
+                                              "coalesced": args.burst - 1, "writes": 2})
+            if len(writes) != 1 or on_disk != last:
+                ok = False
+                print("  → 실패: 한 번만, 마지막 값으로 써야 함")
+
+            del writes[:]
+            writer.update({**last, "currentTab": "곤충"})
+            writer.update(dict(last))
+            time.sleep(args.interval * 1.5)
+            print(f"A → B → A: 파일 쓰기 {len(writes)}번")
+            expect("  카운터", writer.stats(), {"identical": args.burst + 1, "writes": 2})
+            if writes:
+                ok = False
+                print("  → 실패: 파일 내용과 같아졌으면 쓰지 않아야 함")
+
+            final = {**last, "currentTab": "요리", "colors": {"요리": "#00ff00"}}
+            writer.update(final)
+            started = time.monotonic()
+            writer.close()
+            closing = time.monotonic() - started
+            on_disk = json.loads(path.read_text(encoding="utf-8"))
+            reopened = settings_store.SettingsWriter(path, args.interval).get()
+            print(f"종료: close {closing * 1000:.1f} ms, 파일 쓰기 {len(writes)}번, "
+                  f"파일 {'마지막 값' if on_disk == final else '다른 값'}, 다시 열기 {'같음' if reopened == final else '다름'}")
+            expect("  카운터", writer.stats(), {"writes": 3})
+            alive = writer._thread is not None and writer._thread.is_alive()
+            if len(writes) != 1 or on_disk != final or reopened != final or alive:
+                ok = False
+                print("  → 실패: close()가 남은 변경을 바로 쓰고 쓰기 스레드를 멈춰야 함")
+    finally:
+        settings_store.write_json_atomic = write
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
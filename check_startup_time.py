@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+시작 시간 측정: main 모듈 import 시간(모듈별), 첫 get_app_data 응답까지 걸린 시간과 응답 크기
+(페이지와 같이 lazy=True: 현재 탭 카테고리만).
+임시 폴더를 홈으로 두고 heartowiki.xlsx로 만든 cache.json을 넣은 뒤(cache_first 시작과 같은 상태),
+새 파이썬 프로세스에서 여러 번 재어 중앙값을 startup_budget.json 예산과 비교합니다. 초과하면 종료 코드 1.
+
+사용법: python check_startup_time.py [--runs 5] [--budget startup_budget.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.resolve()
+
+SEED_CODE = """
+import main
+main.get_data_dir()
+main._write_cache(main._xlsx_to_creatures_data(open(sys.argv[1], "rb").read()))
+"""
+
+PROBE_CODE = """
+import json, sys, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+main.startup()
+data = main.get_app_data(lazy=True)
+t2 = time.perf_counter()
+print(json.dumps({
+    "import_main_ms": (t1 - t0) * 1000,
+    "first_get_app_data_ms": (t2 - t0) * 1000,
+    "payload_kb": len(json.dumps(data, ensure_ascii=False).encode("utf-8")) / 1024,
+    "rows": sum(main.get_counts().values()),
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def _run(code: str, env: dict, *args, importtime: bool = False) -> subprocess.CompletedProcess:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", "import sys\n" + code, *args]
+    return subprocess.run(cmd, cwd=str(ROOT), env=env, capture_output=True, text=True, encoding="utf-8")
+
+
+def _parse_importtime(stderr: str) -> list:
+    """-X importtime 출력 → main 아래 직접 import된 모듈 [(이름, 누적 ms)]."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        entries.append((depth, name.strip(), int(parts[1]) / 1000))
+    # main보다 먼저 찍힌 깊이 1 항목 = main이 직접 import한 모듈 (importtime은 하위 모듈을 먼저 출력)
+    result = []
+    for i, (depth, name, ms) in enumerate(entries):
+        if depth == 0 and name == "main":
+            j = i - 1
+            while j >= 0 and entries[j][0] >= 1:
+                if entries[j][0] == 1:
+                    result.append((entries[j][1], entries[j][2]))
+                j -= 1
+            result.append(("main", ms))
+            break
+    return sorted(result, key=lambda x: -x[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="두타위키 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", default=str(ROOT / "startup_budget.json"))
+    parser.add_argument("--xlsx", default=str(ROOT / "heartowiki.xlsx"))
+    args = parser.parse_args()
+    budget = json.loads(Path(args.budget).read_text(encoding="utf-8"))
+
+    with tempfile.TemporaryDirectory() as home:
+        env = {**os.environ, "HOME": home, "USERPROFILE": home, "PYTHONIOENCODING": "utf-8"}
+        seed = _run(SEED_CODE, env, args.xlsx)
+        if seed.returncode != 0:
+            print("cache.json 준비 실패:\n" + seed.stderr)
+            sys.exit(1)
+
+        runs = []
+        importtime = []
+        for i in range(max(1, args.runs)):
+            p = _run(PROBE_CODE, env, importtime=(i == 0))
+            if p.returncode != 0:
+                print("측정 실패:\n" + p.stderr)
+                sys.exit(1)
+            runs.append(json.loads(p.stdout.strip().splitlines()[-1]))
+            if i == 0:
+                importtime = _parse_importtime(p.stderr)
+
+    failures = []
+    print("[main이 import하는 모듈 (누적, 첫 실행)]")
+    for name, ms in importtime:
+        over = name != "main" and ms > budget.get("module_import_ms", float("inf"))
+        print(f"  {name:<20} {ms:8.1f} ms" + ("  ← 예산 초과" if over else ""))
+        if over:
+            failures.append(f"{name} import {ms:.1f} ms > {budget['module_import_ms']} ms")
+
+    print(f"\n[중앙값, {len(runs)}회] 도감 {runs[0]['rows']}개, 첫 응답 {runs[0]['payload_kb']:.1f} KB")
+    for key in ("import_main_ms", "first_get_app_data_ms"):
+        value = statistics.median(r[key] for r in runs)
+        limit = budget.get(key)
+        over = limit is not None and value > limit
+        print(f"  {key:<24} {value:8.1f} ms  (예산 {limit} ms)" + ("  ← 예산 초과" if over else ""))
+        if over:
+            failures.append(f"{key} {value:.1f} ms > {limit} ms")
+
+    loaded = sorted({m for r in runs for m in budget.get("lazy_modules", []) if m in r["modules"]})
+    if loaded:
+        failures.append("첫 get_app_data 전에 불러온 무거운 모듈: " + ", ".join(loaded))
+
+    if failures:
+        print("\n예산 초과:")
+        for f in failures:
+            print("  - " + f)
+        sys.exit(1)
+    print("\n예산 이내")
+
+
+if __name__ == "__main__":
+    main()
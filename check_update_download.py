@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+업데이트 exe 다운로드(update_download) 확인: 로컬 대역 서버가 앞의 요청 몇 번은 중간에 연결을 끊고(Range 지원),
+  1) 끊길 때마다 이어받아 끝까지 받고 SHA-256·크기가 맞는지
+  2) 받다 만 파일이 남은 상태에서 다시 받으면 처음부터가 아니라 이어받는지 (다음 실행 때 「업데이트 적용」)
+  3) 해시가 다르면 파일을 지우고 실패하는지
+  4) 패치(main._update_by_patch)를 받다 끊기면 받은 부분을 남겨 다음에 이어받아 적용하는지, 받다 만 전체 exe는
+     패치를 적용한 뒤에만 지우는지, 결과 해시가 맞지 않는 패치와 잘린 패치(크기·해시 정보 없이 끝까지 받음)는 지우는지
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_update_download.py [--size-mb 8]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import update_download
+
+
+def _serve(payload: bytes, drops: list):
+    """drops: 앞에서부터 요청마다 몇 바이트 보낸 뒤 끊을지 (다 쓰면 끝까지 보냄)."""
+    log = []
+    etag = '"' + hashlib.sha256(payload).hexdigest()[:16] + '"'
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            start = 0
+            m = re.match(r"bytes=(\d+)-$", self.headers.get("Range", ""))
+            if m and self.headers.get("If-Range", etag) == etag:
+                start = int(m.group(1))
+            log.append(start)
+            body = payload[start:]
+            self.send_response(206 if start else 200)
+            if start:
+                self.send_header("Content-Range", f"bytes {start}-{len(payload) - 1}/{len(payload)}")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Connection", "close")
+            self.end_headers()
+            limit = drops.pop(0) if drops else len(body)
+            self.wfile.write(body[:limit])
+            self.wfile.flush()
+            self.close_connection = True
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/Heartowiki.exe", log
+
+
+def _check_patch(folder: Path) -> bool:
+    import exe_patch
+    import main
+
+    ok = True
+    source = os.urandom(256 * 1024)
+    # 새 바이트가 받는 조각(CHUNK_SIZE) 몇 개보다 커야 끊기기 전에 받은 부분이 파일에 남음
+    target = source[:100_000] + os.urandom(4 * update_download.CHUNK_SIZE) + source[100_000:]
+    patch = exe_patch.make_patch(source, target)
+    target_hash = hashlib.sha256(target).hexdigest()
+    exe_path = folder / "Heartowiki.exe"
+    exe_path.write_bytes(source)
+    new_path = folder / "Heartowiki_new.exe"
+    patch_path = main._patch_path(exe_path, new_path)
+    server, url, log = _serve(patch, [len(patch) // 2])
+    patches = [{"from_version": main.APP_VERSION, "from_sha256": hashlib.sha256(source).hexdigest(), "url": url,
+                "size": len(patch), "sha256": hashlib.sha256(patch).hexdigest()}]
+    new_path.write_bytes(b"partial full download")
+    saved = update_download.MAX_RESUMES
+    update_download.MAX_RESUMES = 0
+    try:
+        first = main._update_by_patch(patches, exe_path, new_path, target_hash)
+    finally:
+        update_download.MAX_RESUMES = saved
+    partial = patch_path.stat().st_size if patch_path.exists() else 0
+    kept = new_path.read_bytes() == b"partial full download"
+    print(f"패치 받다 끊김: 결과 {first}, 남은 패치 {partial} 바이트, 받다 만 전체 exe 유지 {kept}")
+    if first or partial == 0 or not kept:
+        ok = False
+        print("  → 실패: 끊긴 패치는 남기고, 적용 전에는 받다 만 전체 exe를 지우면 안 됨")
+    second = main._update_by_patch(patches, exe_path, new_path, target_hash)
+    applied = new_path.exists() and new_path.read_bytes() == target
+    print(f"다시 적용: 결과 {second}, 요청 시작 위치 {log}, 결과 일치 {applied}, 패치 남음 {patch_path.exists()}")
+    if not second or log[-1] != partial or not applied or patch_path.exists():
+        ok = False
+        print("  → 실패: 남은 패치 뒤부터 받아 적용하고, 적용한 패치는 지워야 함")
+    new_path.write_bytes(b"partial full download")
+    wrong = main._update_by_patch(patches, exe_path, new_path, "0" * 64)
+    kept = new_path.read_bytes() == b"partial full download"
+    server.shutdown()
+    print(f"결과 해시가 다른 패치: 결과 {wrong}, 패치 남음 {patch_path.exists()}, 받다 만 전체 exe 유지 {kept}")
+    if wrong or patch_path.exists() or not kept:
+        ok = False
+        print("  → 실패: 맞지 않는 패치는 지우고 받다 만 전체 exe는 그대로 둬야 함")
+
+    # 크기·해시 정보가 없는 항목: 서버가 잘린 패치를 온전한 파일처럼 보내도 적용 단계에서 걸러 지워야 함
+    for label, cut in (("헤더 중간", 10), ("명령열 중간", len(patch) // 2)):
+        server, url, _log = _serve(patch[:cut], [])
+        truncated = [{**patches[0], "url": url, "size": 0, "sha256": ""}]
+        result = main._update_by_patch(truncated, exe_path, new_path, target_hash)
+        server.shutdown()
+        print(f"잘린 패치({label}, {cut} 바이트): 결과 {result}, 패치 남음 {patch_path.exists()}")
+        if result or patch_path.exists():
+            ok = False
+            print("  → 실패: 잘리거나 깨진 패치는 지워야 다음에 다시 받음")
+    return ok
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=8)
+    args = parser.parse_args(argv)
+    payload = os.urandom(int(args.size_mb * 1024 * 1024))
+    digest = hashlib.sha256(payload).hexdigest()
+    third = len(payload) // 3
+    ok = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "Heartowiki_new.exe"
+
+        server, url, log = _serve(payload, [third, third])
+        events = []
+        result = update_download.download(url, target, len(payload), digest,
+                                          progress=lambda *p: events.append(p))
+        server.shutdown()
+        print(f"끊김 두 번: 요청 시작 위치 {log}, 이어받기 {result['resumed']}번, 진행 알림 {len(events)}번, "
+              f"해시 일치 {result['sha256'] == digest}")
+        if result["sha256"] != digest or result["resumed"] != 2 or log[0] != 0 or 0 in log[1:]:
+            ok = False
+            print("  → 실패: 끊긴 위치부터 이어받아야 함")
+        if not events or events[-1][0] != len(payload):
+            ok = False
+            print("  → 실패: 마지막 진행 알림이 전체 크기여야 함")
+        target.unlink()
+
+        # 이전 실행에서 받다 만 파일: 한 번 끊긴 뒤 MAX_RESUMES를 0으로 두어 실패시키고, 다시 받기
+        server, url, log = _serve(payload, [third])
+        saved = update_download.MAX_RESUMES
+        update_download.MAX_RESUMES = 0
+        try:
+            update_download.download(url, target, len(payload), digest)
+            interrupted = False
+        except Exception:
+            interrupted = True
+        update_download.MAX_RESUMES = saved
+        partial = target.stat().st_size if target.exists() else 0
+        result = update_download.download(url, target, len(payload), digest)
+        server.shutdown()
+        print(f"다음 실행에서 이어받기: 남은 파일 {partial} 바이트, 요청 시작 위치 {log}, 해시 일치 {result['sha256'] == digest}")
+        if not interrupted or partial == 0 or log[-1] != partial or result["sha256"] != digest:
+            ok = False
+            print("  → 실패: 남은 파일 뒤부터 받아야 함")
+        target.unlink()
+
+        server, url, log = _serve(payload, [])
+        try:
+            update_download.download(url, target, len(payload), "0" * 64)
+            rejected = False
+        except ValueError:
+            rejected = True
+        server.shutdown()
+        print(f"해시 불일치: 거부 {rejected}, 파일 남음 {target.exists()}")
+        if not rejected or target.exists():
+            ok = False
+            print("  → 실패: 해시가 다르면 파일을 지우고 실패해야 함")
+
+        if not _check_patch(Path(tmp)):
+            ok = False
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+원격 xlsx 버전 확인(xlsx_remote) 점검: heartowiki.xlsx 뒤에 큰 이미지 대신 쓰는 채움 멤버를 붙인 통합문서를
+로컬 대역 서버에 올리고,
+  1) Range를 지원하는 서버에서 '도감 정보'의 도감 버전이 로컬 파싱 결과와 같고, 받은 양이 파일 크기보다 훨씬 작은지
+  2) Range를 무시하는 서버(항상 200 전체)에서도 같은 버전을 읽는지 (전체 다운로드로 대체)
+  3) main._get_github_data_version이 xlsx 경로에서 버전을 돌려주는지
+하나라도 어긋나면 종료 코드 1.
+
+사용법: python check_xlsx_probe.py [--xlsx heartowiki.xlsx] [--pad-mb 4]
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import main
+import xlsx_remote
+
+
+def _padded_workbook(path: Path, pad_mb: float) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(buf, "w") as dst:
+        for info in src.infolist():
+            dst.writestr(info, src.read(info.filename))
+        dst.writestr(zipfile.ZipInfo("xl/media/pad.bin"), os.urandom(int(pad_mb * 1024 * 1024)),
+                     compress_type=zipfile.ZIP_STORED)
+    return buf.getvalue()
+
+
+def _serve(payload: bytes, ranges: bool):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            m = re.match(r"bytes=(\d*)-(\d*)$", self.headers.get("Range", "")) if ranges else None
+            if m and (m.group(1) or m.group(2)):
+                if m.group(1):
+                    start = int(m.group(1))
+                    end = min(len(payload) - 1, int(m.group(2))) if m.group(2) else len(payload) - 1
+                else:
+                    start, end = max(0, len(payload) - int(m.group(2))), len(payload) - 1
+                body = payload[start:end + 1]
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(payload)}")
+            else:
+                body = payload
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def check(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--xlsx", type=Path, default=Path(__file__).with_name("heartowiki.xlsx"))
+    parser.add_argument("--pad-mb", type=float, default=4)
+    args = parser.parse_args(argv)
+    payload = _padded_workbook(args.xlsx, args.pad_mb)
+    expected = main._xlsx_to_creatures_data(args.xlsx.read_bytes()).get("data_version", "")
+    print(f"통합문서 {len(payload):,} 바이트, 로컬 파싱 도감 버전 {expected!r}")
+    ok = bool(expected)
+
+    for ranges in (True, False):
+        server, base = _serve(payload, ranges)
+        try:
+            rows, stats = xlsx_remote.read_sheet_head(base + "/o/r/main/heartowiki.xlsx", main.DATA_INFO_SHEET)
+        finally:
+            server.shutdown()
+        version = main._read_data_version(rows)
+        label = "Range 지원" if ranges else "Range 무시"
+        print(f"{label}: 버전 {version!r}, 요청 {stats['requests']}번, {stats['bytes']:,} 바이트 "
+              f"({stats['bytes'] / stats['size']:.1%}), 부분 읽기 {stats['ranged']}")
+        if version != expected:
+            ok = False
+            print("  → 실패: 로컬 파싱과 버전이 같아야 함")
+        if ranges and (not stats["ranged"] or stats["bytes"] > stats["size"] // 10):
+            ok = False
+            print("  → 실패: 파일 크기의 10% 이하만 받아야 함")
+
+    server, base = _serve(payload, True)
+    saved = main.GITHUB_RAW_BASE
+    main.GITHUB_RAW_BASE = base
+    try:
+        version = main._get_github_data_version("o/r", "main", "heartowiki.xlsx")
+    finally:
+        main.GITHUB_RAW_BASE = saved
+        server.shutdown()
+    print(f"_get_github_data_version: {version!r}")
+    if version != expected:
+        ok = False
+        print("  → 실패: xlsx 경로에서도 도감 버전을 돌려줘야 함")
+
+    print("통과" if ok else "실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(check())
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""heartowiki.xlsx 를 빠른 읽기(xlsx_fast)와 openpyxl로 각각 변환해 결과가 같은지 확인."""
+
+import sys
+import time
+from pathlib import Path
+
+import xlsx_fast
+from main import _records_from_sheets, _xlsx_to_creatures_data_openpyxl
+
+
+def main():
+    path = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else Path(__file__).parent / "heartowiki.xlsx"
+    if not path.exists():
+        print(f"파일을 찾을 수 없습니다: {path}")
+        print("\n사용법: python check_xlsx_reader.py [파일경로]")
+        sys.exit(1)
+    raw = path.read_bytes()
+
+    t0 = time.perf_counter()
+    with xlsx_fast.FastWorkbook(raw) as wb:
+        fast = _records_from_sheets(wb.sheetnames, wb.iter_rows)
+    t1 = time.perf_counter()
+    slow = _xlsx_to_creatures_data_openpyxl(raw)
+    t2 = time.perf_counter()
+
+    print(f"파일: {path}")
+    print(f"  xlsx_fast: {(t1 - t0) * 1000:.1f} ms")
+    print(f"  openpyxl : {(t2 - t1) * 1000:.1f} ms")
+    for key in slow:
+        if isinstance(slow[key], list):
+            print(f"  {key}: {len(fast.get(key, []))} / {len(slow[key])}개")
+
+    if fast != slow:
+        for key in sorted(set(fast) | set(slow)):
+            a, b = fast.get(key), slow.get(key)
+            if a == b:
+                continue
+            if isinstance(a, list) and isinstance(b, list):
+                for i, (ra, rb) in enumerate(zip(a, b)):
+                    if ra != rb:
+                        print(f"[불일치] {key}[{i}]\n  xlsx_fast: {ra}\n  openpyxl : {rb}")
+                        break
+                else:
+                    print(f"[불일치] {key}: 개수 {len(a)} / {len(b)}")
+            else:
+                print(f"[불일치] {key}: {a!r} / {b!r}")
+        sys.exit(1)
+    print("결과 동일")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+수집 정보(collection.json) 저장: 스냅샷 + 추가 전용 저널.
+별 클릭·생물 추가/삭제는 collection.journal에 한 줄짜리 변경 기록으로 덧붙이고(fsync),
+기록이 쌓이면 백그라운드에서 스냅샷(collection.json)에 합친 뒤 저널을 비웁니다.
+
+  저널 한 줄: {"seq": 12, "op": "star", "key": "어류_붕어", "n": 3}
+  op: star(n이 null이면 삭제) / add(cat, item) / remove(cat, name) / creatures(cat, items: 카테고리 전체 교체)
+
+스냅샷에는 마지막으로 합친 기록 번호(journal_seq)가 들어 있어, 시작할 때 그보다 뒤의 기록만 다시 적용합니다.
+스냅샷은 임시 파일에 쓰고 fsync한 뒤 이름을 바꾸므로, 쓰는 도중 꺼져도 collection.json이 깨지지 않습니다.
+합치기는 한 번에 하나만 실행되고(_compact_lock), 종료 시 close()는 진행 중인 백그라운드 합치기가 끝난 뒤 합칩니다.
+저널 끝이 잘려 있으면(쓰는 도중 꺼짐) 마지막 온전한 줄까지만 적용하고 잘린 부분은 버립니다.
+"""
+
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+
+CATEGORIES = ("어류", "곤충", "조류", "요리")
+COMPACT_EVERY = 256  # 저널 기록이 이만큼 쌓이면 백그라운드에서 스냅샷에 합침
+
+
+def empty_collection() -> dict:
+    return {"stars": {}, "userCreatures": {c: [] for c in CATEGORIES}}
+
+
+def _tmp_path(path: Path) -> Path:
+    """path 옆의 임시 파일 이름 (스레드마다 달라서 동시에 써도 서로의 임시 파일을 덮지 않음)."""
+    return Path(f"{path}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+def write_json_atomic(path: Path, data, indent=2) -> None:
+    """임시 파일에 쓰고 fsync한 뒤 os.replace로 교체 (중간에 꺼져도 기존 파일 유지)."""
+    tmp = _tmp_path(path)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _apply(state: dict, record: dict) -> None:
+    """변경 기록 하나를 상태에 적용 (같은 기록을 두 번 적용해도 결과가 같음)."""
+    op = record.get("op")
+    if op == "star":
+        if record.get("n") is None:
+            state["stars"].pop(record["key"], None)
+        else:
+            state["stars"][record["key"]] = record["n"]
+        return
+    creatures = state["userCreatures"].setdefault(record.get("cat", ""), [])
+    if op == "add":
+        item = record.get("item") or {}
+        if not any(c.get("명칭") == item.get("명칭") for c in creatures):
+            creatures.append(item)
+    elif op == "remove":
+        creatures[:] = [c for c in creatures if c.get("명칭") != record.get("name")]
+    elif op == "creatures":
+        creatures[:] = list(record.get("items") or [])
+
+
+class CollectionJournal:
+    """collection.json(스냅샷) + collection.journal(변경 기록). 메모리의 상태가 기준이며 파일 읽기는 처음 한 번뿐."""
+
+    def __init__(self, snapshot_path: Path, journal_path: Path, compact_every: int = COMPACT_EVERY):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(journal_path)
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()  # compact 전체 (스냅샷 쓰기 ~ 저널 자르기)를 한 번에 하나만
+        self._compact_thread = None
+        self._state = None
+        self._seq = 0  # 마지막 기록 번호
+        self._pending = 0  # 스냅샷에 아직 합치지 않은 기록 수
+        self._file = None
+        self._compacting = False
+        # 변경될 때마다 1씩 증가 (색인 등이 다시 계산할지 판단하는 용도)
+        self.stars_revision = 0
+        self.creatures_revision = 0
+
+    # --- 읽기 ---
+
+    def _load(self) -> None:
+        state = empty_collection()
+        seq = 0
+        if self.snapshot_path.exists():
+            try:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    saved = json.load(f)
+                seq = int(saved.pop("journal_seq", 0) or 0)
+                state.update(saved)
+            except Exception:
+                pass
+        state["stars"] = dict(state.get("stars") or {})
+        state["userCreatures"] = {**{c: [] for c in CATEGORIES}, **(state.get("userCreatures") or {})}
+        self._state = state
+        self._seq = seq
+        self._pending = self._replay()
+        if self._pending:
+            # 지난번에 정상 종료되지 못함 → 다시 적용한 기록을 백그라운드에서 스냅샷에 합침
+            self.compact_in_background()
+
+    def _replay(self) -> int:
+        """저널에서 스냅샷 이후 기록을 적용. 잘리거나 깨진 줄부터는 버리고 파일도 그 앞까지 자름."""
+        if not self.journal_path.exists():
+            return 0
+        applied = 0
+        good_end = 0
+        with open(self.journal_path, "rb") as f:
+            raw = f.read()
+        pos = 0
+        while pos < len(raw):
+            end = raw.find(b"\n", pos)
+            if end == -1:
+                break  # 마지막 줄이 끝나지 않음 (쓰는 도중 꺼짐)
+            try:
+                record = json.loads(raw[pos:end].decode("utf-8"))
+                seq = int(record["seq"])
+            except Exception:
+                break
+            if seq > self._seq:
+                _apply(self._state, record)
+                self._seq = seq
+                applied += 1
+            pos = good_end = end + 1
+        if good_end < len(raw):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_end)
+        return applied
+
+    def state(self) -> dict:
+        """현재 수집 정보 복사본 { stars, userCreatures }."""
+        with self._lock:
+            if self._state is None:
+                self._load()
+            return copy.deepcopy(self._state)
+
+    def peek(self) -> dict:
+        """현재 수집 정보 자체 (복사하지 않음, 읽기 전용으로만 사용)."""
+        with self._lock:
+            if self._state is None:
+                self._load()
+            return self._state
+
+    # --- 쓰기 ---
+
+    def _append(self, records: list) -> None:
+        """기록을 상태에 적용하고 저널에 덧붙임 (fsync). 호출 전 _lock을 잡고 있어야 함."""
+        if not records:
+            return
+        lines = []
+        for record in records:
+            self._seq += 1
+            record = {"seq": self._seq, **record}
+            _apply(self._state, record)
+            if record["op"] == "star":
+                self.stars_revision += 1
+            else:
+                self.creatures_revision += 1
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        if self._file is None:
+            self._file = open(self.journal_path, "ab")
+        self._file.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending += len(records)
+        if self._pending >= self.compact_every:
+            self.compact_in_background()
+
+    def _write(self, records: list) -> None:
+        with self._lock:
+            if self._state is None:
+                self._load()
+            self._append(records)
+
+    def set_star(self, key: str, n) -> None:
+        """별 갯수 변경 (n이 None이면 기록 삭제)."""
+        self._write([{"op": "star", "key": key, "n": n}])
+
+    def add_creature(self, category: str, item: dict) -> None:
+        self._write([{"op": "add", "cat": category, "item": item}])
+
+    def remove_creature(self, category: str, name: str) -> None:
+        self._write([{"op": "remove", "cat": category, "name": name}])
+
+    def replace(self, stars=None, user_creatures=None) -> None:
+        """전체 값으로 저장 요청이 와도 바뀐 부분만 기록으로 남김."""
+        with self._lock:
+            if self._state is None:
+                self._load()
+            records = []
+            if stars is not None:
+                old = self._state["stars"]
+                for key in list(old) + [k for k in stars if k not in old]:
+                    if key not in stars:
+                        records.append({"op": "star", "key": key, "n": None})
+                    elif old.get(key) != stars[key] or key not in old:
+                        records.append({"op": "star", "key": key, "n": stars[key]})
+            if user_creatures is not None:
+                for cat, items in user_creatures.items():
+                    records.extend(self._creature_records(cat, list(items or [])))
+            self._append(records)
+
+    def _creature_records(self, category: str, items: list) -> list:
+        old = self._state["userCreatures"].get(category, [])
+        if old == items:
+            return []
+        new_names = {c.get("명칭") for c in items}
+        old_names = {c.get("명칭") for c in old}
+        records = [{"op": "remove", "cat": category, "name": c.get("명칭")} for c in old if c.get("명칭") not in new_names]
+        records += [{"op": "add", "cat": category, "item": c} for c in items if c.get("명칭") not in old_names]
+        # 추가/삭제만으로 같은 목록이 되지 않으면(수정·순서 변경) 카테고리 전체 교체
+        trial = {"stars": {}, "userCreatures": {category: list(old)}}
+        for record in records:
+            _apply(trial, record)
+        if trial["userCreatures"][category] != items:
+            return [{"op": "creatures", "cat": category, "items": items}]
+        return records
+
+    # --- 합치기 ---
+
+    def compact(self) -> None:
+        """현재 상태를 스냅샷으로 쓰고, 스냅샷에 들어간 기록을 저널에서 제거.
+        두 합치기가 겹치면 오래된 스냅샷이 나중에 교체되어 그 사이 기록이 사라지므로 _compact_lock으로 직렬화."""
+        with self._compact_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        with self._lock:
+            if self._state is None:
+                self._load()
+            if self._pending == 0:
+                return
+            snapshot = copy.deepcopy(self._state)
+            seq = self._seq
+        # 스냅샷 쓰는 동안에도 별 클릭은 저널에 계속 기록됨
+        write_json_atomic(self.snapshot_path, {**snapshot, "journal_seq": seq})
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            remaining = []
+            if self.journal_path.exists():
+                with open(self.journal_path, "rb") as f:
+                    for line in f:
+                        try:
+                            if int(json.loads(line.decode("utf-8"))["seq"]) > seq:
+                                remaining.append(line)
+                        except Exception:
+                            break
+            tmp = _tmp_path(self.journal_path)
+            with open(tmp, "wb") as f:
+                f.writelines(remaining)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.journal_path)
+            self._pending = len(remaining)
+
+    def compact_in_background(self) -> None:
+        """compact를 데몬 스레드에서 실행 (이미 진행 중이면 생략)."""
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+
+        def run():
+            try:
+                self.compact()
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._compacting = False
+
+        thread = threading.Thread(target=run, name="collection-compact", daemon=True)
+        self._compact_thread = thread
+        thread.start()
+
+    def close(self) -> None:
+        """종료 시: 진행 중인 백그라운드 합치기를 기다린 뒤 남은 기록을 스냅샷에 합치고 저널 파일을 닫음."""
+        thread = self._compact_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        try:
+            self.compact()
+        finally:
+            with self._lock:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+도감 데이터 두 버전 사이의 행 단위 차이 (refresh_data 용).
+행은 카테고리 + 명칭으로 맞추며, 카테고리마다 추가된 행 / 빠진 명칭 / 바뀐 필드만 담습니다.
+
+  {"categories": {"어류": {"added": [행 ...], "removed": [명칭 ...],
+                          "changed": [{"명칭": ..., "set": {필드: 새 값}, "unset": [빠진 필드]}],
+                          "order": [명칭 ...]}},          # 순서가 바뀌었을 때만
+   "meta": {"data_version": ...},                           # 카테고리 밖의 값 중 바뀐 것 (derived 제외)
+   "derived": {"어류": {"price": [...]}, "regions": [...]}} # records.attach 열 중 바뀐 것만
+
+derived는 dict 하나라서 meta로 비교하면 행 하나만 바뀌어도 전체가 실리므로, 카테고리별로 바뀐 열과
+바뀐 최상위 값(version, regions)만 보냅니다. 적용할 때는 카테고리 안에서 열 단위로 덮어씁니다.
+
+적용: 빠진 행 제거 → 바뀐 필드 반영 → 추가 행을 뒤에 붙임 → order가 있으면 그 순서로.
+한 카테고리 안에 같은 명칭이 두 번 이상 있으면 명칭으로 맞출 수 없으므로 그 카테고리는 {"replace": [행 전체]}로 보냅니다.
+"""
+
+
+DERIVED = "derived"
+
+
+def _names(rows: list) -> list:
+    return [row.get("명칭", "") for row in rows]
+
+
+def _row_change(old: dict, new: dict):
+    changed = {k: v for k, v in new.items() if k not in old or old[k] != v}
+    unset = [k for k in old if k not in new]
+    if not changed and not unset:
+        return None
+    return {"명칭": new.get("명칭", ""), "set": changed, "unset": unset}
+
+
+def diff_category(old_rows: list, new_rows: list):
+    """카테고리 하나의 차이. 같으면 None."""
+    if old_rows == new_rows:
+        return None
+    old_names = _names(old_rows)
+    new_names = _names(new_rows)
+    if len(set(old_names)) != len(old_names) or len(set(new_names)) != len(new_names):
+        return {"replace": new_rows}
+    old_by_name = dict(zip(old_names, old_rows))
+    new_set = set(new_names)
+    delta = {
+        "added": [row for name, row in zip(new_names, new_rows) if name not in old_by_name],
+        "removed": [name for name in old_names if name not in new_set],
+        "changed": [],
+    }
+    for name, row in zip(new_names, new_rows):
+        old = old_by_name.get(name)
+        if old is not None:
+            change = _row_change(old, row)
+            if change is not None:
+                delta["changed"].append(change)
+    # 남은 행 + 추가 행을 뒤에 붙인 순서가 새 순서와 다르면 순서를 함께 보냄
+    patched = [name for name in old_names if name in new_set] + [row.get("명칭", "") for row in delta["added"]]
+    if patched != new_names:
+        delta["order"] = new_names
+    return {k: v for k, v in delta.items() if v}
+
+
+def diff_derived(old: dict, new: dict) -> dict:
+    """derived 차이: 카테고리별로 바뀐 열, 그 밖에 바뀐 값(version, regions). 사라진 것은 None."""
+    delta = {}
+    for key in list(old) + [k for k in new if k not in old]:
+        before, after = old.get(key), new.get(key)
+        if isinstance(before, dict) and isinstance(after, dict):
+            columns = {c: v for c, v in after.items() if before.get(c) != v}
+            if columns:
+                delta[key] = columns
+        elif before != after:
+            delta[key] = after
+    return delta
+
+
+def diff(old: dict, new: dict) -> dict:
+    """도감 데이터 old → new 차이 { categories, meta, derived }. 목록(list) 값은 카테고리, 나머지는 meta로 비교."""
+    old = old or {}
+    new = new or {}
+    categories = {}
+    meta = {}
+    derived = {}
+    for key in list(old) + [k for k in new if k not in old]:
+        if isinstance(new.get(key), list) or isinstance(old.get(key), list):
+            delta = diff_category(list(old.get(key) or []), list(new.get(key) or []))
+            if delta is not None:
+                categories[key] = delta
+        elif key == DERIVED and isinstance(old.get(key), dict) and isinstance(new.get(key), dict):
+            derived = diff_derived(old[key], new[key])
+        elif old.get(key) != new.get(key):
+            meta[key] = new.get(key)
+    return {"categories": categories, "meta": meta, "derived": derived}
+
+
+def is_empty(delta: dict) -> bool:
+    return not delta.get("categories") and not delta.get("meta") and not delta.get("derived")
+
+
+def apply(base: dict, delta: dict) -> dict:
+    """차이를 적용한 새 도감 데이터 (base는 바꾸지 않음). index.html applyBaseDelta와 같은 순서."""
+    result = dict(base or {})
+    for category, d in (delta.get("categories") or {}).items():
+        if "replace" in d:
+            result[category] = list(d["replace"])
+            continue
+        removed = set(d.get("removed") or ())
+        changed = {c["명칭"]: c for c in d.get("changed") or ()}
+        rows = []
+        for row in result.get(category) or []:
+            name = row.get("명칭", "")
+            if name in removed:
+                continue
+            change = changed.get(name)
+            if change is not None:
+                row = {**row, **change.get("set", {})}
+                for key in change.get("unset") or ():
+                    row.pop(key, None)
+            rows.append(row)
+        rows.extend(d.get("added") or ())
+        if d.get("order"):
+            by_name = {row.get("명칭", ""): row for row in rows}
+            rows = [by_name[name] for name in d["order"]]
+        result[category] = rows
+    for key, value in (delta.get("meta") or {}).items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = value
+    if delta.get("derived"):
+        derived = dict(result.get(DERIVED) or {})
+        for key, value in delta["derived"].items():
+            if value is None:
+                derived.pop(key, None)
+            elif isinstance(value, dict) and isinstance(derived.get(key), dict):
+                derived[key] = {**derived[key], **value}
+            else:
+                derived[key] = value
+        result[DERIVED] = derived
+    return result
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+앱 업데이트용 바이너리 패치: 이전 exe 바이트 + 패치 → 새 exe 바이트.
+main.py·index.html만 바뀐 버전이면 PyInstaller 번들 대부분이 그대로이므로, 바뀐 부분만 받습니다.
+
+형식: MAGIC + 헤더 길이(uint32 LE) + 헤더 JSON + lzma로 압축한 명령열
+  헤더: {"source_size", "source_sha256", "target_size", "target_sha256"}
+  명령: 0x00 COPY  varint(원본 위치) varint(길이)   — 원본에서 복사
+        0x01 INSERT varint(길이) 바이트           — 새 바이트
+
+패치 만들기(make_patch)는 원본을 BLOCK 바이트 단위로 색인한 뒤, 새 파일의 각 위치에서 같은 블록을 찾아
+앞뒤로 늘려 가며 COPY로, 찾지 못한 구간은 INSERT로 기록합니다 (빌드 PC에서 make_patch.py로 실행).
+적용(apply_patch)은 원본·결과의 SHA-256을 헤더와 비교하며, 다르면 ValueError.
+잘리거나 깨진 패치(헤더 길이·JSON·lzma·명령열 오류, 헤더 항목 없음)도 모두 ValueError로 알립니다.
+"""
+
+import hashlib
+import json
+import lzma
+import struct
+
+MAGIC = b"HWPATCH1"
+HEADER_KEYS = ("source_size", "source_sha256", "target_size", "target_sha256")
+BLOCK = 64
+_COPY, _INSERT = 0, 1
+
+
+def _varint(n: int) -> bytes:
+    out = bytearray()
+    while True:
+        b = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(b | 0x80)
+        else:
+            out.append(b)
+            return bytes(out)
+
+
+def _read_varint(buf: bytes, pos: int):
+    n = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return n, pos
+        shift += 7
+
+
+def _match_len(a: bytes, i: int, b: bytes, j: int, limit: int) -> int:
+    """a[i:]와 b[j:]가 앞에서부터 같은 길이 (최대 limit). 큰 조각부터 비교."""
+    n = 0
+    for step in (65536, 4096, 256, 16, 1):
+        while n + step <= limit and a[i + n:i + n + step] == b[j + n:j + n + step]:
+            n += step
+    return n
+
+
+def diff_ops(source: bytes, target: bytes, block: int = BLOCK) -> list:
+    """[("copy", 원본 위치, 길이) | ("insert", 바이트)]"""
+    index = {}
+    for off in range(0, len(source) - block + 1, block):
+        index.setdefault(source[off:off + block], off)
+    ops = []
+    literal = 0  # 아직 기록하지 않은 새 바이트의 시작
+    t = 0
+    end = len(target) - block
+    while t <= end:
+        s = index.get(target[t:t + block])
+        if s is None:
+            t += 1
+            continue
+        back = 0
+        while back < t - literal and back < s and source[s - back - 1] == target[t - back - 1]:
+            back += 1
+        length = back + _match_len(source, s, target, t, min(len(source) - s, len(target) - t))
+        start = t - back
+        if start > literal:
+            ops.append(("insert", target[literal:start]))
+        ops.append(("copy", s - back, length))
+        t = literal = start + length
+    if literal < len(target):
+        ops.append(("insert", target[literal:]))
+    return ops
+
+
+def make_patch(source: bytes, target: bytes, block: int = BLOCK) -> bytes:
+    header = {
+        "source_size": len(source),
+        "source_sha256": hashlib.sha256(source).hexdigest(),
+        "target_size": len(target),
+        "target_sha256": hashlib.sha256(target).hexdigest(),
+    }
+    body = bytearray()
+    for op in diff_ops(source, target, block):
+        if op[0] == "copy":
+            body.append(_COPY)
+            body += _varint(op[1])
+            body += _varint(op[2])
+        else:
+            body.append(_INSERT)
+            body += _varint(len(op[1]))
+            body += op[1]
+    raw_header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    compressed = lzma.compress(bytes(body), preset=9 | lzma.PRESET_EXTREME)
+    return MAGIC + struct.pack("<I", len(raw_header)) + raw_header + compressed
+
+
+def read_header(patch: bytes):
+    """(헤더 dict, 압축된 명령열 시작 위치)"""
+    if patch[:len(MAGIC)] != MAGIC:
+        raise ValueError("패치 파일 형식이 아닙니다.")
+    start = len(MAGIC) + 4
+    try:
+        (size,) = struct.unpack("<I", patch[len(MAGIC):start])
+    except struct.error:
+        raise ValueError("패치 파일이 잘렸습니다.")
+    if start + size > len(patch):
+        raise ValueError("패치 파일이 잘렸습니다.")
+    header = json.loads(patch[start:start + size].decode("utf-8"))  # 깨진 JSON·UTF-8도 ValueError
+    if not isinstance(header, dict) or any(key not in header for key in HEADER_KEYS):
+        raise ValueError("패치 헤더가 올바르지 않습니다.")
+    return header, start + size
+
+
+def apply_patch(source: bytes, patch: bytes, out) -> dict:
+    """source에 patch를 적용해 out(쓰기용 바이너리 파일)에 씀. 헤더 반환.
+    원본 해시가 다르거나 결과 해시가 다르면 ValueError."""
+    header, pos = read_header(patch)
+    if len(source) != header["source_size"] or hashlib.sha256(source).hexdigest() != header["source_sha256"]:
+        raise ValueError("현재 exe가 패치의 원본과 다릅니다.")
+    try:
+        body = lzma.decompress(patch[pos:])
+    except lzma.LZMAError:
+        raise ValueError("패치 명령열이 잘렸거나 깨졌습니다.")
+    digest = hashlib.sha256()
+    written = 0
+    view = memoryview(source)
+    i = 0
+    while i < len(body):
+        op = body[i]
+        try:
+            if op == _COPY:
+                offset, i = _read_varint(body, i + 1)
+                length, i = _read_varint(body, i)
+                chunk = view[offset:offset + length]
+            elif op == _INSERT:
+                length, i = _read_varint(body, i + 1)
+                chunk = body[i:i + length]
+                i += length
+            else:
+                raise ValueError("패치 명령이 올바르지 않습니다.")
+        except IndexError:  # 명령열 끝에서 varint가 잘림
+            raise ValueError("패치 명령이 올바르지 않습니다.")
+        out.write(chunk)
+        digest.update(chunk)
+        written += len(chunk)
+    if written != header["target_size"] or digest.hexdigest() != header["target_sha256"]:
+        raise ValueError("패치 적용 결과가 새 버전과 다릅니다.")
+    return header
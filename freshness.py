@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+주기적인 최신 여부 확인: 전용 스레드가 interval초마다 check()를 실행합니다 (도감 데이터·앱 버전 확인).
+
+  - 간격에 ±jitter 비율의 무작위를 섞어, 같은 시각에 켠 여러 PC가 한꺼번에 요청하지 않도록 함
+  - check()가 예외를 내면 다음 확인까지 간격을 두 배씩 늘림 (최대 max_backoff초), 성공하면 원래 간격
+  - 창이 숨겨져 있는 동안(최소화 등)은 확인하지 않고, 다시 보이면 밀린 확인을 바로 실행
+  - interval이 0 이하면 시작하지 않음
+"""
+
+import random
+import threading
+import time
+
+INTERVAL = 30 * 60  # 초
+JITTER = 0.1  # 간격의 ±10%
+MAX_BACKOFF = 6 * 60 * 60  # 초: 실패가 이어질 때 최대 간격
+
+
+class FreshnessScheduler:
+    """check()를 주기적으로 실행하는 스레드 (실패 시 지수 백오프, 창이 숨겨지면 멈춤)."""
+
+    def __init__(self, check, interval: float = INTERVAL, jitter: float = JITTER, max_backoff: float = MAX_BACKOFF):
+        self.check = check
+        self.interval = max(0.0, float(interval))
+        self.jitter = min(max(0.0, float(jitter)), 1.0)
+        self.max_backoff = max(self.interval, float(max_backoff))
+        self._cond = threading.Condition()
+        self._visible = True
+        self._due = 0.0  # 다음 확인 시각 (time.monotonic)
+        self._failures = 0  # 연속 실패 수
+        self._running = False
+        self._closed = False
+        self._thread = None
+        self.counters = {"checks": 0, "failures": 0, "paused": 0}
+
+    def _delay(self) -> float:
+        base = min(self.max_backoff, self.interval * (2 ** self._failures))
+        return base * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def start(self) -> bool:
+        """스레드 시작 (첫 확인은 한 간격 뒤). interval이 0이면 False."""
+        with self._cond:
+            if self.interval <= 0 or self._thread is not None or self._closed:
+                return False
+            self._due = time.monotonic() + self._delay()
+            self._thread = threading.Thread(target=self._run, name="freshness", daemon=True)
+            self._thread.start()
+            return True
+
+    def set_visible(self, visible: bool) -> None:
+        """창이 보이는지 알림. 숨겨지면 멈추고, 다시 보일 때 확인 시각이 지났으면 바로 확인."""
+        with self._cond:
+            visible = bool(visible)
+            if visible == self._visible:
+                return
+            self._visible = visible
+            if not visible:
+                self.counters["paused"] += 1
+            self._cond.notify()
+
+    def run_now(self) -> None:
+        """다음 확인을 지금 실행 (창이 숨겨져 있으면 보일 때)."""
+        with self._cond:
+            self._due = time.monotonic()
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if not self._visible:
+                        self._cond.wait()
+                        continue
+                    wait = self._due - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                if self._closed:
+                    return
+                self._running = True
+            try:
+                self.check()
+                failed = False
+            except Exception:
+                failed = True
+            with self._cond:
+                self._running = False
+                self.counters["checks"] += 1
+                if failed:
+                    self.counters["failures"] += 1
+                    self._failures += 1
+                else:
+                    self._failures = 0
+                self._due = time.monotonic() + self._delay()
+
+    def stats(self) -> dict:
+        """{ interval, visible, running, consecutive_failures, next_in: 다음 확인까지 초, checks, failures, paused }"""
+        with self._cond:
+            return {
+                "interval": self.interval,
+                "visible": self._visible,
+                "running": self._running,
+                "consecutive_failures": self._failures,
+                "next_in": max(0.0, self._due - time.monotonic()) if self._thread is not None else None,
+                **self.counters,
+            }
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+공용 HTTP 클라이언트 (main.py의 모든 네트워크 요청이 사용).
+
+  - 세션 하나를 같이 써서 호스트별 연결을 재사용(keep-alive)
+  - 요청 종류별 timeout (연결, 읽기): api(버전·업데이트 정보) / data(도감 파일) / download(exe)
+  - 연결 오류·timeout·5xx는 최대 RETRIES번 다시 시도. 간격은 지수 백오프에 무작위(지터)를 섞음
+  - 호스트별 회로 차단기: 연속 BREAKER_THRESHOLD번 실패하면 BREAKER_COOLDOWN초 동안은 요청하지 않고
+    바로 CircuitOpenError. 쿨다운이 지나면 한 번 시험 요청해 성공하면 닫힘
+    (오프라인일 때 시작·업데이트 확인이 요청마다 timeout을 기다리지 않도록)
+  - 요청마다 perf에 http.<종류> 기록 (호스트, 상태 코드, 시도 횟수, 받은 바이트 — stream이면 Content-Length)
+
+requests는 무거우므로 첫 요청 때 import 합니다.
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import perf
+
+USER_AGENT = "Heartowiki/1.0"
+TIMEOUTS = {
+    "api": (5, 15),
+    "data": (5, 30),
+    "download": (5, 120),
+}
+RETRIES = 2
+RETRY_STATUSES = (500, 502, 503, 504)
+BACKOFF_BASE = 0.5  # 초: 첫 재시도 간격 상한 (시도마다 2배, 그 안에서 무작위)
+BACKOFF_MAX = 4.0
+BREAKER_THRESHOLD = 4
+BREAKER_COOLDOWN = 60.0
+POOL_SIZE = 8  # 호스트당 연결 수 (opensheet 시트 동시 요청 포함)
+
+
+class CircuitOpenError(ConnectionError):
+    """회로 차단기가 열려 요청하지 않음."""
+
+
+class CircuitBreaker:
+    """호스트별 연속 실패 수를 세어, threshold를 넘으면 cooldown 동안 요청을 막음."""
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN, clock=time.monotonic):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._hosts = {}  # host → [연속 실패 수, 열린 시각]
+
+    def allow(self, host: str) -> bool:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state[0] < self.threshold:
+                return True
+            now = self.clock()
+            if now - state[1] >= self.cooldown:
+                state[1] = now  # 반열림: 이번 한 번만 시험 요청, 실패하면 다시 cooldown
+                return True
+            return False
+
+    def retry_after(self, host: str) -> float:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state[0] < self.threshold:
+                return 0.0
+            return max(0.0, state[1] + self.cooldown - self.clock())
+
+    def success(self, host: str) -> None:
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def failure(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host, [0, 0.0])
+            state[0] += 1
+            if state[0] >= self.threshold:
+                state[1] = self.clock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+    def stats(self) -> dict:
+        """{ host: { failures, open } }"""
+        with self._lock:
+            hosts = {h: list(s) for h, s in self._hosts.items()}
+        now = self.clock()
+        return {
+            h: {"failures": n, "open": n >= self.threshold and now - opened < self.cooldown}
+            for h, (n, opened) in hosts.items()
+        }
+
+
+breaker = CircuitBreaker()
+_session = None
+_session_lock = threading.Lock()
+
+
+def session():
+    """공용 requests.Session (처음 부를 때 만듦)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            s = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            s.headers["User-Agent"] = USER_AGENT
+            _session = s
+        return _session
+
+
+def backoff(attempt: int) -> float:
+    """attempt번째(0부터) 재시도 전 대기 시간: 0 ~ min(BACKOFF_MAX, BACKOFF_BASE·2^attempt) 사이 무작위."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def request(method: str, url: str, kind: str = "api", retries: int = RETRIES, timeout=None, **kwargs):
+    """요청 후 응답 반환 (4xx·마지막 시도의 5xx도 응답으로 돌려주므로 raise_for_status는 호출한 쪽에서).
+    연결 실패가 계속되면 requests 예외, 차단기가 열려 있으면 CircuitOpenError."""
+    parts = urlsplit(url)
+    with perf.span("http." + kind, method=method, host=parts.netloc, path=parts.path) as s:
+        r = _request(method, url, kind, retries, timeout, s, **kwargs)
+        s["status"] = r.status_code
+        if kwargs.get("stream"):
+            s["bytes"] = int(r.headers.get("Content-Length") or 0)
+        else:
+            s["bytes"] = len(r.content)
+        return r
+
+
+def _request(method: str, url: str, kind: str, retries: int, timeout, span: dict, **kwargs):
+    import requests
+    host = urlsplit(url).netloc
+    timeout = timeout if timeout is not None else TIMEOUTS.get(kind, TIMEOUTS["api"])
+    attempt = 0
+    while True:
+        span["attempts"] = attempt + 1
+        if not breaker.allow(host):
+            raise CircuitOpenError(f"{host}에 연결하지 못해 {breaker.retry_after(host):.0f}초 동안 요청하지 않습니다.")
+        try:
+            r = session().request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            breaker.failure(host)
+            if attempt >= retries:
+                raise
+        else:
+            if r.status_code not in RETRY_STATUSES:
+                breaker.success(host)
+                return r
+            breaker.failure(host)
+            if attempt >= retries:
+                return r
+            r.close()
+        time.sleep(backoff(attempt))
+        attempt += 1
+
+
+def get(url: str, kind: str = "api", **kwargs):
+    return request("GET", url, kind=kind, **kwargs)
+
+
+def reset() -> None:
+    """차단기 상태를 지움 (사용자가 직접 「새로고침」할 때 등)."""
+    breaker.clear()
@@ -6,23 +6,34 @@
 데이터·앱 업데이트는 구글 드라이브 또는 GitHub Releases로 가능합니다.
 """
 
+import contextlib
+import hashlib
 import io
 import json
 import os
 import stat
 import subprocess
 import sys
+import threading
 import time
 import webbrowser
 from pathlib import Path
 
-import requests
-import webview
-
-try:
-    from openpyxl import load_workbook
-except ImportError:
-    load_workbook = None
+import perf  # 시간표의 0 ms가 앱 모듈 import 전이 되도록 가장 먼저
+import cache_store
+import catalog_query
+import catalog_store
+import collection_journal
+import data_delta
+import exe_patch
+import freshness
+import http_client
+import records
+import settings_store
+import update_download
+import xlsx_fast
+
+# requests·webview·openpyxl은 무거우므로 처음 쓰는 함수 안에서 import (창이 뜨기 전 시작 시간 단축)
 
 # 앱 버전 (앱 업데이트 확인 시 비교용)
 APP_VERSION = "1.0.4"
@@ -32,44 +43,93 @@ APP_VERSION = "1.0.4"
 def get_resource_dir():
     return Path(getattr(sys, "_MEIPASS", Path(__file__).parent.resolve()))
 
-# 앱 데이터 폴더: C:\Users\<사용자>\Documents\Heartowiki\data
+RESOURCE_DIR = get_resource_dir()
+# 앱 데이터 폴더: C:\Users\<사용자>\Documents\Heartowiki\data (폴더·기본 config 생성은 get_data_dir())
+DATA_DIR = Path.home() / "Documents" / "Heartowiki" / "data"
+
+CONFIG_PATH = DATA_DIR / "config.json"
+COLLECTION_PATH = DATA_DIR / "collection.json"
+COLLECTION_JOURNAL_PATH = DATA_DIR / "collection.journal"  # collection.json 이후의 별·생물 변경 기록
+SETTINGS_PATH = DATA_DIR / "settings.json"
+CACHE_PATH = DATA_DIR / "cache.json"  # 선택: export_cache_json이 true일 때만 씀 (예전 버전 캐시는 읽기만)
+CACHE_BIN_PATH = DATA_DIR / "cache.bin"  # 도감 데이터 캐시 (열 단위 + 문자열 표, cache_store)
+PERF_LOG_PATH = DATA_DIR / "perf.log"  # 선택: perf_log가 true일 때만 씀 (perf.py, 회전)
+HTTP_CACHE_PATH = DATA_DIR / "http_cache.json"  # 마지막 다운로드의 ETag/Last-Modified
+PARSE_CACHE_DIR = DATA_DIR / "parse_cache"  # xlsx 원본 SHA-256별 파싱 결과
+PARSE_CACHE_MAX = 4  # 최근 파싱 결과 보관 개수 (브랜치 전환 대비, 오래된 것부터 삭제)
+PARSE_CACHE_VERSION = 1  # 파싱 결과 형식(시트·열 해석)이 바뀌면 올림. index.json과 다르면 저장된 결과를 모두 버림
+
+
 def get_data_dir() -> Path:
-    data_dir = Path.home() / "Documents" / "Heartowiki" / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
+    """데이터 폴더 준비 (시작 시 한 번 호출). 최초 실행 시 기본 config.json 생성."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
     # 최초 실행 시 config.json 없으면 기본 파일 생성 (GitHub에서 자동으로 도감 데이터 가져옴)
-    config_file = data_dir / "config.json"
-    if not config_file.exists():
+    if not CONFIG_PATH.exists():
         default_config = {
             "github_repo": "lir125/heartowiki",
             "github_data_branch": "main",
             "update_source": "github",
             "update_info_file_id": "",
             "github_update_path": "app_version.json",
+            "github_manifest_path": "manifest.json",
+            "startup_mode": "cache_first",
+            "export_cache_json": False,
         }
-        config_file.write_text(json.dumps(default_config, ensure_ascii=False, indent=2), encoding="utf-8")
-    return data_dir
+        CONFIG_PATH.write_text(json.dumps(default_config, ensure_ascii=False, indent=2), encoding="utf-8")
+    return DATA_DIR
 
-RESOURCE_DIR = get_resource_dir()
-DATA_DIR = get_data_dir()
 
-CONFIG_PATH = DATA_DIR / "config.json"
-COLLECTION_PATH = DATA_DIR / "collection.json"
-SETTINGS_PATH = DATA_DIR / "settings.json"
-CACHE_PATH = DATA_DIR / "cache.json"
+# GitHub raw 파일 주소 (로컬 테스트 서버로 바꿔 끼울 수 있도록 상수로 둠)
+GITHUB_RAW_BASE = "https://raw.githubusercontent.com"
 
 _cached_base = None
 _cached_user = None
 _last_data_error = ""  # 데이터 로드 실패 시 사용자에게 표시할 메시지
+_last_sheet_errors = {}  # 마지막 opensheet 읽기에서 실패한 시트 { 카테고리: 사유 }
+_data_lock = threading.RLock()  # _cached_base 교체·동기 다운로드 직렬화
+_window = None  # pywebview 창 (백그라운드 갱신 결과를 페이지로 전달할 때 사용)
+_collection = None  # CollectionJournal (처음 쓸 때 collection.json + 저널을 읽어 메모리에 둠)
+_settings = None  # SettingsWriter (설정은 메모리에 두고 쓰기 스레드가 모아서 저장)
+_query_index = None  # (도감 데이터, 사용자 생물 revision, CatalogIndex)
+_query_lock = threading.Lock()
+_warming_base = None  # 백그라운드에서 색인을 만들고 있는 도감 데이터 (같은 데이터로 스레드를 또 띄우지 않음)
+_query_results = {}  # 결과 번호(token) → 전체 id 목록 (페이지가 스크롤하며 query_slice로 나눠 받음)
+_query_token = 0
+QUERY_RESULTS_MAX = 8  # 보관할 최근 결과 수
+_manifest = None  # (URL, 받은 시각, manifest.json 내용)
+_manifest_lock = threading.Lock()
+MANIFEST_MAX_AGE = 60  # 초
+_freshness = None  # FreshnessScheduler (주기적인 도감 데이터·앱 버전 확인)
+_prefetched = None  # (미리 받아 파싱한 새 도감 데이터, 그 데이터의 _query_index) — 사용자가 적용하면 그대로 교체
+_freshness_notified = set()  # 이미 페이지에 알린 새 버전 (같은 알림을 반복하지 않음)
 
 
 def load_config() -> dict:
     """데이터 폴더의 config.json 로드."""
+    with perf.span("config.load"):
+        return _read_config()
+
+
+def _read_config() -> dict:
     default = {
         "github_repo": "lir125/heartowiki",
         "github_data_branch": "main",
         "update_source": "github",
         "update_info_file_id": "",
         "github_update_path": "app_version.json",
+        # 앱 버전·다운로드 정보 + 도감 데이터 버전·SHA-256·크기를 담은 파일 (make_manifest.py로 생성). 비우면 사용 안 함
+        "github_manifest_path": "manifest.json",
+        # cache_first: 캐시로 바로 창을 띄우고 백그라운드에서 갱신 / network_first: 받은 뒤 창 표시
+        "startup_mode": "cache_first",
+        # true면 cache.bin과 함께 사람이 읽을 수 있는 cache.json도 저장
+        "export_cache_json": False,
+        # settings.json 저장 간격(초): 이 간격 안의 설정 변경은 한 번에 씀
+        "settings_flush_interval": settings_store.FLUSH_INTERVAL,
+        # 도감 데이터·앱 새 버전 주기 확인 간격(분). 0이면 시작할 때만 확인
+        "freshness_interval_minutes": freshness.INTERVAL / 60,
+        # 단계별 시간 기록 (Api.get_perf_stats). perf_log가 true면 데이터 폴더 perf.log에도 씀
+        "perf_enabled": True,
+        "perf_log": False,
     }
     if not CONFIG_PATH.exists():
         return default
@@ -87,17 +147,171 @@ def load_config() -> dict:
         return default
 
 
-def _fetch_data_from_github(repo: str, branch: str = "main", path: str = "heartowiki.xlsx") -> dict:
-    """GitHub 저장소에서 heartowiki.xlsx 다운로드 후 엑셀 파싱 → 도감 JSON 구조로 반환."""
+def _load_http_cache() -> dict:
+    """http_cache.json 로드: { url: { etag, last_modified [, body] [, data_hash] } }."""
+    if not HTTP_CACHE_PATH.exists():
+        return {}
+    try:
+        with open(HTTP_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _remember_validators(url: str, response, body=None, data_hash: str = "") -> None:
+    """성공한 응답의 ETag/Last-Modified를 저장. body가 있으면 304 때 재사용할 내용도 함께 저장.
+    data_hash: 이 응답으로 만든 도감 데이터의 data_hash (304 때 쓸 캐시가 같은 내용인지 확인용)."""
+    etag = (response.headers.get("ETag") or "").strip()
+    last_modified = (response.headers.get("Last-Modified") or "").strip()
+    cache = _load_http_cache()
+    if not etag and not last_modified:
+        if url not in cache:
+            return
+        cache.pop(url, None)
+    else:
+        entry = {"etag": etag, "last_modified": last_modified}
+        if body is not None:
+            entry["body"] = body
+        if data_hash:
+            entry["data_hash"] = data_hash
+        cache[url] = entry
+    try:
+        with open(HTTP_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except Exception:
+        pass
+
+
+def _conditional_get(url: str, kind: str = "api", headers: dict = None, use_validators: bool = True,
+                     data_hash: str = None):
+    """저장된 검증자로 If-None-Match/If-Modified-Since를 붙여 GET. (응답, 저장된 항목) 반환.
+    data_hash가 주어지면 저장된 항목의 data_hash가 그것과 같을 때만 검증자를 붙임 (다르면 빈 항목)."""
+    headers = dict(headers or {})
+    entry = _load_http_cache().get(url) if use_validators else None
+    entry = entry if isinstance(entry, dict) else {}
+    if data_hash is not None and (not data_hash or entry.get("data_hash") != data_hash):
+        entry = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return http_client.get(url, kind=kind, headers=headers), entry
+
+
+def _get_json_conditional(url: str, kind: str = "api", headers: dict = None) -> dict:
+    """조건부 GET으로 JSON 조회. 304면 지난번에 받은 내용을 그대로 반환."""
+    r, entry = _conditional_get(url, kind, headers)
+    if r.status_code == 304:
+        if isinstance(entry.get("body"), dict):
+            return entry["body"]
+        r, _ = _conditional_get(url, kind, headers, use_validators=False)
+    r.raise_for_status()
+    data = r.json()
+    if isinstance(data, dict):
+        _remember_validators(url, r, body=data)
+    return data
+
+
+def _cache_exists() -> bool:
+    return CACHE_BIN_PATH.exists() or CACHE_PATH.exists()
+
+
+def _read_cache():
+    """도감 데이터 캐시 읽기: cache.bin 우선, 없거나 깨졌으면 cache.json. 둘 다 없으면 None.
+    반환 값은 catalog_store 열 배열 형태 (cache.bin은 행 dict로 풀지 않고 그대로 사용)."""
+    with perf.span("cache.read") as s:
+        data = _read_cache_file()
+        s["found"] = data is not None
+    return data
+
+
+def _read_cache_file():
+    if CACHE_BIN_PATH.exists():
+        try:
+            header, strings, categories = cache_store.load_columns(CACHE_BIN_PATH)
+            return records.ensure(catalog_store.from_columns(strings, categories, header.get("meta")))
+        except Exception:
+            pass
+    if not CACHE_PATH.exists():
+        return None
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return records.ensure(catalog_store.compact(data)) if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+
+def _cached_data_version() -> str:
+    """캐시된 도감 데이터의 data_version (cache.bin은 헤더만 읽음)."""
+    if CACHE_BIN_PATH.exists():
+        try:
+            return str(cache_store.read_header(CACHE_BIN_PATH).get("data_version", "")).strip()
+        except Exception:
+            pass
+    cached = _read_cache()
+    return str(cached.get("data_version", "")).strip() if cached else ""
+
+
+def _cached_data_hash() -> str:
+    """캐시된 도감 데이터의 data_hash (원본 xlsx의 SHA-256). 메모리에 있으면 그것, 아니면 캐시 헤더."""
+    base = _cached_base
+    if isinstance(base, dict) and base.get("data_hash"):
+        return base["data_hash"]
+    if CACHE_BIN_PATH.exists():
+        try:
+            return str(cache_store.read_header(CACHE_BIN_PATH).get("data_hash", ""))
+        except Exception:
+            pass
+    cached = _read_cache()
+    return str(cached.get("data_hash", "")) if cached else ""
+
+
+def _fetch_manifest(config: dict, max_age: float = MANIFEST_MAX_AGE) -> dict:
+    """저장소의 manifest.json: { app: app_version.json과 같은 형식, data: { version, sha256, size, path } }.
+    max_age초 안에 받은 것은 다시 요청하지 않음 (시작할 때 데이터·앱·데이터 버전 확인이 같이 씀). 없거나 실패하면 {}."""
+    global _manifest
+    repo = (config.get("github_repo") or "").strip()
+    path = (config.get("github_manifest_path") or "").strip().lstrip("/")
+    if not path or "/" not in repo:
+        return {}
+    branch = (config.get("github_data_branch") or "main").strip()
+    url = f"{GITHUB_RAW_BASE}/{repo}/{branch}/{path}"
+    with _manifest_lock:
+        if _manifest is not None and _manifest[0] == url and time.monotonic() - _manifest[1] < max_age:
+            return _manifest[2]
+        try:
+            data = _get_json_conditional(url, headers={"Cache-Control": "no-cache"})
+        except Exception:
+            data = {}
+        data = data if isinstance(data, dict) else {}
+        _manifest = (url, time.monotonic(), data)
+        return data
+
+
+def _fetch_data_from_github(repo: str, branch: str = "main", path: str = "heartowiki.xlsx", remember: bool = True) -> dict:
+    """GitHub 저장소에서 heartowiki.xlsx 다운로드 후 엑셀 파싱 → 도감 JSON 구조로 반환.
+    지난번 ETag/Last-Modified로 조건부 요청하여 304면 파싱 없이 캐시(cache.bin)를 그대로 사용.
+    검증자는 URL마다 저장되지만 캐시는 하나뿐이므로, 검증자를 저장할 때의 data_hash가 지금 캐시의 data_hash와
+    같을 때만 조건부로 요청함 (다른 브랜치·경로를 받은 뒤 돌아오면 304로 엉뚱한 데이터를 쓰지 않도록).
+    remember=False면 새 검증자를 저장하지 않음 (미리 받기: 적용하기 전에는 cache.bin이 이전 내용이므로)."""
     if not repo or "/" not in repo:
         raise ValueError("config.json에 github_repo(예: owner/repo)를 넣어 주세요.")
     repo = repo.strip()
     branch = (branch or "main").strip()
     path = (path or "heartowiki.xlsx").strip().lstrip("/")
-    # 캐시 무효화: 새로고침 시 GitHub/CDN 캐시를 피해 최신 xlsx 반영
-    url = f"https://raw.githubusercontent.com/{repo}/{branch}/{path}?t={int(time.time())}"
-    headers = {"User-Agent": "Heartowiki/1.0", "Cache-Control": "no-cache", "Pragma": "no-cache"}
-    r = requests.get(url, timeout=30, headers=headers)
+    url = f"{GITHUB_RAW_BASE}/{repo}/{branch}/{path}"
+    # no-cache: 중간 캐시(CDN)가 원본에 재검증하도록 요청 (변경 없으면 304)
+    headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+    cached_hash = _cached_data_hash() if _cache_exists() else ""
+    r, entry = _conditional_get(url, "data", headers, use_validators=bool(cached_hash), data_hash=cached_hash)
+    if r.status_code == 304:
+        cached = _read_cache()
+        if cached is not None and entry.get("data_hash") and cached.get("data_hash") == entry["data_hash"]:
+            return cached
+        # 캐시가 사라졌거나 그 사이 바뀌었으면 검증자 없이 다시 받음
+        r, _ = _conditional_get(url, "data", headers, use_validators=False)
     if r.status_code == 404:
         raise ValueError(
             f"GitHub에서 파일을 찾을 수 없습니다: {path}\n"
@@ -105,26 +319,32 @@ def _fetch_data_from_github(repo: str, branch: str = "main", path: str = "hearto
         )
     r.raise_for_status()
 
-    # heartowiki.xlsx 다운로드 → 엑셀 파싱 → 도감 JSON 구조로 반환
-    result = _xlsx_to_creatures_data(r.content)
+    # heartowiki.xlsx 다운로드 → 엑셀 파싱(같은 내용이면 파싱 캐시 사용) → 도감 JSON 구조로 반환
+    result = _parse_xlsx_cached(r.content)
     if "data_version" not in result:
         result["data_version"] = "1.0.1"
+    if remember:
+        _remember_validators(url, r, data_hash=result.get("data_hash", ""))
     return result
 
 
 def _get_github_data_version(repo: str, branch: str = "main", path: str = "creatures_data.json") -> str:
-    """GitHub에 올라온 도감 데이터의 data_version 값만 조회 (업데이트 여부 확인용). xlsx는 버전 비교 생략."""
+    """GitHub에 올라온 도감 데이터의 data_version 값만 조회 (업데이트 여부 확인용).
+    xlsx는 Range 요청으로 zip 중앙 디렉터리와 '도감 정보' 시트·공유 문자열 앞부분만 읽음 (xlsx_remote)."""
     if not repo or "/" not in repo:
         return ""
     branch = (branch or "main").strip()
     path = (path or "creatures_data.json").strip().lstrip("/")
+    url = f"{GITHUB_RAW_BASE}/{repo}/{branch}/{path}"
     if path.lower().endswith(".xlsx"):
-        return ""  # xlsx는 버전 필드 없음, 업데이트 알림 생략
-    url = f"https://raw.githubusercontent.com/{repo}/{branch}/{path}"
+        try:
+            import xlsx_remote
+            rows, _ = xlsx_remote.read_sheet_head(url, DATA_INFO_SHEET, rows=2)
+            return _read_data_version(rows)
+        except Exception:
+            return ""
     try:
-        r = requests.get(url, timeout=15)
-        r.raise_for_status()
-        data = r.json()
+        data = _get_json_conditional(url)
         return str(data.get("data_version", "")).strip()
     except Exception:
         return ""
@@ -139,20 +359,49 @@ def _version_tuple(v: str):
         return (0,)
 
 
+def _integrity_fields(data: dict) -> dict:
+    """업데이트 정보의 exe 크기(size)·SHA-256(sha256). 없거나 형식이 틀리면 빈 값 (그때는 확인 생략)."""
+    sha256 = str(data.get("sha256") or "").strip().lower()
+    if len(sha256) != 64 or any(c not in "0123456789abcdef" for c in sha256):
+        sha256 = ""
+    try:
+        size = max(0, int(data.get("size") or 0))
+    except (TypeError, ValueError):
+        size = 0
+    return {"sha256": sha256, "size": size}
+
+
+def _patch_entries(patches) -> list:
+    """업데이트 정보의 패치 목록 [{ from_version, from_sha256, url, size, sha256 }] 중 형식이 맞는 것만."""
+    entries = []
+    for p in patches if isinstance(patches, list) else []:
+        if not isinstance(p, dict) or not p.get("url") or not p.get("from_version") or not p.get("from_sha256"):
+            continue
+        entries.append({
+            "from_version": str(p["from_version"]).strip().lstrip("v"),
+            "from_sha256": str(p["from_sha256"]).strip().lower(),
+            "url": str(p["url"]).strip(),
+            **_integrity_fields(p),
+        })
+    return entries
+
+
 def _check_update_github_file(repo: str, branch: str, path: str) -> dict:
     """GitHub 저장소의 버전 파일(JSON)에서 버전 확인. path 예: app_version.json."""
     if not repo or "/" not in repo:
         return {"hasUpdate": False}
     branch = (branch or "main").strip()
     path = (path or "app_version.json").strip().lstrip("/")
-    url = f"https://raw.githubusercontent.com/{repo.strip()}/{branch}/{path}"
+    url = f"{GITHUB_RAW_BASE}/{repo.strip()}/{branch}/{path}"
     try:
-        r = requests.get(url, timeout=15, headers={"User-Agent": "Heartowiki/1.0"})
-        r.raise_for_status()
-        data = r.json()
+        data = _get_json_conditional(url)
     except Exception:
         return {"hasUpdate": False}
+    return _app_update_from_info(data)
+
 
+def _app_update_from_info(data: dict) -> dict:
+    """app_version.json 형식(manifest.json의 app도 같음)의 업데이트 정보 → check_app_update 결과."""
     remote_version = (data.get("version") or "").strip().lstrip("v")
     if not remote_version:
         return {"hasUpdate": False}
@@ -170,6 +419,8 @@ def _check_update_github_file(repo: str, branch: str, path: str) -> dict:
         "message": message,
         "download_url": download_url,
         "exe_file_id": "",
+        **_integrity_fields(data),
+        "patches": _patch_entries(data.get("patches")),
     }
 
 
@@ -184,7 +435,7 @@ def _check_update_github(repo: str, config: dict) -> dict:
         return {"hasUpdate": False}
     try:
         url = f"https://api.github.com/repos/{repo.strip()}/releases/latest"
-        r = requests.get(url, timeout=15, headers={"Accept": "application/vnd.github.v3+json"})
+        r = http_client.get(url, headers={"Accept": "application/vnd.github.v3+json"})
         r.raise_for_status()
         data = r.json()
     except Exception:
@@ -198,22 +449,27 @@ def _check_update_github(repo: str, config: dict) -> dict:
 
     assets = data.get("assets") or []
     download_url = ""
+    asset = {}
     for a in assets:
         if a.get("content_type") == "application/x-msdownload" or (a.get("name") or "").endswith(".exe"):
-            download_url = (a.get("browser_download_url") or "").strip()
+            asset = a
             break
-    if not download_url and assets:
-        download_url = (assets[0].get("browser_download_url") or "").strip()
+    if not asset and assets:
+        asset = assets[0]
+    download_url = (asset.get("browser_download_url") or "").strip()
     if not download_url:
         return {"hasUpdate": False}
 
     body = (data.get("body") or "").strip() or "새 버전이 있습니다."
+    # Releases 자산의 digest는 "sha256:..." 형식
+    digest = (asset.get("digest") or "").strip()
     return {
         "hasUpdate": True,
         "version": tag,
         "message": body,
         "download_url": download_url,
         "exe_file_id": "",
+        **_integrity_fields({"size": asset.get("size"), "sha256": digest[7:] if digest.startswith("sha256:") else ""}),
     }
 
 
@@ -223,11 +479,10 @@ def _check_update_google_drive(file_id: str) -> dict:
         return {"hasUpdate": False}
     try:
         url = f"https://drive.google.com/uc?export=download&id={file_id}"
-        session = requests.Session()
-        response = session.get(url, timeout=15)
+        response = http_client.get(url)
         for key, value in response.cookies.items():
             if key.startswith("download_warning"):
-                response = session.get(url, params={"confirm": value}, timeout=15)
+                response = http_client.get(url, params={"confirm": value})
                 break
         response.raise_for_status()
         data = response.json()
@@ -247,6 +502,8 @@ def _check_update_google_drive(file_id: str) -> dict:
         "message": message,
         "download_url": "",
         "exe_file_id": exe_file_id,
+        **_integrity_fields(data),
+        "patches": _patch_entries(data.get("patches")),
     }
 
 
@@ -255,52 +512,97 @@ def check_app_update() -> dict:
     config = load_config()
     source = (config.get("update_source") or "google_drive").strip().lower()
     if source == "github":
+        # 매니페스트가 있으면 그 안의 앱 정보 사용 (도감 데이터 확인과 같은 요청 하나로)
+        app_info = _fetch_manifest(config).get("app")
+        if isinstance(app_info, dict) and app_info.get("version"):
+            return _app_update_from_info(app_info)
         repo = (config.get("github_repo") or "").strip()
         return _check_update_github(repo, config)
     file_id = (config.get("update_info_file_id") or "").strip()
     return _check_update_google_drive(file_id)
 
 
-def _download_exe_to_path(download_url: str, save_path: Path) -> bool:
-    """URL에서 exe 다운로드하여 save_path에 저장. 성공 시 True."""
+def _push_update_progress(done: int, total: int, rate: float, eta) -> None:
+    _push_to_page("onUpdateProgress", {"done": done, "total": total, "rate": rate, "eta": eta})
+
+
+def _download_exe_to_path(download_url: str, save_path: Path, size: int = 0, sha256: str = "") -> bool:
+    """URL에서 exe 다운로드하여 save_path에 저장 (이어받기, 크기·SHA-256 확인, 진행 상황을 페이지로). 성공 시 True."""
     try:
-        r = requests.get(download_url, timeout=120, stream=True)
-        r.raise_for_status()
-        with open(save_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        update_download.download(download_url, save_path, size, sha256, progress=_push_update_progress)
         return True
     except Exception:
         return False
 
 
-def _download_exe_from_drive(file_id: str, save_path: Path) -> bool:
+def _download_exe_from_drive(file_id: str, save_path: Path, size: int = 0, sha256: str = "") -> bool:
     """구글 드라이브에서 exe 다운로드하여 save_path에 저장."""
     try:
         url = f"https://drive.google.com/uc?export=download&id={file_id}"
-        session = requests.Session()
-        response = session.get(url, timeout=120, stream=True)
+        params = None
+        # 큰 파일은 바이러스 검사 경고 쿠키의 confirm 값을 붙여야 실제 파일이 옴
+        response = http_client.get(url, kind="download", stream=True)
         for key, value in response.cookies.items():
             if key.startswith("download_warning"):
-                response = session.get(url, params={"confirm": value}, timeout=120, stream=True)
+                params = {"confirm": value}
                 break
-        response.raise_for_status()
-        with open(save_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        response.close()
+        update_download.download(url, save_path, size, sha256, progress=_push_update_progress, params=params)
+        return True
+    except Exception:
+        return False
+
+
+def _patch_path(exe_path: Path, new_path: Path) -> Path:
+    return new_path.with_name(exe_path.stem + "_new.patch")
+
+
+def _update_by_patch(patches: list, exe_path: Path, new_path: Path, sha256: str) -> bool:
+    """현재 버전용 패치가 있으면 받아 현재 exe에 적용해 new_path를 만듦. 결과 해시까지 맞으면 True.
+    패치가 없거나 현재 exe가 패치의 원본과 다르거나 어디서든 실패하면 False (호출한 쪽이 전체 다운로드).
+    패치 파일은 적용했거나 형식·해시가 맞지 않을 때만 지움 (받다 끊겼으면 다음에 이어받음).
+    적용 결과는 임시 파일에 쓰고, 성공한 뒤에만 new_path(받다 만 전체 exe가 있을 수 있음)를 교체."""
+    entry = next((p for p in patches or [] if p.get("from_version") == APP_VERSION), None)
+    if entry is None or not sha256:
+        return False
+    patch_path = _patch_path(exe_path, new_path)
+    tmp_path = new_path.with_name(new_path.name + ".patching")
+    try:
+        source = exe_path.read_bytes()
+        if hashlib.sha256(source).hexdigest() != entry["from_sha256"]:
+            return False
+        # 크기·해시가 다르면 download가 지우고 ValueError, 연결이 끊기면 받은 부분과 이어받기 정보를 남김
+        update_download.download(entry["url"], patch_path, entry.get("size", 0), entry.get("sha256", ""),
+                                 progress=_push_update_progress)
+        patch = patch_path.read_bytes()
+        try:
+            header, _ = exe_patch.read_header(patch)
+            if header.get("target_sha256") != sha256:
+                raise ValueError("패치 결과가 새 버전과 다릅니다.")
+            with open(tmp_path, "wb") as f:
+                exe_patch.apply_patch(source, patch, f)
+        except ValueError:
+            update_download.discard(patch_path)  # 맞지 않는 패치는 다시 받아도 같으므로 버림
+            raise
+        update_download.discard(new_path)  # 전체 다운로드를 받다 만 파일이 있으면 버림
+        os.replace(tmp_path, new_path)
+        update_download.discard(patch_path)
         return True
     except Exception:
         return False
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
-def apply_update(download_url: str = "", drive_file_id: str = "") -> dict:
+def apply_update(download_url: str = "", drive_file_id: str = "", sha256: str = "", size: int = 0, patches=None) -> dict:
     """
     새 exe를 다운로드한 뒤, 실행 중인 exe를 같은 경로·같은 파일 이름으로 교체하고 재시작.
     (사용자가 바탕화면에서 '두타위키.exe'로 실행했다면, 업데이트 후에도 같은 위치 같은 이름으로 유지)
     - download_url: GitHub 등 직접 다운로드 URL (우선)
     - drive_file_id: 구글 드라이브 파일 ID
+    - sha256, size: 업데이트 정보(app_version.json 등)에 있으면 교체 전에 받은 파일과 비교 (다르면 교체하지 않음)
+    - patches: 이전 버전별 바이너리 패치 목록. 현재 버전용이 있으면 패치만 받아 적용하고, 실패하면 전체 다운로드
+    끊긴 다운로드는 다음에 다시 누르면 이어받음. 진행 상황은 window.onUpdateProgress로 전달.
     반환: { success: bool, error: str 또는 빈 문자열 }
     exe가 아닌 상태(스크립트 실행)에서는 success=False, 브라우저로 열기만 안내.
     """
@@ -316,15 +618,18 @@ def apply_update(download_url: str = "", drive_file_id: str = "") -> dict:
     exe_dir = exe_path.parent
     new_path = exe_dir / (exe_path.stem + "_new" + exe_path.suffix)
 
-    if download_url:
-        ok = _download_exe_to_path(download_url, new_path)
+    if _update_by_patch(patches, exe_path, new_path, sha256):
+        ok = True
+    elif download_url:
+        ok = _download_exe_to_path(download_url, new_path, size, sha256)
     elif drive_file_id:
-        ok = _download_exe_from_drive(drive_file_id, new_path)
+        ok = _download_exe_from_drive(drive_file_id, new_path, size, sha256)
     else:
         return {"success": False, "error": "다운로드 경로가 없습니다."}
 
     if not ok or not new_path.exists():
-        return {"success": False, "error": "다운로드에 실패했습니다."}
+        return {"success": False, "error": "다운로드에 실패했거나 받은 파일이 올바르지 않습니다. 다시 누르면 이어받습니다."}
+    update_download.discard(_patch_path(exe_path, new_path))  # 전체 다운로드로 받았으면 받다 만 패치는 필요 없음
 
     # 배치: 프로세스 종료 → 원본을 _old로 변경 → 새 exe를 원래 이름으로 변경 → _old 삭제 (사용자가 직접 다시 실행)
     pid = os.getpid()
@@ -359,6 +664,8 @@ exit
 
 def exit_app() -> None:
     """앱 종료 (업데이트 적용 후 호출)."""
+    close_collection()
+    close_settings()
     sys.exit(0)
 
 
@@ -367,6 +674,88 @@ def open_download_url(url: str) -> None:
     webbrowser.open(url)
 
 
+# 엑셀/시트 스키마: 카테고리별 시트 이름 후보, 출력 필드와 열 이름 후보.
+# - sheets: 시트 이름 후보 (앞에서부터 먼저 있는 시트 사용)
+# - match_category: 후보가 없을 때 이름에 카테고리명이 들어간 시트도 사용
+# - opensheet: opensheet.elk.sh 시트 번호 (1=도감 정보)
+# - fields: (출력 필드, 열 이름 후보). 후보가 None이면 항상 빈 문자열. 첫 필드(명칭)가 비면 행 건너뜀
+# 새 카테고리 시트는 여기에 항목만 추가하면 됨.
+DATA_INFO_SHEET = "도감 정보"  # 도감 버전, 마지막 업데이트
+SHEET_SCHEMAS = (
+    {
+        "category": "어류",
+        "sheets": ("어류 관찰", "어류"),
+        "match_category": False,
+        "opensheet": 2,
+        "fields": (
+            ("명칭", ("이름", "명칭")),
+            ("지역", ("위치", "지역")),
+            ("세부지역", None),
+            ("레벨", ("레벨",)),
+            ("날씨영향", ("날씨",)),
+            ("이미지", None),
+            ("크기", ("크기",)),
+            ("가격", ("가격",)),
+            ("시간대", ("시간대",)),
+            ("비고", ("비고",)),
+        ),
+    },
+    {
+        "category": "조류",
+        "sheets": ("새 관찰 일지", "조류", "새"),
+        "match_category": True,
+        "opensheet": 3,
+        "fields": (
+            ("명칭", ("이름", "명칭")),
+            ("지역", ("위치", "지역")),
+            ("세부지역", ("세부위치",)),
+            ("레벨", ("레벨",)),
+            ("날씨영향", ("날씨", "날씨영향")),
+            ("이미지", ("이미지",)),
+            ("시간대", ("시간대",)),
+            ("비고", None),
+        ),
+    },
+    {
+        "category": "곤충",
+        "sheets": ("곤충 이야기", "곤충"),
+        "match_category": True,
+        "opensheet": 4,
+        "fields": (
+            ("명칭", ("이름", "명칭")),
+            ("지역", ("위치", "지역")),
+            ("세부지역", ("세부위치",)),
+            ("레벨", ("레벨",)),
+            ("날씨영향", ("날씨", "날씨영향")),
+            ("이미지", ("이미지",)),
+            ("시간대", ("시간대",)),
+            ("비고", None),
+        ),
+    },
+    {
+        "category": "요리",
+        "sheets": ("미식 라이프",),
+        "match_category": False,
+        "opensheet": 5,
+        "fields": (
+            ("명칭", ("이름", "명칭")),
+            ("레벨", ("레벨",)),
+            ("재료", ("재료",)),
+            ("레시피", ("레시피",)),
+            ("가격", ("가격",)),
+            ("비고", ("비고",)),
+        ),
+    },
+)
+
+
+CATEGORIES = ("어류", "곤충", "조류", "요리")  # 도감 데이터의 카테고리 순서
+
+
+def _empty_base() -> dict:
+    return {category: [] for category in CATEGORIES}
+
+
 def _val(row: tuple, idx: int) -> str:
     if idx < 0 or idx >= len(row):
         return ""
@@ -374,244 +763,267 @@ def _val(row: tuple, idx: int) -> str:
     return str(v).strip() if v is not None else ""
 
 
-def _xlsx_to_creatures_data(raw: bytes) -> dict:
-    """엑셀 바이트를 도감 형식 { 어류, 곤충, 조류, 요리 [, data_version ] } 로 변환.
-    시트: 도감 정보(도감 버전, 마지막 업데이트), 어류 관찰(이름,레벨,위치,크기,가격,시간대,날씨,비고),
-    새/곤충(이름,레벨,위치,세부위치,시간대,날씨), 미식 라이프(이름,레벨,재료,레시피,가격,비고).
-    """
-    if load_workbook is None:
-        raise ValueError("엑셀 파일을 읽으려면 openpyxl 패키지가 필요합니다.")
-    wb = load_workbook(io.BytesIO(raw), read_only=True, data_only=True)
-    result = {"어류": [], "곤충": [], "조류": [], "요리": []}
-
-    # 도감 정보: 도감 버전, 마지막 업데이트 (있으면 data_version 설정)
-    if "도감 정보" in wb.sheetnames:
-        ws_info = wb["도감 정보"]
-        rows_info = list(ws_info.iter_rows(values_only=True))
-        if rows_info:
-            first_info = [str(c).strip() if c is not None else "" for c in rows_info[0]]
-            i_ver = -1
-            for i, c in enumerate(first_info):
-                if (c or "").strip() == "도감 버전":
-                    i_ver = i
-                    break
-            if i_ver >= 0 and len(rows_info) > 1:
-                ver_val = rows_info[1][i_ver] if i_ver < len(rows_info[1]) else None
-                if ver_val is not None and str(ver_val).strip():
-                    result["data_version"] = str(ver_val).strip()
-
-    def col_index(first_row: list, name: str) -> int:
-        for i, c in enumerate(first_row):
-            if (c or "").strip() == name:
-                return i
-        return -1
-
-    def col_index_any(first_row: list, names: list) -> int:
-        for n in names:
-            i = col_index(first_row, n)
-            if i >= 0:
-                return i
-        return -1
-
-    # 어류 관찰: 이름/명칭, 레벨, 위치/지역, 크기, 가격, 시간대, 날씨, 비고
-    for sheet_candidate in ("어류 관찰", "어류"):
-        if sheet_candidate not in wb.sheetnames:
-            continue
-        ws = wb[sheet_candidate]
-        rows = list(ws.iter_rows(values_only=True))
-        if not rows:
-            break
-        first = [str(c).strip() if c is not None else "" for c in rows[0]]
-        i_name = col_index_any(first, ["이름", "명칭"])
-        if i_name < 0:
-            break
-        i_level = col_index(first, "레벨")
-        i_loc = col_index_any(first, ["위치", "지역"])
-        i_size = col_index(first, "크기")
-        i_price = col_index(first, "가격")
-        i_time = col_index(first, "시간대")
-        i_weather = col_index(first, "날씨")
-        i_note = col_index(first, "비고")
-        for row in rows[1:]:
-            name = _val(row, i_name)
-            if not name:
-                continue
-            result["어류"].append({
-                "명칭": name,
-                "지역": _val(row, i_loc),
-                "세부지역": "",
-                "레벨": _val(row, i_level),
-                "날씨영향": _val(row, i_weather),
-                "이미지": "",
-                "크기": _val(row, i_size),
-                "가격": _val(row, i_price),
-                "시간대": _val(row, i_time),
-                "비고": _val(row, i_note),
-            })
-        break
-
-    # 새 관찰 일지 / 곤충 이야기: 이름, 레벨, 위치, 세부위치, 시간대, 날씨
-    category_sheets = [("조류", ("새 관찰 일지", "조류", "새")), ("곤충", ("곤충 이야기", "곤충"))]
-    for category, sheet_names in category_sheets:
-        ws = None
-        for sn in sheet_names:
-            if sn in wb.sheetnames:
-                ws = wb[sn]
+def _compile_columns(header: tuple, fields: tuple) -> list:
+    """헤더 행에서 필드별 열 번호를 시트당 한 번만 계산: [(출력 필드, 열 번호 또는 -1)]."""
+    first = [str(c).strip() if c is not None else "" for c in header]
+    compiled = []
+    for field, aliases in fields:
+        idx = -1
+        for alias in aliases or ():
+            if alias in first:
+                idx = first.index(alias)
                 break
-        if ws is None:
-            for name in wb.sheetnames:
-                if category in (name or ""):
-                    ws = wb[name]
-                    break
-        if ws is None:
-            continue
-        rows = list(ws.iter_rows(values_only=True))
-        if not rows:
-            continue
-        first = [str(c).strip() if c is not None else "" for c in rows[0]]
-        i_name = col_index_any(first, ["이름", "명칭"])
-        if i_name < 0:
+        compiled.append((field, idx))
+    return compiled
+
+
+def _iter_sheet_records(rows, schema: dict):
+    """행 iterator(첫 행 = 헤더)를 스키마대로 레코드 dict로 하나씩 변환. 한 번에 한 행만 다룸."""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    columns = _compile_columns(header, schema["fields"])
+    name_idx = columns[0][1]
+    if name_idx < 0:
+        return
+    for row in rows:
+        if not _val(row, name_idx):
             continue
-        i_level = col_index(first, "레벨")
-        i_loc = col_index_any(first, ["위치", "지역"])
-        i_sub = col_index(first, "세부위치")
-        i_time = col_index(first, "시간대")
-        i_weather = col_index_any(first, ["날씨", "날씨영향"])
-        i_img = col_index(first, "이미지")
-        for row in rows[1:]:
-            name = _val(row, i_name)
-            if not name:
-                continue
-            result[category].append({
-                "명칭": name,
-                "지역": _val(row, i_loc),
-                "세부지역": _val(row, i_sub),
-                "레벨": _val(row, i_level),
-                "날씨영향": _val(row, i_weather),
-                "이미지": _val(row, i_img) if i_img >= 0 else "",
-                "시간대": _val(row, i_time),
-                "비고": "",
-            })
-
-    # 미식 라이프: 이름/명칭, 레벨, 재료, 레시피, 가격, 비고
-    if "미식 라이프" in wb.sheetnames:
-        ws = wb["미식 라이프"]
-        rows = list(ws.iter_rows(values_only=True))
-        if rows:
-            first = [str(c).strip() if c is not None else "" for c in rows[0]]
-            i_name = col_index_any(first, ["이름", "명칭"])
-            i_level = col_index(first, "레벨")
-            i_ing = col_index(first, "재료")
-            i_recipe = col_index(first, "레시피")
-            i_price = col_index(first, "가격")
-            i_note = col_index(first, "비고")
-            if i_name >= 0:
-                for row in rows[1:]:
-                    name = _val(row, i_name)
-                    if not name:
-                        continue
-                    result["요리"].append({
-                        "명칭": name,
-                        "레벨": _val(row, i_level) if i_level >= 0 else "",
-                        "재료": _val(row, i_ing),
-                        "레시피": _val(row, i_recipe),
-                        "가격": _val(row, i_price),
-                        "비고": _val(row, i_note),
-                    })
-
-    wb.close()
-    return result
+        yield {field: _val(row, idx) for field, idx in columns}
+
+
+def _find_schema_sheet(sheetnames: list, schema: dict):
+    """스키마에 맞는 시트 이름. 없으면 None."""
+    for name in schema["sheets"]:
+        if name in sheetnames:
+            return name
+    if schema["match_category"]:
+        for name in sheetnames:
+            if schema["category"] in (name or ""):
+                return name
+    return None
+
+
+def _read_data_version(rows) -> str:
+    """도감 정보 시트의 '도감 버전' 값 (헤더 다음 첫 행)."""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return ""
+    (_, i_ver), = _compile_columns(header, (("data_version", ("도감 버전",)),))
+    if i_ver < 0:
+        return ""
+    return _val(next(rows, ()), i_ver)
 
 
-def _fetch_opensheet(spreadsheet_id: str) -> dict:
-    """opensheet.elk.sh API로 공유된 Google Sheets를 JSON으로 읽기. 로그인 불필요.
-    시트는 '링크가 있는 모든 사용자(보기)'로 공유되어 있어야 함.
-    시트 순서: 1=도감정보, 2=어류 관찰, 3=새 관찰 일지, 4=곤충 이야기, 5=미식 라이프
+def _records_from_sheets(sheetnames: list, iter_rows) -> dict:
+    """시트 이름 목록과 iter_rows(시트 이름) → 행 iterator 로 도감 구조 생성."""
+    result = _empty_base()
+    # 도감 정보: 도감 버전, 마지막 업데이트 (있으면 data_version 설정)
+    if DATA_INFO_SHEET in sheetnames:
+        version = _read_data_version(iter_rows(DATA_INFO_SHEET))
+        if version:
+            result["data_version"] = version
+    for schema in SHEET_SCHEMAS:
+        name = _find_schema_sheet(sheetnames, schema)
+        if name is not None:
+            with perf.span("xlsx.sheet", sheet=name) as s:
+                rows = result[schema["category"]]
+                rows.extend(_iter_sheet_records(iter_rows(name), schema))
+                s["rows"] = len(rows)
+    with perf.span("xlsx.derive"):
+        return records.attach(result)
+
+
+def _xlsx_to_creatures_data(raw: bytes) -> dict:
+    """엑셀 바이트를 도감 형식 { 어류, 곤충, 조류, 요리 [, data_version ], derived } 로 변환 (derived: records.attach).
+    시트·열 구성은 SHEET_SCHEMAS 참고. 먼저 xlsx_fast(zip+XML 스트리밍)로 읽고,
+    빠른 경로가 처리하지 못하는 통합문서만 openpyxl read_only로 다시 읽음.
     """
-    base = "https://opensheet.elk.sh"
-    result = {"어류": [], "곤충": [], "조류": [], "요리": []}
+    with perf.span("xlsx.parse", bytes=len(raw)) as s:
+        try:
+            with xlsx_fast.FastWorkbook(raw) as wb:
+                s["reader"] = "xlsx_fast"
+                return _records_from_sheets(wb.sheetnames, wb.iter_rows)
+        except Exception:
+            pass
+        s["reader"] = "openpyxl"
+        return _xlsx_to_creatures_data_openpyxl(raw)
 
-    def row_get(row: dict, key: str) -> str:
-        v = row.get(key)
-        return str(v).strip() if v is not None else ""
 
-    # 시트 2 = 어류 관찰 (이름, 레벨, 위치, 크기, 가격, 시간대, 날씨, 비고)
+def _xlsx_to_creatures_data_openpyxl(raw: bytes) -> dict:
+    """openpyxl read_only로 엑셀 바이트를 도감 형식으로 변환 (빠른 경로 실패 시 사용)."""
     try:
-        r = requests.get(f"{base}/{spreadsheet_id}/2", timeout=15)
-        r.raise_for_status()
-        rows = r.json()
-        for row in (rows or []):
-            name = row_get(row, "이름")
-            if not name:
-                continue
-            result["어류"].append({
-                "명칭": name,
-                "지역": row_get(row, "위치"),
-                "세부지역": "",
-                "레벨": row_get(row, "레벨"),
-                "날씨영향": row_get(row, "날씨"),
-                "이미지": "",
-                "크기": row_get(row, "크기"),
-                "가격": row_get(row, "가격"),
-                "시간대": row_get(row, "시간대"),
-                "비고": row_get(row, "비고"),
-            })
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("엑셀 파일을 읽으려면 openpyxl 패키지가 필요합니다.")
+    wb = load_workbook(io.BytesIO(raw), read_only=True, data_only=True)
+    try:
+        return _records_from_sheets(wb.sheetnames, lambda name: wb[name].iter_rows(values_only=True))
+    finally:
+        wb.close()
+
+
+def _load_parse_cache_index() -> dict:
+    """parse_cache/index.json 로드: { version, order: [해시, ...(최근 사용이 끝)], written: 캐시(cache.bin)에 쓴 해시 }.
+    version이 PARSE_CACHE_VERSION과 다르면(이전 파서가 만든 결과) 저장된 결과 파일을 지우고 빈 목록으로 시작."""
+    index = None
+    try:
+        with open(PARSE_CACHE_DIR / "index.json", "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except Exception:
+        pass
+    if isinstance(index, dict) and isinstance(index.get("order"), list):
+        if index.get("version") == PARSE_CACHE_VERSION:
+            return index
+        for digest in index["order"]:
+            if isinstance(digest, str) and digest.isalnum():
+                try:
+                    (PARSE_CACHE_DIR / f"{digest}.json").unlink()
+                except OSError:
+                    pass
+    return {"version": PARSE_CACHE_VERSION, "order": [], "written": ""}
+
+
+def _save_parse_cache_index(index: dict) -> None:
+    try:
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(PARSE_CACHE_DIR / "index.json", "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
     except Exception:
         pass
 
-    # 시트 3 = 새 관찰 일지, 4 = 곤충 이야기 (이름, 레벨, 위치, 세부위치, 시간대, 날씨)
-    for sheet_num, category in [(3, "조류"), (4, "곤충")]:
+
+def _parse_xlsx_cached(raw: bytes) -> dict:
+    """엑셀 바이트의 SHA-256으로 파싱 결과를 캐시. 같은 바이트면 파싱 없이 저장된 결과 반환.
+    결과에는 data_hash(원본 해시)가 들어가며, 최근 PARSE_CACHE_MAX개만 LRU로 유지."""
+    digest = hashlib.sha256(raw).hexdigest()
+    index = _load_parse_cache_index()
+    order = [h for h in index["order"] if isinstance(h, str)]
+    entry_path = PARSE_CACHE_DIR / f"{digest}.json"
+    if digest in order:
         try:
-            r = requests.get(f"{base}/{spreadsheet_id}/{sheet_num}", timeout=15)
-            r.raise_for_status()
-            rows = r.json()
-            for row in (rows or []):
-                name = row_get(row, "이름")
-                if not name:
-                    continue
-                result[category].append({
-                    "명칭": name,
-                    "지역": row_get(row, "위치"),
-                    "세부지역": row_get(row, "세부위치"),
-                    "레벨": row_get(row, "레벨"),
-                    "날씨영향": row_get(row, "날씨"),
-                    "이미지": "",
-                    "시간대": row_get(row, "시간대"),
-                    "비고": "",
-                })
+            with open(entry_path, "r", encoding="utf-8") as f:
+                result = records.ensure(json.load(f))
+            if order[-1] != digest:
+                order.remove(digest)
+                order.append(digest)
+                index["order"] = order
+                _save_parse_cache_index(index)
+            return result
         except Exception:
-            pass
+            order.remove(digest)
 
-    # 시트 5 = 미식 라이프 (이름, 레벨, 재료, 레시피, 가격, 비고)
+    result = _xlsx_to_creatures_data(raw)
+    result["data_hash"] = digest
     try:
-        r = requests.get(f"{base}/{spreadsheet_id}/5", timeout=15)
-        r.raise_for_status()
-        rows = r.json()
-        for row in (rows or []):
-            name = row_get(row, "이름")
-            if not name:
-                continue
-            result["요리"].append({
-                "명칭": name,
-                "레벨": row_get(row, "레벨"),
-                "재료": row_get(row, "재료"),
-                "레시피": row_get(row, "레시피"),
-                "가격": row_get(row, "가격"),
-                "비고": row_get(row, "비고"),
-            })
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(entry_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        order.append(digest)
+        while len(order) > PARSE_CACHE_MAX:
+            old = order.pop(0)
+            try:
+                (PARSE_CACHE_DIR / f"{old}.json").unlink()
+            except OSError:
+                pass
+        index["order"] = order
+        _save_parse_cache_index(index)
     except Exception:
         pass
+    return result
+
+
+def _write_cache(data: dict) -> None:
+    """도감 데이터 캐시 저장 (cache.bin, export_cache_json이면 cache.json도). 같은 data_hash면 다시 쓰지 않음."""
+    digest = data.get("data_hash", "") if isinstance(data, dict) else ""
+    index = _load_parse_cache_index()
+    up_to_date = bool(digest) and index.get("written") == digest
+    export_json = bool(load_config().get("export_cache_json"))
+    if not (up_to_date and CACHE_BIN_PATH.exists()):
+        try:
+            with perf.span("cache.write", file="cache.bin") as s:
+                cache_store.dump(data, CACHE_BIN_PATH)
+                s["bytes"] = CACHE_BIN_PATH.stat().st_size
+        except ValueError:
+            # 문자열이 아닌 값이 있는 데이터(드라이브 JSON 등)는 cache.json으로만 저장
+            if CACHE_BIN_PATH.exists():
+                CACHE_BIN_PATH.unlink()
+            export_json = True
+            up_to_date = False
+    if export_json and not (up_to_date and CACHE_PATH.exists()):
+        with perf.span("cache.write", file="cache.json"):
+            with open(CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(catalog_store.plain(data), f, ensure_ascii=False, indent=2)
+    if digest:
+        index["written"] = digest
+        _save_parse_cache_index(index)
+
+
+def _iter_json_records(rows, schema: dict):
+    """opensheet JSON 행(dict)들을 스키마대로 레코드 dict로 변환."""
+    name_field = schema["fields"][0][0]
+    for row in rows:
+        record = {}
+        for field, aliases in schema["fields"]:
+            v = next((row[a] for a in aliases or () if row.get(a) is not None), None)
+            record[field] = str(v).strip() if v is not None else ""
+        if record[name_field]:
+            yield record
+
+
+OPENSHEET_BASE = "https://opensheet.elk.sh"
+OPENSHEET_DEADLINE = 20  # 초: 전체 시트를 기다리는 최대 시간 (넘으면 받은 시트만 사용)
+
+
+def _fetch_opensheet(spreadsheet_id: str, base: str = OPENSHEET_BASE, deadline: float = OPENSHEET_DEADLINE) -> dict:
+    """opensheet.elk.sh API로 공유된 Google Sheets를 JSON으로 읽기. 로그인 불필요.
+    시트는 '링크가 있는 모든 사용자(보기)'로 공유되어 있어야 함.
+    시트 순서: 1=도감정보, 2=어류 관찰, 3=새 관찰 일지, 4=곤충 이야기, 5=미식 라이프 (SHEET_SCHEMAS의 opensheet)
+    시트들은 공용 세션(http_client, 연결 재사용)으로 동시에 요청하고, 도착하는 대로 합침. 전체가 deadline을 넘으면 받은 시트만 사용.
+    시트별 실패 사유는 _last_sheet_errors에 남김 (모두 실패하면 사유를 담아 ValueError).
+    """
+    global _last_sheet_errors
+    from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+    result = _empty_base()
+    errors = {}
+
+    def fetch(schema):
+        r = http_client.get(f"{base}/{spreadsheet_id}/{schema['opensheet']}")
+        r.raise_for_status()
+        return list(_iter_json_records(r.json() or [], schema))
 
-    total = len(result["어류"]) + len(result["곤충"]) + len(result["조류"]) + len(result["요리"])
+    pool = ThreadPoolExecutor(max_workers=len(SHEET_SCHEMAS), thread_name_prefix="opensheet")
+    futures = {pool.submit(fetch, schema): schema for schema in SHEET_SCHEMAS}
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            schema = futures[future]
+            try:
+                result[schema["category"]].extend(future.result())
+            except Exception as e:
+                errors[schema["category"]] = str(e) or type(e).__name__
+    except FuturesTimeout:
+        for future, schema in futures.items():
+            if not future.done():
+                errors[schema["category"]] = f"{deadline:g}초 안에 응답 없음"
+    finally:
+        # 늦은 요청은 기다리지 않음 (요청별 timeout이 지나면 스레드도 끝남)
+        pool.shutdown(wait=False, cancel_futures=True)
+    _last_sheet_errors = errors
+
+    total = sum(len(v) for v in result.values())
     if total == 0:
-        raise ValueError("opensheet에서 데이터를 가져오지 못했습니다. 시트를 '링크가 있는 모든 사용자(보기)'로 공유했는지 확인하세요.")
-    return result
+        detail = ", ".join(f"{cat}: {msg}" for cat, msg in errors.items())
+        raise ValueError("opensheet에서 데이터를 가져오지 못했습니다. 시트를 '링크가 있는 모든 사용자(보기)'로 공유했는지 확인하세요."
+                         + (f" ({detail})" if detail else ""))
+    return records.attach(result)
 
 
 def _download_google_sheets_xlsx(spreadsheet_id: str) -> bytes:
     """Google Sheets를 xlsx로 내보내기 URL로 다운로드. 시트가 '링크가 있는 모든 사용자'로 공유되어 있어야 함."""
     url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=xlsx"
-    r = requests.get(url, timeout=30, allow_redirects=True)
+    r = http_client.get(url, kind="data", allow_redirects=True)
     r.raise_for_status()
     raw = r.content
     if raw[:2] != b"PK":
@@ -622,7 +1034,7 @@ def _download_google_sheets_xlsx(spreadsheet_id: str) -> bytes:
 def download_from_google_drive(file_id: str) -> dict:
     """구글 드라이브 파일 또는 Google Sheets(스프레드시트)에서 도감 데이터 다운로드. JSON/엑셀 지원."""
     if not file_id or file_id == "YOUR_GOOGLE_DRIVE_FILE_ID":
-        return {"어류": [], "곤충": [], "조류": [], "요리": []}
+        return _empty_base()
 
     # 스프레드시트 ID면 opensheet를 먼저 시도 (Drive URL은 시트에 대해 403 낼 수 있음)
     try:
@@ -633,14 +1045,13 @@ def download_from_google_drive(file_id: str) -> dict:
         pass
 
     url = f"https://drive.google.com/uc?export=download&id={file_id}"
-    session = requests.Session()
     try:
-        response = session.get(url, timeout=30)
+        response = http_client.get(url, kind="data")
     except Exception as e:
         raise ValueError("네트워크 연결을 확인해 주세요. 스프레드시트 링크라면 시트를 '링크가 있는 모든 사용자(보기)'로 공유했는지 확인하세요. " + str(e))
     for key, value in response.cookies.items():
         if key.startswith("download_warning"):
-            response = session.get(url, params={"confirm": value}, timeout=30)
+            response = http_client.get(url, kind="data", params={"confirm": value})
             break
     response.raise_for_status()
     raw = response.content
@@ -657,13 +1068,13 @@ def download_from_google_drive(file_id: str) -> dict:
 
     # 엑셀 시도 (xlsx 매직 바이트 PK)
     if raw[:2] == b"PK":
-        return _xlsx_to_creatures_data(raw)
+        return _parse_xlsx_cached(raw)
 
     # Drive 파일이 아닌 경우: Google Sheets export 시도 후, 실패하면 opensheet.elk.sh 로 시트 ID 직접 읽기
     sheets_err = None
     try:
         raw = _download_google_sheets_xlsx(file_id)
-        return _xlsx_to_creatures_data(raw)
+        return _parse_xlsx_cached(raw)
     except Exception as e:
         sheets_err = str(e)
 
@@ -681,46 +1092,76 @@ def download_from_google_drive(file_id: str) -> dict:
     )
 
 
+def _collection_journal() -> collection_journal.CollectionJournal:
+    global _collection
+    if _collection is None:
+        _collection = collection_journal.CollectionJournal(COLLECTION_PATH, COLLECTION_JOURNAL_PATH)
+    return _collection
+
+
 def load_collection() -> dict:
-    """collection.json 로드 (수집 별, 사용자 추가 생물). 가격 별은 저장하지 않음."""
-    default = {"stars": {}, "userCreatures": {"어류": [], "곤충": [], "조류": [], "요리": []}}
-    if not COLLECTION_PATH.exists():
-        return default
+    """수집 정보 (수집 별, 사용자 추가 생물). collection.json + 저널을 처음 한 번만 읽고 이후는 메모리에서. 가격 별은 저장하지 않음."""
+    return _collection_journal().state()
+
+
+def save_collection(data: dict) -> None:
+    """수집 정보 저장: 바뀐 부분만 저널에 기록 (collection.json은 백그라운드 합치기·종료 시 교체)."""
+    _collection_journal().replace(stars=data.get("stars"), user_creatures=data.get("userCreatures"))
+
+
+def close_collection() -> None:
+    """종료 시 저널을 collection.json에 합침."""
+    if _collection is None:
+        return
     try:
-        with open(COLLECTION_PATH, "r", encoding="utf-8") as f:
-            return {**default, **json.load(f)}
+        _collection.close()
     except Exception:
-        return default
+        pass
 
 
-def save_collection(data: dict) -> None:
-    """collection.json 저장."""
-    with open(COLLECTION_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def _settings_writer() -> settings_store.SettingsWriter:
+    global _settings
+    if _settings is None:
+        try:
+            interval = float(load_config().get("settings_flush_interval", settings_store.FLUSH_INTERVAL))
+        except (TypeError, ValueError):
+            interval = settings_store.FLUSH_INTERVAL
+        _settings = settings_store.SettingsWriter(SETTINGS_PATH, interval)
+    return _settings
 
 
 def load_settings_file() -> dict:
-    """settings.json 로드 (탭, 정렬, 색상 등)."""
-    default = {"currentTab": "어류", "sortBy": "level-asc", "colors": {}}
-    if not SETTINGS_PATH.exists():
-        return default
+    """설정 (탭, 정렬, 색상 등). settings.json은 처음 한 번만 읽고 이후는 메모리에서."""
+    return _settings_writer().get()
+
+
+def save_settings_file(data: dict) -> None:
+    """설정 저장: 메모리만 바꾸고 바로 반환. 파일은 쓰기 스레드가 settings_flush_interval마다 한 번 씀."""
+    _settings_writer().update(data)
+
+
+def close_settings() -> None:
+    """종료 시 쓰지 않은 설정을 settings.json에 씀."""
+    if _settings is None:
+        return
     try:
-        with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-            return {**default, **json.load(f)}
+        _settings.close()
     except Exception:
-        return default
+        pass
 
 
-def save_settings_file(data: dict) -> None:
-    """settings.json 저장."""
-    with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def get_settings_write_stats() -> dict:
+    """설정 저장 요청/무시/합침/실제 쓰기 횟수."""
+    if _settings is None:
+        return {"updates": 0, "identical": 0, "coalesced": 0, "writes": 0}
+    return _settings.stats()
 
 
 def load_user_data() -> dict:
     """collection + settings 합쳐서 반환 (UI용)."""
-    collection = load_collection()
-    settings = load_settings_file()
+    with perf.span("user.load"):
+        collection = load_collection()
+        settings = load_settings_file()
     return {
         "stars": collection.get("stars", {}),
         "userCreatures": collection.get("userCreatures", {"어류": [], "곤충": [], "조류": [], "요리": []}),
@@ -728,112 +1169,510 @@ def load_user_data() -> dict:
     }
 
 
+def _fetch_github_base(config: dict, remember: bool = True) -> dict:
+    """config 기준으로 GitHub의 heartowiki.xlsx를 받아 도감 데이터로 반환 (catalog_store 열 배열 형태)."""
+    # 데이터는 GitHub의 heartowiki.xlsx만 사용 (다운로드 → xlsx 파싱 → JSON 구조로 캐시)
+    repo = (config.get("github_repo") or "lir125/heartowiki").strip()
+    branch = (config.get("github_data_branch") or "main").strip()
+    path = "heartowiki.xlsx"  # 항상 저장소 루트의 heartowiki.xlsx
+    # 매니페스트의 데이터 SHA-256이 캐시와 같으면 통합문서를 받지 않음
+    digest = (_fetch_manifest(config).get("data") or {}).get("sha256")
+    if digest and digest == _cached_data_hash():
+        cached = _read_cache()
+        if cached is not None and cached.get("data_hash") == digest:
+            return cached
+    return catalog_store.compact(_fetch_data_from_github(repo, branch, path, remember=remember))
+
+
 def get_base_data() -> dict:
     """도감 데이터: GitHub 또는 구글 드라이브에서 받거나 데이터 폴더 캐시 사용."""
     global _cached_base, _last_data_error
-    if _cached_base is not None:
+    with _data_lock:
+        if _cached_base is not None:
+            return _cached_base
+
+        config = load_config()
+        _last_data_error = ""
+
+        with perf.span("data.fetch") as s:
+            try:
+                _cached_base = _fetch_github_base(config)
+                _last_data_error = ""  # 성공 시 이전 실패 메시지 제거
+                # 성공 시 데이터 폴더에 캐시 저장 (cache.bin, 내용이 같으면 생략)
+                _write_cache(_cached_base)
+            except Exception as e:
+                _last_data_error = str(e) or "알 수 없는 오류"
+                s["error"] = f"{type(e).__name__}: {_last_data_error}"
+                _cached_base = _read_cache() or _empty_base()
         return _cached_base
 
-    config = load_config()
-    _last_data_error = ""
 
+def _load_cached_base() -> bool:
+    """네트워크 없이 캐시(cache.bin/cache.json)를 바로 도감 데이터로 사용 (cache_first 시작). 캐시가 있으면 True."""
+    global _cached_base
+    cached = _read_cache()
+    if cached is None:
+        return False
+    with _data_lock:
+        if _cached_base is None:
+            _cached_base = cached
+    return True
+
+
+def _push_to_page(handler: str, payload: dict) -> None:
+    """페이지의 window[handler](payload) 호출. 창이 없거나 실패하면 무시."""
+    if _window is None:
+        return
     try:
-        # 데이터는 GitHub의 heartowiki.xlsx만 사용 (다운로드 → xlsx 파싱 → JSON 구조로 캐시)
-        repo = (config.get("github_repo") or "lir125/heartowiki").strip()
-        branch = (config.get("github_data_branch") or "main").strip()
-        path = "heartowiki.xlsx"  # 항상 저장소 루트의 heartowiki.xlsx
-        _cached_base = _fetch_data_from_github(repo, branch, path)
-        _last_data_error = ""  # 성공 시 이전 실패 메시지 제거
-        # 성공 시 데이터 폴더에 JSON으로 캐시 저장 (cache.json)
-        with open(CACHE_PATH, "w", encoding="utf-8") as f:
-            json.dump(_cached_base, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        _last_data_error = str(e) or "알 수 없는 오류"
-        if CACHE_PATH.exists():
-            try:
-                with open(CACHE_PATH, "r", encoding="utf-8") as f:
-                    _cached_base = json.load(f)
-            except Exception:
-                _cached_base = {"어류": [], "곤충": [], "조류": [], "요리": []}
+        js = f"window.{handler} && window.{handler}({json.dumps(payload, ensure_ascii=False)})"
+        _window.evaluate_js(js)
+    except Exception:
+        pass
+
+
+def _revalidate_in_background() -> None:
+    """cache_first 시작 후 백그라운드 스레드에서 실행: GitHub에서 다시 받아 바뀌었으면 페이지에 전달.
+    실패 메시지(lastError)도 같은 경로로 페이지에 전달."""
+    global _cached_base, _last_data_error
+    old_hash = (_cached_base or {}).get("data_hash", "")
+    fresh = None
+    with perf.span("data.revalidate") as s:
+        try:
+            fresh = _fetch_github_base(load_config())
+            _write_cache(fresh)
+            error = ""
+        except Exception as e:
+            error = str(e) or "알 수 없는 오류"
+            s["error"] = f"{type(e).__name__}: {error}"
+    perf.mark("revalidated")
+    with _data_lock:
+        _last_data_error = error
+        changed = fresh is not None and (not old_hash or fresh.get("data_hash", "") != old_hash)
+        if changed:
+            _cached_base = fresh
+        base = _cached_base
+    if changed:
+        _warm_query_index_in_background(base)
+    _push_to_page("onBaseDataUpdated", {
+        "base": catalog_store.plain(base) if changed else None,
+        "lastError": error,
+        "appVersion": APP_VERSION,
+        "dataVersion": (base or {}).get("data_version", ""),
+    })
+
+
+def _base_part(base: dict, categories) -> dict:
+    """도감 데이터 중 categories의 행만 담은 일반 dict (meta는 그대로, derived는 해당 카테고리 열만)."""
+    part = {}
+    for key, value in base.items():
+        if isinstance(value, list):
+            if key in categories:
+                part[key] = value
+        elif key == "derived" and isinstance(value, dict):
+            part[key] = {k: v for k, v in value.items() if not isinstance(base.get(k), list) or k in categories}
         else:
-            _cached_base = {"어류": [], "곤충": [], "조류": [], "요리": []}
-    return _cached_base
+            part[key] = value
+    return catalog_store.plain(part)  # pywebview JSON 직렬화용 일반 dict
 
 
-def get_app_data() -> dict:
-    """UI에서 호출: 도감 데이터 + 수집정보/설정 한 번에 반환."""
+def get_app_data(lazy: bool = False) -> dict:
+    """UI에서 호출: 도감 데이터 + 수집정보/설정 한 번에 반환.
+    lazy=True면 base에는 첫 화면 탭(settings.currentTab) 카테고리만 담고, 나머지 카테고리 이름은 pending으로 알려 줌
+    (페이지가 get_category로 탭을 열 때·한가할 때 받음). 첫 응답 크기가 전체 도감 크기와 관계없어짐."""
     global _cached_user
     base = get_base_data()
     user = load_user_data()
     _cached_user = user
+    _warm_query_index_in_background(base)
     data_version = base.get("data_version", "") if isinstance(base, dict) else ""
-    return {
-        "base": base,
+    categories = [k for k, v in base.items() if isinstance(v, list)]
+    pending = []
+    if lazy and categories:
+        first = (user.get("settings") or {}).get("currentTab")
+        if first not in categories:
+            first = categories[0]
+        pending = [c for c in categories if c != first]
+        categories = [first]
+    result = {
+        "base": _base_part(base, categories),
         "user": user,
         "lastError": _last_data_error,
         "appVersion": APP_VERSION,
         "dataVersion": data_version,
     }
+    if lazy:
+        result["pending"] = pending
+    perf.mark("first_get_app_data")
+    return result
+
+
+def get_category(category: str) -> dict:
+    """UI에서 호출: 카테고리 하나의 도감 데이터 { base: { 카테고리: [...], derived, data_hash, ... } } (get_app_data(lazy=True) 뒤)."""
+    base = get_base_data()
+    if not isinstance(base.get(category), list):
+        raise ValueError(f"알 수 없는 카테고리: {category}")
+    return {"base": _base_part(base, [category])}
+
+
+def get_counts() -> dict:
+    """UI에서 호출: 카테고리별 도감 행 수 { 카테고리: 개수 } (사용자 추가 생물 제외). 탭 개수 표시용."""
+    base = get_base_data()
+    return {k: len(v) for k, v in base.items() if isinstance(v, list)}
 
 
 def save_user_data_from_app(stars=None, user_creatures=None, settings=None) -> None:
     """UI에서 호출: 수집정보·설정을 데이터 폴더 JSON으로 저장. 가격 별은 저장하지 않음."""
     global _cached_user
 
-    if stars is not None or user_creatures is not None:
-        collection = load_collection()
-        if stars is not None:
-            collection["stars"] = stars
-        if user_creatures is not None:
-            collection["userCreatures"] = user_creatures
-        save_collection(collection)
+    with perf.span("user.save", stars=stars is not None, creatures=user_creatures is not None,
+                   settings=settings is not None):
+        if stars is not None or user_creatures is not None:
+            # 전체 값이 와도 저널에는 바뀐 항목만 기록
+            _collection_journal().replace(stars=stars, user_creatures=user_creatures)
 
-    if settings is not None:
-        save_settings_file(settings)
+        if settings is not None:
+            save_settings_file(settings)
 
-    _cached_user = load_user_data()
+    _cached_user = None  # 다음 get_app_data에서 다시 채움
 
 
-def refresh_data() -> dict:
-    """UI에서 호출: 원격(GitHub/드라이브)에서 다시 받고 사용자 데이터와 함께 반환."""
-    global _cached_base, _last_data_error
-    _cached_base = None
-    _last_data_error = ""
-    return get_app_data()
+def set_star(key: str, n=None) -> None:
+    """UI에서 호출: 별 하나 변경 (key = "카테고리_명칭", n이 None이면 삭제)."""
+    _collection_journal().set_star(key, n)
+
+
+def add_user_creature(category: str, item: dict) -> None:
+    """UI에서 호출: 사용자 추가 생물 하나 저장."""
+    _collection_journal().add_creature(category, item)
+
+
+def remove_user_creature(category: str, name: str) -> None:
+    """UI에서 호출: 사용자 추가 생물 하나 삭제."""
+    _collection_journal().remove_creature(category, name)
+
+
+def _catalog_index() -> catalog_query.CatalogIndex:
+    """현재 도감 데이터 + 사용자 추가 생물 색인. 도감 데이터가 바뀌면 다시 만들고,
+    사용자 생물이 추가/삭제되면 그 행만 색인에 반영."""
+    global _query_index
+    base = get_base_data()
+    journal = _collection_journal()
+    revision = journal.creatures_revision
+    if _query_index is None or _query_index[0] is not base:
+        _query_index = (base, revision, catalog_query.CatalogIndex(base, journal.state()["userCreatures"]))
+    elif _query_index[1] != revision:
+        _query_index[2].sync_user_creatures(journal.state()["userCreatures"])
+        _query_index = (base, revision, _query_index[2])
+    return _query_index[2]
+
+
+def _warm_query_index_in_background(base) -> None:
+    """도감 데이터가 준비되면 필터·검색 색인을 백그라운드에서 미리 만듦 (첫 검색이 기다리지 않도록).
+    도감 데이터마다 한 번만 만들고, 만드는 동안은 _query_lock을 잡지 않아 query가 기다리지 않음 (끝나면 교체만 잠금)."""
+    global _warming_base
+    with _query_lock:
+        if _warming_base is base or (_query_index is not None and _query_index[0] is base):
+            return
+        _warming_base = base
+
+    def run():
+        global _query_index, _warming_base
+        try:
+            journal = _collection_journal()
+            revision = journal.creatures_revision
+            index = catalog_query.CatalogIndex(base, journal.state()["userCreatures"])
+            index.warm()
+            with _query_lock:
+                # 그 사이 query가 먼저 만들었거나 도감 데이터가 바뀌었으면 버림 (사용자 생물 변경은 _catalog_index가 반영)
+                if _cached_base is base and (_query_index is None or _query_index[0] is not base):
+                    _query_index = (base, revision, index)
+        except Exception:
+            pass
+        finally:
+            with _query_lock:
+                if _warming_base is base:
+                    _warming_base = None
+
+    threading.Thread(target=run, name="query-index-warm", daemon=True).start()
+
+
+def query(category: str, search: str = "", location: str = "", level: str = "", weather: str = "",
+          hide_completed: bool = False, sort: str = "excel", offset: int = 0, limit=None, focus=None) -> dict:
+    """UI에서 호출: 필터·정렬 결과.
+    { token, total, offset, ids: [명칭 ...](offset부터 limit개), positions: { focus 명칭: 결과 안 위치 },
+      facets: { location, level, weather: [[값, 개수] ...] } }
+    facets의 개수는 해당 드롭다운을 제외한 나머지 조건을 적용했을 때의 개수.
+    나머지 구간은 token으로 query_slice에서 받음 (id는 명칭이라 다시 조회해도 같은 항목은 같은 id)."""
+    global _query_token
+    with _query_lock:
+        index = _catalog_index()
+        journal = _collection_journal()
+        result = index.query(
+            category,
+            search=search or "",
+            location=location or "",
+            level=level or "",
+            weather=weather or "",
+            hide_completed=bool(hide_completed),
+            sort=sort or "excel",
+            stars=journal.peek()["stars"],
+            stars_revision=journal.stars_revision,
+        )
+        ids = result["ids"]
+        _query_token += 1
+        token = _query_token
+        _query_results[token] = ids
+        while len(_query_results) > QUERY_RESULTS_MAX:
+            del _query_results[next(iter(_query_results))]
+    positions = {}
+    for name in focus or ():
+        try:
+            positions[name] = ids.index(name)
+        except ValueError:
+            pass
+    result.update(_slice(ids, offset, limit))
+    result["token"] = token
+    result["positions"] = positions
+    return result
+
+
+def _slice(ids: list, offset, limit) -> dict:
+    offset = max(0, int(offset or 0))
+    end = len(ids) if limit is None else offset + max(0, int(limit))
+    return {"ids": ids[offset:end], "offset": offset, "total": len(ids)}
+
+
+def query_slice(token: int, offset: int = 0, limit=None) -> dict:
+    """UI에서 호출: query 결과의 일부 { ids, offset, total }. 오래되어 버린 결과면 { expired: true }."""
+    with _query_lock:
+        ids = _query_results.get(token)
+    if ids is None:
+        return {"expired": True, "ids": [], "offset": 0, "total": 0}
+    return _slice(ids, offset, limit)
+
+
+def search(category: str, text: str, limit: int = 50) -> dict:
+    """UI에서 호출: 명칭·지역·세부지역·재료·레시피 검색 (초성 가능). 일치 → 앞부분 → 중간 순 { ids, total }."""
+    result = query(category, search=text, limit=limit)
+    return {"ids": result["ids"], "total": result["total"]}
+
+
+def refresh_data(known_hash: str = "", prefetched: bool = False) -> dict:
+    """UI에서 호출: 원격(GitHub/드라이브)에서 다시 받고 사용자 데이터와 함께 반환.
+    known_hash가 지금 가진 도감 데이터의 data_hash와 같으면 base 대신 바뀐 행만(delta) 보냄.
+    prefetched=True면 주기 확인이 미리 받아 둔 데이터를 네트워크 없이 바로 적용 (없으면 평소처럼 받음)."""
+    global _cached_base, _last_data_error, _manifest, _query_index
+    ready = _take_prefetched()  # 평소 새로고침이면 미리 받은 것은 버림 (더 새로 받으므로)
+    if not prefetched:
+        ready = None
+    if ready is None:
+        http_client.reset()  # 사용자가 직접 누른 새로고침은 차단기와 관계없이 다시 시도
+        _manifest = None
+    # 미리 만든 색인도 함께 교체하므로 _query_lock도 잡음. query와 같은 순서(_query_lock → _data_lock)로 잠가
+    # query가 _query_lock 안에서 get_base_data를 기다리는 동안 서로 기다리지 않게 함
+    with (_query_lock if ready is not None else contextlib.nullcontext()), _data_lock:
+        old = _cached_base
+        _cached_base = None
+        _last_data_error = ""
+        if ready is not None:
+            _cached_base = ready[0]
+            _query_index = ready[1]
+            _write_cache(_cached_base)
+        result = get_app_data()
+        new = _cached_base
+    old_hash = (old or {}).get("data_hash", "")
+    if known_hash and old_hash and known_hash == old_hash:
+        delta = catalog_store.plain(data_delta.diff(old, new))
+        result["base"] = None
+        result["delta"] = delta
+        result["baseHash"] = old_hash
+        result["dataHash"] = delta["meta"].get("data_hash", old_hash)
+    return result
 
 
 def check_data_update() -> dict:
-    """GitHub heartowiki.xlsx 기준 도감 데이터 업데이트 여부 확인 (xlsx는 버전 필드 없어 비움)."""
+    """도감 데이터 업데이트 여부 확인. manifest.json이 있으면 그 data_version·SHA-256을 캐시와 비교
+    (SHA-256은 latestHash로 함께 반환), 없으면 GitHub heartowiki.xlsx의 '도감 정보' 시트 도감 버전과 비교 (Range로 몇 KB만 받음)."""
     config = load_config()
     repo = config.get("github_repo", "").strip()
     if not repo:
         return {"hasUpdate": False, "currentVersion": "", "latestVersion": ""}
+    data_info = _fetch_manifest(config).get("data") or {}
+    if data_info.get("sha256"):
+        current = _cached_data_version()
+        return {
+            "hasUpdate": data_info["sha256"] != _cached_data_hash(),
+            "currentVersion": current,
+            "latestVersion": str(data_info.get("version") or "").strip() or current,
+            "latestHash": data_info["sha256"],
+            "size": data_info.get("size", 0),
+        }
     branch = config.get("github_data_branch") or "main"
     path = "heartowiki.xlsx"
     latest = _get_github_data_version(repo, branch, path)
-    current = ""
-    if CACHE_PATH.exists():
-        try:
-            with open(CACHE_PATH, "r", encoding="utf-8") as f:
-                cached = json.load(f)
-                current = str(cached.get("data_version", "")).strip()
-        except Exception:
-            pass
+    current = _cached_data_version()
     if not latest:
         return {"hasUpdate": False, "currentVersion": current, "latestVersion": ""}
     has_update = bool(current != latest)
     return {"hasUpdate": has_update, "currentVersion": current, "latestVersion": latest}
 
 
+def _take_prefetched():
+    """미리 받아 둔 (도감 데이터, _query_index)를 꺼냄 (없으면 None)."""
+    global _prefetched
+    with _data_lock:
+        ready, _prefetched = _prefetched, None
+    return ready
+
+
+def _prefetch_data(config: dict, data_result: dict) -> str:
+    """새 도감 데이터를 받아 파싱하고 필터·검색 색인까지 만들어 둠. 적용할 데이터의 data_hash (없으면 "")."""
+    global _prefetched
+    with _data_lock:
+        current = _cached_base
+        ready = _prefetched
+    if ready is not None:
+        # manifest가 있으면 해시로 비교 (도감 버전을 올리지 않고 통합문서만 다시 올린 경우), 없으면 도감 버전으로
+        latest_hash = data_result.get("latestHash", "")
+        if latest_hash:
+            same = ready[0].get("data_hash", "") == latest_hash
+        else:
+            same = ready[0].get("data_version") == data_result.get("latestVersion")
+        if same:
+            return ready[0].get("data_hash", "")  # 이미 받아 둠
+    fresh = _fetch_github_base(config, remember=False)
+    digest = fresh.get("data_hash", "")
+    if digest == (current or {}).get("data_hash", ""):
+        return ""
+    journal = _collection_journal()
+    revision = journal.creatures_revision
+    index = catalog_query.CatalogIndex(fresh, journal.state()["userCreatures"])
+    index.warm()
+    with _data_lock:
+        if _cached_base is not current:
+            return ""  # 그 사이 새로고침됨
+        _prefetched = (fresh, (fresh, revision, index))
+    return digest
+
+
+def _freshness_check() -> None:
+    """주기 확인 한 번 (freshness 스레드): 도감 데이터·앱 새 버전을 확인하고, 새 도감 데이터는 미리 받아 두고
+    처음 보는 새 버전이면 페이지의 onFreshness({ data, app })로 알림.
+    요청이 실패했으면 ConnectionError (스케줄러가 다음 확인 간격을 늘림)."""
+    config = load_config()
+    data_result = check_data_update()
+    app_result = check_app_update()
+    failed = [h for h, s in http_client.breaker.stats().items() if s["failures"]]
+    digest = _prefetch_data(config, data_result) if data_result.get("hasUpdate") else ""
+    data_result["ready"] = bool(digest)
+    notify = {}
+    data_key = ("data", digest)
+    if data_result["ready"] and data_key not in _freshness_notified:
+        _freshness_notified.add(data_key)
+        notify["data"] = data_result
+    app_key = ("app", app_result.get("version", ""))
+    if app_result.get("hasUpdate") and app_key not in _freshness_notified:
+        _freshness_notified.add(app_key)
+        notify["app"] = app_result
+    if notify:
+        _push_to_page("onFreshness", notify)
+    if failed:
+        raise ConnectionError("연결 실패: " + ", ".join(failed))
+
+
+def start_freshness_checks() -> None:
+    """config의 freshness_interval_minutes마다 도감 데이터·앱 새 버전을 확인하는 스레드 시작 (0이면 안 함)."""
+    global _freshness
+    try:
+        minutes = float(load_config().get("freshness_interval_minutes", freshness.INTERVAL / 60))
+    except (TypeError, ValueError):
+        minutes = freshness.INTERVAL / 60
+    _freshness = freshness.FreshnessScheduler(_freshness_check, interval=minutes * 60)
+    _freshness.start()
+
+
+def stop_freshness_checks() -> None:
+    if _freshness is not None:
+        _freshness.stop()
+
+
+def set_window_visible(visible: bool) -> None:
+    """UI·창 이벤트에서 호출: 창이 숨겨지면 주기 확인을 멈추고, 다시 보이면 이어서 확인."""
+    if _freshness is not None:
+        _freshness.set_visible(visible)
+
+
+def get_freshness_stats() -> dict:
+    """주기 확인 상태 { interval, visible, next_in, consecutive_failures, checks, ..., prefetched: 미리 받은 도감 버전 }."""
+    stats = _freshness.stats() if _freshness is not None else {}
+    ready = _prefetched
+    stats["prefetched"] = ready[0].get("data_version", "") if ready is not None else ""
+    return stats
+
+
+def get_perf_stats(recent: int = 100) -> dict:
+    """단계별 시간 기록 (perf.stats: 시작 시간표, 이름별 합계, 최근 기록) + 마지막 도감 데이터 오류."""
+    stats = perf.stats(recent=int(recent or 0))
+    stats["lastError"] = _last_data_error
+    return stats
+
+
+def _payload_rows(result: dict) -> int:
+    """응답에 담긴 도감 행 수 (base의 카테고리 행 + delta의 추가·바뀐·교체 행)."""
+    rows = sum(len(v) for v in (result.get("base") or {}).values() if isinstance(v, list))
+    for d in ((result.get("delta") or {}).get("categories") or {}).values():
+        rows += sum(len(d.get(k) or ()) for k in ("added", "changed", "replace"))
+    return rows
+
+
+def _bridge_payload(name: str, result: dict) -> dict:
+    """페이지로 보낼 응답의 도감 행 수를 기록. JSON 크기(bytes)는 직렬화를 한 번 더 해야 하므로
+    perf_log가 켜져 있을 때만 잼 (pywebview가 어차피 직렬화하므로 평소에는 그 비용을 두 번 내지 않음)."""
+    if perf.enabled():
+        fields = {"rows": _payload_rows(result)}
+        if perf.log_enabled():
+            fields["bytes"] = len(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+        perf.note("bridge." + name, **fields)
+    return result
+
+
 class Api:
-    def get_app_data(self):
-        return get_app_data()
+    def get_app_data(self, lazy=False):
+        return _bridge_payload("get_app_data", get_app_data(lazy=bool(lazy)))
+
+    def get_category(self, category):
+        return _bridge_payload("get_category", get_category(category))
+
+    def get_counts(self):
+        return get_counts()
 
     def save_user_data(self, stars=None, user_creatures=None, settings=None):
         save_user_data_from_app(stars=stars, user_creatures=user_creatures, settings=settings)
 
-    def refresh_data(self):
-        return refresh_data()
+    def set_star(self, key, n=None):
+        set_star(key, n)
+
+    def add_user_creature(self, category, item):
+        add_user_creature(category, item)
+
+    def remove_user_creature(self, category, name):
+        remove_user_creature(category, name)
+
+    def query(self, category, search="", location="", level="", weather="", hide_completed=False, sort="excel",
+              offset=0, limit=None, focus=None):
+        return query(category, search, location, level, weather, hide_completed, sort, offset, limit, focus)
+
+    def query_slice(self, token, offset=0, limit=None):
+        return query_slice(token, offset, limit)
+
+    def search(self, category, text, limit=50):
+        return search(category, text, limit)
+
+    def get_settings_write_stats(self):
+        return get_settings_write_stats()
+
+    def refresh_data(self, known_hash="", prefetched=False):
+        return _bridge_payload("refresh_data", refresh_data(known_hash, prefetched))
 
     def check_app_update(self):
         return check_app_update()
@@ -841,8 +1680,18 @@ class Api:
     def check_data_update(self):
         return check_data_update()
 
-    def apply_update(self, download_url="", drive_file_id=""):
-        return apply_update(download_url=download_url, drive_file_id=drive_file_id)
+    def set_window_visible(self, visible=True):
+        set_window_visible(visible)
+
+    def get_freshness_stats(self):
+        return get_freshness_stats()
+
+    def get_perf_stats(self, recent=100):
+        return get_perf_stats(recent)
+
+    def apply_update(self, download_url="", drive_file_id="", sha256="", size=0, patches=None):
+        return apply_update(download_url=download_url, drive_file_id=drive_file_id, sha256=sha256, size=size,
+                            patches=patches)
 
     def exit_app(self):
         exit_app()
@@ -851,17 +1700,35 @@ class Api:
         open_download_url(url)
 
 
+def startup():
+    """창을 띄우기 전 초기화: 데이터 폴더 준비 + 도감 데이터 준비.
+    cache_first면 캐시만 읽고, 창이 뜬 뒤 백그라운드에서 실행할 갱신 함수를 반환 (없으면 None)."""
+    get_data_dir()
+    config = load_config()
+    perf.configure(config.get("perf_enabled", True), PERF_LOG_PATH if config.get("perf_log") else None)
+    perf.mark("data_dir_ready")
+    # cache_first: 캐시로 창을 먼저 띄우고, 다운로드·파싱은 창이 뜬 뒤 백그라운드에서
+    startup_mode = (config.get("startup_mode") or "cache_first").strip().lower()
+    if startup_mode == "cache_first" and _load_cached_base():
+        perf.mark("startup_done")
+        return _revalidate_in_background
+    get_base_data()
+    perf.mark("startup_done")
+    return None
+
+
 def main():
+    global _window
     index_path = RESOURCE_DIR / "index.html"
     if not index_path.exists():
         if not getattr(sys, "frozen", False):
             print(f"index.html을 찾을 수 없습니다: {index_path}")
         return
 
-    get_data_dir()
-    get_base_data()
+    revalidate = startup()
 
-    window = webview.create_window(
+    import webview
+    _window = webview.create_window(
         "두타위키",
         f"file:///{index_path.as_posix()}",
         width=1200,
@@ -869,7 +1736,21 @@ def main():
         min_size=(800, 600),
         js_api=Api(),
     )
-    webview.start(debug=False)
+    perf.mark("window_created")
+    # 최소화하면 주기 확인을 멈춤 (페이지의 visibilitychange와 함께)
+    try:
+        _window.events.minimized += lambda: set_window_visible(False)
+        _window.events.restored += lambda: set_window_visible(True)
+    except AttributeError:
+        pass
+    start_freshness_checks()
+    webview.start(revalidate, debug=False)
+    stop_freshness_checks()
+    close_collection()
+    close_settings()
+
+
+perf.mark("main_imported")
 
 
 if __name__ == "__main__":
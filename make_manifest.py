@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+manifest.json 만들기: app_version.json(앱 버전·다운로드 정보)과 heartowiki.xlsx(도감 버전·SHA-256·크기)를 한 파일로.
+앱은 시작할 때 이 작은 파일만 먼저 받아, 데이터 해시가 캐시와 같으면 통합문서를 받지 않고
+앱 업데이트·도감 데이터 업데이트 여부도 여기서 확인합니다. heartowiki.xlsx나 app_version.json을 바꾼 뒤 실행해 함께 커밋하세요.
+
+사용법: python make_manifest.py [--xlsx heartowiki.xlsx] [--app app_version.json] [-o manifest.json]
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.resolve()
+
+
+def build_manifest(xlsx_path: Path, app_path: Path) -> dict:
+    import main
+    raw = xlsx_path.read_bytes()
+    data = main._xlsx_to_creatures_data(raw)
+    with open(app_path, "r", encoding="utf-8") as f:
+        app = json.load(f)
+    return {
+        "app": app,
+        "data": {
+            "path": xlsx_path.name,
+            "version": str(data.get("data_version") or ""),
+            "sha256": hashlib.sha256(raw).hexdigest(),
+            "size": len(raw),
+        },
+    }
+
+
+def run(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--xlsx", type=Path, default=ROOT / "heartowiki.xlsx")
+    parser.add_argument("--app", type=Path, default=ROOT / "app_version.json")
+    parser.add_argument("-o", "--output", type=Path, default=ROOT / "manifest.json")
+    args = parser.parse_args(argv)
+    manifest = build_manifest(args.xlsx, args.app)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    d = manifest["data"]
+    print(f"{args.output}: 앱 {manifest['app'].get('version', '')}, 도감 {d['version'] or '(버전 없음)'}, "
+          f"{d['size']:,} 바이트, sha256 {d['sha256'][:12]}…")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+앱 업데이트 패치 만들기 (빌드 PC에서 실행): 이전 버전 exe와 새 exe로 exe_patch 형식의 패치 파일을 만들고,
+app_version.json의 "patches" 목록에 넣을 항목을 출력합니다. --manifest를 주면 그 파일에 바로 추가합니다
+(같은 from_version 항목은 교체, 새 exe의 size·sha256도 갱신).
+
+사용법:
+  python make_patch.py 이전.exe 새.exe --from-version 1.0.3 --url https://.../Heartowiki-1.0.3-1.0.4.patch
+                       [-o Heartowiki-1.0.3-1.0.4.patch] [--manifest app_version.json]
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import exe_patch
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("old_exe", type=Path)
+    parser.add_argument("new_exe", type=Path)
+    parser.add_argument("--from-version", required=True, help="이전 exe의 APP_VERSION")
+    parser.add_argument("--url", required=True, help="패치 파일을 올릴 주소")
+    parser.add_argument("-o", "--output", type=Path, help="패치 파일 경로 (기본: 새 exe 옆 <이름>-<이전 버전>.patch)")
+    parser.add_argument("--manifest", type=Path, help="항목을 추가할 app_version.json")
+    args = parser.parse_args(argv)
+
+    source = args.old_exe.read_bytes()
+    target = args.new_exe.read_bytes()
+    output = args.output or args.new_exe.with_name(f"{args.new_exe.stem}-{args.from_version}.patch")
+    t0 = time.perf_counter()
+    patch = exe_patch.make_patch(source, target)
+    output.write_bytes(patch)
+    header, _ = exe_patch.read_header(patch)
+    print(f"{output}: {len(patch):,} 바이트 (새 exe {len(target):,} 바이트의 {len(patch) / max(len(target), 1):.1%}), "
+          f"{time.perf_counter() - t0:.1f}초", file=sys.stderr)
+
+    entry = {
+        "from_version": args.from_version.strip().lstrip("v"),
+        "from_sha256": header["source_sha256"],
+        "url": args.url,
+        "size": len(patch),
+        "sha256": hashlib.sha256(patch).hexdigest(),
+    }
+    if args.manifest:
+        with open(args.manifest, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        patches = [p for p in manifest.get("patches") or [] if p.get("from_version") != entry["from_version"]]
+        manifest["patches"] = patches + [entry]
+        manifest["size"] = header["target_size"]
+        manifest["sha256"] = header["target_sha256"]
+        with open(args.manifest, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"{args.manifest}에 추가했습니다.", file=sys.stderr)
+    print(json.dumps(entry, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
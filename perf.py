@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+가벼운 성능 기록: 느린 구간을 사용자 PC에서 확인할 수 있도록 주요 단계의 시간을 남깁니다.
+
+  - span(name, **fields): with 블록 하나의 시간(ms) + 필드(bytes, status 등). 블록 안에서 받은 dict에 필드를 더 넣을 수 있음.
+    예외가 나가면 error 필드에 예외 종류를 적음
+  - record(name, ms, **fields): 따로 잰 시간 기록
+  - note(name, **fields): 시간 없이 값만 기록 (응답 행 수 등, 이름별 합계에는 들어가지 않음)
+  - mark(name): 시작 시간표 (이 모듈을 처음 import한 때 = 0 ms, 같은 이름은 처음 한 번만)
+  - stats(): 최근 기록(링 버퍼 RING_SIZE개) + 이름별 합계 + 시간표 (Api.get_perf_stats)
+  - configure(enabled, log_path): 끄면 span은 아무것도 하지 않는 객체 하나를 돌려주므로 비용이 거의 없음.
+    log_path가 있으면 기록마다 JSON 한 줄을 회전 로그(LOG_MAX_BYTES × LOG_BACKUPS)로도 씀
+
+main.py가 다른 앱 모듈보다 먼저 import하므로 시간표의 0은 프로세스 시작 직후(표준 라이브러리 import 뒤)입니다.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+
+RING_SIZE = 500
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+
+_origin = time.perf_counter()
+_started_at = time.time()
+_enabled = True
+_ring = deque(maxlen=RING_SIZE)
+_totals = {}  # 이름 → [횟수, 합계 ms, 최대 ms]
+_timeline = {}  # 이름 → ms (처음 한 번)
+_lock = threading.Lock()
+_logger = None
+
+
+def _now_ms() -> float:
+    return (time.perf_counter() - _origin) * 1000
+
+
+def _emit(entry: dict) -> None:
+    with _lock:
+        _ring.append(entry)
+        if "ms" in entry:
+            total = _totals.get(entry["name"])
+            if total is None:
+                total = _totals[entry["name"]] = [0, 0.0, 0.0]
+            total[0] += 1
+            total[1] += entry["ms"]
+            total[2] = max(total[2], entry["ms"])
+    logger = _logger
+    if logger is not None:
+        try:
+            logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+        except Exception:
+            pass
+
+
+class _Span:
+    __slots__ = ("name", "fields", "start")
+
+    def __init__(self, name: str, fields: dict):
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self) -> dict:
+        self.start = time.perf_counter()
+        return self.fields
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.fields.setdefault("error", exc_type.__name__)
+        _emit({
+            "name": self.name,
+            "at": round((self.start - _origin) * 1000, 3),
+            "ms": round((end - self.start) * 1000, 3),
+            "thread": threading.current_thread().name,
+            **self.fields,
+        })
+        return False
+
+
+class _NullSpan:
+    """꺼져 있을 때 span이 돌려주는 객체 (하나를 같이 씀)."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> dict:
+        return {}
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL = _NullSpan()
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def log_enabled() -> bool:
+    """회전 로그 파일에도 쓰는 중인지 (perf_log). 비용이 드는 측정은 이때만."""
+    return _logger is not None
+
+
+def span(name: str, **fields):
+    """with perf.span("cache.write") as s: ... s["bytes"] = n"""
+    if not _enabled:
+        return _NULL
+    return _Span(name, fields)
+
+
+def record(name: str, ms: float, **fields) -> None:
+    if _enabled:
+        _emit({"name": name, "at": round(_now_ms() - ms, 3), "ms": round(ms, 3),
+               "thread": threading.current_thread().name, **fields})
+
+
+def note(name: str, **fields) -> None:
+    if _enabled:
+        _emit({"name": name, "at": round(_now_ms(), 3), "thread": threading.current_thread().name, **fields})
+
+
+def mark(name: str) -> None:
+    """시작 시간표에 지금 시각을 남김 (이름마다 처음 한 번만)."""
+    if not _enabled or name in _timeline:
+        return
+    at = round(_now_ms(), 3)
+    with _lock:
+        if name in _timeline:
+            return
+        _timeline[name] = at
+    _emit({"name": "mark." + name, "at": at})
+
+
+def configure(enabled: bool = True, log_path=None) -> None:
+    """기록 켜기/끄기, 회전 로그 파일 지정 (None이면 로그 파일 안 씀)."""
+    global _enabled, _logger
+    _enabled = bool(enabled)
+    logger = None
+    if _enabled and log_path is not None:
+        try:
+            import logging
+            from logging.handlers import RotatingFileHandler
+
+            logger = logging.getLogger("heartowiki.perf")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            handler = RotatingFileHandler(str(log_path), maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS,
+                                          encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        except Exception:
+            logger = None
+    _logger = logger
+    if logger is not None:
+        _emit({"name": "perf.log", "at": round(_now_ms(), 3), "started_at": _started_at, "timeline": dict(_timeline)})
+
+
+def stats(recent: int = 100) -> dict:
+    """{ enabled, uptime_ms, timeline: { 이름: ms }, totals: { 이름: { count, total_ms, max_ms } }, recent: [최근 기록] }"""
+    with _lock:
+        entries = list(_ring)[-recent:] if recent > 0 else []
+        totals = {
+            name: {"count": n, "total_ms": round(total, 3), "max_ms": round(peak, 3)}
+            for name, (n, total, peak) in _totals.items()
+        }
+        timeline = dict(_timeline)
+    return {
+        "enabled": _enabled,
+        "logging": _logger is not None,
+        "uptime_ms": round(_now_ms(), 3),
+        "timeline": timeline,
+        "totals": totals,
+        "recent": entries,
+    }
+
+
+def reset() -> None:
+    """기록 지우기 (시간표는 그대로)."""
+    with _lock:
+        _ring.clear()
+        _totals.clear()
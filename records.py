@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+도감 행의 정규화된 값 (레벨·가격·날씨·지역·플래그).
+엑셀/opensheet 행은 모두 문자열 dict라서, 화면과 색인이 매번 다시 해석하던 값을 데이터를 읽을 때 한 번만 계산합니다.
+
+  - Record: 행 하나의 값 (__slots__)
+      level      숫자 레벨 (JS parseFloat과 같이 앞부분 숫자, 쉼표 무시). 없으면 None
+      level_tag  LEVEL_* — 빈 값 / 숫자 / 꿈의명암 / 빙설 / 획득불가 / 그 밖의 글자
+      price      정수 가격 (반올림, 없으면 0)
+      weather    WEATHERS 비트마스크 (날씨영향에 비/해/무지개/맑 포함 여부)
+      region     지역 번호 (derived["regions"]의 위치, 0 = 없음)
+      flags      FLAG_WEIRD(명칭·비고에 '괴상'), FLAG_UNOBTAINABLE(명칭·비고에 '획득 불가')
+  - attach(base): base["derived"]에 카테고리별 열 배열로 넣음. 캐시(cache.bin 본문의 숫자 열·parse_cache)와 함께 저장되어
+    페이지는 데이터마다 한 번 받아 씀 (index.html Derived)
+  - load(base, category, regions): derived 열에서 Record 목록 (없거나 행 수가 다르면 행에서 다시 계산)
+"""
+
+import math
+import re
+import sys
+import unicodedata
+
+VERSION = 1
+# (필터 값, 날씨영향에 포함되면 해당하는 글자, 비트)
+WEATHERS = (("비", "비", 1), ("해", "해", 2), ("무지개", "무지개", 4), ("맑은 날", "맑", 8))
+LEVEL_NONE, LEVEL_NUMBER, LEVEL_DREAM, LEVEL_SNOW, LEVEL_UNOBTAINABLE, LEVEL_TEXT = range(6)
+# 레벨 글자에 포함되면 해당하는 태그 (index.html formatLevelDisplay와 같은 순서로 먼저 맞는 것)
+_LEVEL_TAGS = (
+    (("꿈의명암", "꿈의 명암"), LEVEL_DREAM),
+    (("빙설", "빙결"), LEVEL_SNOW),
+    (("획득불가", "획득 불가"), LEVEL_UNOBTAINABLE),
+)
+FLAG_WEIRD = 1
+FLAG_UNOBTAINABLE = 2
+COLUMNS = ("level", "levelTag", "price", "weather", "region", "flags")
+
+_FLOAT_RE = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)")
+
+
+def parse_float(value):
+    """JS parseFloat과 같이 앞부분 숫자만 읽음. 숫자로 시작하지 않으면 None."""
+    m = _FLOAT_RE.match(str(value or ""))
+    return float(m.group(1)) if m else None
+
+
+def weather_mask(text: str) -> int:
+    mask = 0
+    for _name, needle, bit in WEATHERS:
+        if needle in (text or ""):
+            mask |= bit
+    return mask
+
+
+def level_label(value) -> str:
+    """레벨 비교용 글자 (앞뒤 공백 제거 + NFC 정규화)."""
+    return unicodedata.normalize("NFC", str(value if value is not None else "").strip())
+
+
+def parse_level(value):
+    """레벨 값 → (숫자 또는 None, LEVEL_* 태그)."""
+    s = level_label(value)
+    if not s:
+        return None, LEVEL_NONE
+    n = parse_float(s.replace(",", ""))
+    for needles, tag in _LEVEL_TAGS:
+        if any(needle in s for needle in needles):
+            return n, tag
+    return n, (LEVEL_NUMBER if n is not None else LEVEL_TEXT)
+
+
+def _number(value: float):
+    """JSON에 넣을 숫자: 정수면 int."""
+    return int(value) if value is not None and value.is_integer() else value
+
+
+class Record:
+    """도감 행 하나의 정규화된 값."""
+
+    __slots__ = ("level", "level_tag", "price", "weather", "region", "flags")
+
+    def __init__(self, level, level_tag: int, price: int, weather: int, region: int, flags: int):
+        self.level = level
+        self.level_tag = level_tag
+        self.price = price
+        self.weather = weather
+        self.region = region
+        self.flags = flags
+
+    @property
+    def sort_level(self) -> float:
+        # index.html FilterManager.levelNum: 빈 값 0, 숫자가 아니면 20
+        if self.level is not None:
+            return self.level
+        return 0.0 if self.level_tag == LEVEL_NONE else 20.0
+
+    def row(self) -> tuple:
+        """COLUMNS 순서의 값."""
+        return (_number(self.level), self.level_tag, self.price, self.weather, self.region, self.flags)
+
+
+class Regions:
+    """지역 문자열 ↔ 번호 (0 = 지역 없음). 같은 지역 문자열은 하나만 보관 (sys.intern)."""
+
+    def __init__(self, names=None):
+        self.names = [""]
+        self.ids = {"": 0}
+        for name in names or ():
+            self.id(name)
+
+    def id(self, name: str) -> int:
+        name = name or ""
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return i
+
+
+def from_item(item: dict, regions: Regions) -> Record:
+    level, tag = parse_level(item.get("레벨"))
+    price = parse_float(item.get("가격"))
+    text = f"{item.get('명칭') or ''}{item.get('비고') or ''}"
+    flags = (FLAG_WEIRD if "괴상" in text else 0) | (FLAG_UNOBTAINABLE if "획득 불가" in text else 0)
+    return Record(
+        level,
+        tag,
+        int(math.floor(price + 0.5)) if price is not None else 0,  # JS Math.round과 같은 반올림
+        weather_mask(str(item.get("날씨영향") or "")),
+        regions.id(item.get("지역") or ""),
+        flags,
+    )
+
+
+def derive(base: dict) -> dict:
+    """도감 데이터 → { version, regions: [지역 ...], 카테고리: { level: [...], levelTag: [...], ... } } (행 순서대로)."""
+    regions = Regions()
+    derived = {"version": VERSION, "regions": regions.names}
+    for category, rows in base.items():
+        if not isinstance(rows, list):
+            continue
+        columns = {name: [] for name in COLUMNS}
+        lists = [columns[name] for name in COLUMNS]
+        for item in rows:
+            for column, value in zip(lists, from_item(item, regions).row()):
+                column.append(value)
+        derived[category] = columns
+    return derived
+
+
+def attach(base: dict) -> dict:
+    """base["derived"]를 (다시) 계산해 넣고 base 반환."""
+    base["derived"] = derive(base)
+    return base
+
+
+def is_current(base: dict) -> bool:
+    """derived가 있고 카테고리별 행 수가 맞는지."""
+    derived = base.get("derived")
+    if not isinstance(derived, dict) or derived.get("version") != VERSION:
+        return False
+    for category, rows in base.items():
+        if isinstance(rows, list) and len((derived.get(category) or {}).get("level") or ()) != len(rows):
+            return False
+    return True
+
+
+def ensure(base: dict) -> dict:
+    """예전 캐시처럼 derived가 없거나 맞지 않으면 계산해 넣음."""
+    if isinstance(base, dict) and not is_current(base):
+        attach(base)
+    return base
+
+
+def regions_of(base: dict) -> Regions:
+    """base의 지역 표 (derived가 맞으면 그 번호 그대로, 아니면 빈 표)."""
+    return Regions(base["derived"]["regions"][1:] if is_current(base) else None)
+
+
+def load(base: dict, category: str, regions: Regions) -> list:
+    """카테고리의 Record 목록. derived가 맞으면 열에서 읽고(regions는 regions_of(base)), 아니면 행에서 계산."""
+    rows = base.get(category) or []
+    if not is_current(base):
+        return [from_item(item, regions) for item in rows]
+    columns = base["derived"].get(category)
+    if not columns:
+        return []
+    return [
+        Record(float(lv) if lv is not None else None, tag, price, weather, region, flags)
+        for lv, tag, price, weather, region, flags in zip(*(columns[name] for name in COLUMNS))
+    ]
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+도감 검색 색인: 명칭·지역·세부지역·재료·레시피를 한글 두 글자(bigram) 색인과 초성 색인으로 찾습니다.
+
+  - 정규화: NFC + 소문자 + 공백 제거 ("고래 바다"와 "고래바다"가 서로 찾아짐)
+  - 두 글자 이상 검색어: 검색어의 bigram 색인을 교집합해 후보를 줄인 뒤 실제로 포함되는지 확인
+  - 초성: "ㄹㅁㅇ" → 로메인. "로ㅁ"처럼 완성 글자와 초성을 섞어도 됨 (초성 자리는 그 초성으로 시작하는 글자와 일치)
+  - 순위: 일치(필드 전체) → 앞부분 일치 → 중간 일치, 같은 단계면 명칭 → 지역 → … 순
+
+행 번호(pos)는 색인에 넣은 순서이며, 빠진 행은 remove로 표시만 하고 번호는 그대로 둡니다.
+"""
+
+import re
+import unicodedata
+
+FIELDS = ("명칭", "지역", "세부지역", "재료", "레시피")
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(CHOSEONG)
+_choseong_table = None  # 완성 글자(가-힣) → 초성, str.translate용 (처음 쓸 때 만듦)
+_SPACE_RE = re.compile(r"\s+")
+
+EXACT, PREFIX, INFIX = 0, 1, 2
+CACHE_SIZE = 16  # 최근 검색 결과 보관 수 (같은 검색어로 필터만 바꿔 다시 그릴 때 재사용)
+
+
+def normalize(text) -> str:
+    """NFC + 소문자 + 공백 제거."""
+    return _SPACE_RE.sub("", unicodedata.normalize("NFC", str(text or "")).lower())
+
+
+def choseong(text: str) -> str:
+    """한글 완성 글자를 초성으로 (그 밖의 글자는 그대로, 길이 유지)."""
+    global _choseong_table
+    if _choseong_table is None:
+        _choseong_table = {0xAC00 + i: CHOSEONG[i // 588] for i in range(11172)}
+    return text.translate(_choseong_table)
+
+
+def _grams(text: str) -> set:
+    """색인 키: 글자 하나 + 이어진 두 글자."""
+    grams = set(text)
+    grams.update(map(str.__add__, text, text[1:]))
+    return grams
+
+
+def _query_grams(query: str) -> set:
+    """검색어로 찾을 키: 두 글자 이상이면 bigram만, 한 글자면 그 글자."""
+    if len(query) < 2:
+        return set(query)
+    return {query[i:i + 2] for i in range(len(query) - 1)}
+
+
+def _match_at(text: str, query: str, start: int) -> bool:
+    """text[start:]가 query와 맞는지 (query의 초성 글자는 같은 초성의 완성 글자와도 맞음)."""
+    for i, q in enumerate(query):
+        ch = text[start + i]
+        if ch == q:
+            continue
+        if q in _CHOSEONG_SET and choseong(ch) == q:
+            continue
+        return False
+    return True
+
+
+def _find(text: str, cho: str, query: str, query_cho: str, has_jamo: bool) -> int:
+    """query가 처음 나오는 위치 (없으면 -1)."""
+    if not has_jamo:
+        return text.find(query)
+    start = cho.find(query_cho)
+    while start != -1:
+        if _match_at(text, query, start):
+            return start
+        start = cho.find(query_cho, start + 1)
+    return -1
+
+
+class SearchIndex:
+    """행 단위 검색 색인. add로 한 행씩 추가 (사용자 추가 생물도 같은 방식으로 바로 반영)."""
+
+    def __init__(self, fields=FIELDS):
+        self.fields = tuple(fields)
+        self._texts = []  # pos → [(필드 순번, 정규화 문자열, 초성 문자열)]
+        self._grams = {}  # 글자·bigram(정규화) → [pos ...] (오름차순)
+        self._cho_grams = {}  # 글자·bigram(초성) → [pos ...]
+        self._removed = set()
+        self._cache = {}  # 정규화된 검색어 → 결과 (삽입 순서 = 오래된 순)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, item: dict) -> int:
+        """행 추가, 행 번호 반환."""
+        pos = len(self._texts)
+        entries = []
+        grams = set()
+        cho_grams = set()
+        for i, field in enumerate(self.fields):
+            text = normalize(item.get(field))
+            if not text:
+                continue
+            cho = choseong(text)
+            entries.append((i, text, cho))
+            grams |= _grams(text)
+            cho_grams |= _grams(cho)
+        self._texts.append(entries)
+        self._cache.clear()
+        for table, keys in ((self._grams, grams), (self._cho_grams, cho_grams)):
+            for g in keys:
+                postings = table.get(g)
+                if postings is None:
+                    table[g] = [pos]
+                else:
+                    postings.append(pos)
+        return pos
+
+    def remove(self, pos: int) -> None:
+        self._removed.add(pos)
+        self._cache.clear()
+
+    def _candidates(self, query: str, query_cho: str, has_jamo: bool):
+        # 초성이 섞인 검색어는 초성 bigram으로, 아니면 글자 bigram으로 후보를 좁힘
+        grams, table = (_query_grams(query_cho), self._cho_grams) if has_jamo else (_query_grams(query), self._grams)
+        postings = []
+        for g in grams:
+            p = table.get(g)
+            if not p:
+                return set()
+            postings.append(p)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for p in postings[1:]:
+            result.intersection_update(p)
+            if not result:
+                break
+        return result - self._removed
+
+    def search(self, text) -> dict:
+        """검색어 → { pos: (순위 단계, 필드 순번) }. 순위 단계는 EXACT < PREFIX < INFIX."""
+        query = normalize(text)
+        if not query:
+            return {}
+        cached = self._cache.pop(query, None)
+        if cached is None:
+            cached = self._search(query)
+            if len(self._cache) >= CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+        self._cache[query] = cached
+        return cached
+
+    def _search(self, query: str) -> dict:
+        has_jamo = any(ch in _CHOSEONG_SET for ch in query)
+        query_cho = choseong(query)
+        hits = {}
+        for pos in self._candidates(query, query_cho, has_jamo):
+            best = None
+            for i, field_text, cho in self._texts[pos]:
+                at = _find(field_text, cho, query, query_cho, has_jamo)
+                if at < 0:
+                    continue
+                if at == 0:
+                    tier = EXACT if len(field_text) == len(query) else PREFIX
+                else:
+                    tier = INFIX
+                rank = (tier, i)
+                if best is None or rank < best:
+                    best = rank
+            if best is not None:
+                hits[pos] = best
+        return hits
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+settings.json 지연 저장: 설정은 메모리에 두고, 전용 스레드가 모아서 일정 간격마다 한 번만 씁니다.
+화면이 그려질 때마다 오는 저장 요청은 메모리만 바꾸고 바로 돌아가며,
+이전과 같은 값이면 아예 무시합니다. 종료할 때는 남은 변경을 바로 씁니다.
+"""
+
+import copy
+import json
+import threading
+import time
+from pathlib import Path
+
+from collection_journal import write_json_atomic
+
+DEFAULT_SETTINGS = {"currentTab": "어류", "sortBy": "level-asc", "colors": {}}
+FLUSH_INTERVAL = 1.0  # 초: 이 간격 안의 변경은 한 번의 쓰기로 합침
+
+
+class SettingsWriter:
+    """설정 메모리 보관 + 백그라운드 쓰기 스레드."""
+
+    def __init__(self, path: Path, interval: float = FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.interval = max(0.0, float(interval))
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # 쓰기 스레드와 종료 시 flush가 겹치지 않도록
+        self._settings = None
+        self._written = None  # 마지막으로 파일에 쓴 JSON 문자열
+        self._dirty = False
+        self._last_flush = 0.0
+        self._thread = None
+        self._closed = False
+        self.counters = {"updates": 0, "identical": 0, "coalesced": 0, "writes": 0}
+
+    def _load(self) -> None:
+        settings = dict(DEFAULT_SETTINGS)
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    raw = f.read()
+                settings.update(json.loads(raw))
+                self._written = _serialize(settings)
+            except Exception:
+                pass
+        self._settings = settings
+
+    def get(self) -> dict:
+        """현재 설정 복사본 (파일은 처음 한 번만 읽음)."""
+        with self._cond:
+            if self._settings is None:
+                self._load()
+            return copy.deepcopy(self._settings)
+
+    def update(self, settings: dict) -> bool:
+        """설정 교체 (디스크는 건드리지 않음). 이전과 같으면 False."""
+        with self._cond:
+            if self._settings is None:
+                self._load()
+            self.counters["updates"] += 1
+            if settings == self._settings:
+                self.counters["identical"] += 1
+                return False
+            self._settings = copy.deepcopy(settings)
+            if self._dirty:
+                self.counters["coalesced"] += 1  # 아직 쓰지 않은 이전 변경과 합쳐짐
+            self._dirty = True
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+            return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # 마지막 쓰기 후 interval이 지날 때까지 기다리며 그 사이 변경을 모음
+                wait = self._last_flush + self.interval - time.monotonic()
+                while wait > 0 and not self._closed:
+                    self._cond.wait(wait)
+                    wait = self._last_flush + self.interval - time.monotonic()
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                pass  # 실패한 변경은 다시 dirty로 남아 다음 간격에 재시도
+
+    def flush(self) -> None:
+        """쓰지 않은 변경이 있으면 지금 씀."""
+        with self._write_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._cond:
+            if not self._dirty:
+                return
+            self._dirty = False
+            payload = _serialize(self._settings)
+            self._last_flush = time.monotonic()
+            if payload == self._written:
+                # A → B → A처럼 결국 파일 내용과 같아짐
+                self.counters["identical"] += 1
+                return
+            data = copy.deepcopy(self._settings)
+        try:
+            write_json_atomic(self.path, data)
+        except Exception:
+            with self._cond:
+                self._dirty = True
+            raise
+        with self._cond:
+            self._written = payload
+            self.counters["writes"] += 1
+
+    def stats(self) -> dict:
+        """저장 요청 수(updates), 같은 값이라 무시(identical), 다른 변경과 합쳐짐(coalesced), 실제 쓰기(writes)."""
+        with self._cond:
+            return dict(self.counters)
+
+    def close(self) -> None:
+        """종료 시: 스레드를 멈추고 남은 변경을 씀."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2)
+        self.flush()
+
+
+def _serialize(settings: dict) -> str:
+    return json.dumps(settings, ensure_ascii=False, sort_keys=True)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+앱 업데이트 exe 다운로드: 이어받기(HTTP Range) + 크기·SHA-256 확인 + 진행 상황 콜백.
+
+  - 받는 중인 파일(<exe>_new.exe) 옆에 <파일>.download.json(URL, ETag/Last-Modified, 기대 크기·해시)을 두고,
+    연결이 끊기면 같은 실행 안에서, 또는 다음에 다시 「업데이트 적용」을 눌렀을 때 받은 데이터 뒤부터 이어받음
+  - If-Range로 서버 파일이 바뀌었으면 처음부터 다시 받음 (200 응답)
+  - 다 받은 뒤 app_version.json의 size·sha256과 비교. 다르면 파일을 지우고 ValueError
+  - progress(done, total, rate, eta): 받은 바이트, 전체(모르면 0), 초당 바이트, 남은 초(모르면 None)
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import http_client
+
+CHUNK_SIZE = 256 << 10  # 한 번에 읽는 크기 (끊기면 읽던 조각만 다시 받음)
+WRITE_BUFFER = 4 << 20  # 파일 쓰기 버퍼
+HASH_BLOCK = 1 << 20
+MAX_RESUMES = 5  # 한 번의 다운로드에서 끊긴 뒤 이어받는 최대 횟수
+PROGRESS_INTERVAL = 0.25  # 초: 진행 상황 콜백 최소 간격
+
+
+def _meta_path(path: Path) -> Path:
+    return path.with_name(path.name + ".download.json")
+
+
+def _read_meta(path: Path) -> dict:
+    try:
+        with open(_meta_path(path), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return meta if isinstance(meta, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_meta(path: Path, meta: dict) -> None:
+    with open(_meta_path(path), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+def discard(path: Path) -> None:
+    """받다 만 파일과 이어받기 정보를 지움."""
+    path = Path(path)
+    path.unlink(missing_ok=True)
+    _meta_path(path).unlink(missing_ok=True)
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _resume_offset(path: Path, meta: dict, wanted: dict) -> int:
+    """이어받을 수 있으면 이미 받은 바이트 수, 아니면 0 (파일과 메타를 비움)."""
+    same = all(meta.get(k) == wanted[k] for k in ("url", "size", "sha256"))
+    if same and path.exists() and (meta.get("etag") or meta.get("last_modified")):
+        have = path.stat().st_size
+        if not wanted["size"] or have <= wanted["size"]:
+            return have
+    if path.exists():
+        path.unlink()
+    return 0
+
+
+def download(url: str, path: Path, size: int = 0, sha256: str = "", progress=None, params=None) -> dict:
+    """url을 path로 받음 (가능하면 이어받기). 반환 { size, sha256, resumed: 이어받은 횟수 }.
+    크기·해시가 주어졌는데 다르면 path를 지우고 ValueError."""
+    import requests
+    path = Path(path)
+    size = int(size or 0)
+    sha256 = (sha256 or "").strip().lower()
+    wanted = {"url": url, "size": size, "sha256": sha256}
+    meta = _read_meta(path)
+    have = _resume_offset(path, meta, wanted)
+    if not have:
+        meta = dict(wanted)
+    resumed = 0
+    started = time.monotonic()
+    session_bytes = 0
+    last_report = 0.0
+    total = size
+
+    def report(final=False):
+        nonlocal last_report
+        now = time.monotonic()
+        if progress is None or (not final and now - last_report < PROGRESS_INTERVAL):
+            return
+        last_report = now
+        rate = session_bytes / max(now - started, 1e-6)
+        eta = (total - have) / rate if total and rate > 0 else None
+        progress(have, total, rate, eta)
+
+    for attempt in range(MAX_RESUMES + 1):
+        if size and have >= size:
+            break
+        headers = {}
+        if have:
+            headers["Range"] = f"bytes={have}-"
+            validator = meta.get("etag") or meta.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+        r = http_client.get(url, kind="download", stream=True, headers=headers, params=params)
+        try:
+            if r.status_code == 416 and have:
+                # 받은 것이 이미 서버 파일보다 김/같음 → 처음부터
+                path.unlink()
+                have = 0
+                continue
+            r.raise_for_status()
+            if r.status_code == 206 and have and r.headers.get("Content-Range", "").startswith(f"bytes {have}-"):
+                mode = "ab"
+                resumed += 1
+            else:
+                mode = "wb"  # Range를 무시했거나 파일이 바뀜 → 처음부터
+                have = 0
+            if not total:
+                content_range = r.headers.get("Content-Range", "")
+                if "/" in content_range and content_range.rsplit("/", 1)[1].isdigit():
+                    total = int(content_range.rsplit("/", 1)[1])
+                elif r.headers.get("Content-Length", "").isdigit():
+                    total = have + int(r.headers["Content-Length"])
+            meta["etag"] = r.headers.get("ETag", "")
+            meta["last_modified"] = r.headers.get("Last-Modified", "")
+            _write_meta(path, meta)
+            with open(path, mode, buffering=WRITE_BUFFER) as f:
+                try:
+                    for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            have += len(chunk)
+                            session_bytes += len(chunk)
+                            report()
+                except (requests.RequestException, OSError):
+                    if attempt == MAX_RESUMES:
+                        raise
+                    continue  # 끊김 → 받은 데이터 뒤부터 다시 요청
+        finally:
+            r.close()
+        if not total or have >= total:
+            break
+    report(final=True)
+
+    actual_size = path.stat().st_size if path.exists() else 0
+    if (size and actual_size != size) or (total and actual_size != total):
+        discard(path)
+        raise ValueError(f"받은 파일 크기가 다릅니다 ({actual_size} / {size or total} 바이트).")
+    digest = file_sha256(path)
+    if sha256 and digest != sha256:
+        discard(path)
+        raise ValueError("받은 파일의 SHA-256이 app_version.json과 다릅니다. 다시 시도해 주세요.")
+    _meta_path(path).unlink(missing_ok=True)
+    return {"size": actual_size, "sha256": digest, "resumed": resumed}
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+heartowiki.xlsx 전용 빠른 읽기 (zipfile + XML 스트리밍, openpyxl 불필요).
+sharedStrings.xml은 한 번만 읽어 intern된 목록으로 두고, 시트 XML은 한 행씩 파싱해
+openpyxl read_only + data_only + iter_rows(values_only=True)와 같은 값을 돌려줍니다.
+날짜 서식 셀처럼 여기서 다루지 않는 경우는 UnsupportedWorkbook을 내므로 openpyxl로 다시 읽으면 됩니다.
+"""
+
+import io
+import posixpath
+import re
+import sys
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# openpyxl과 같은 기준으로 날짜 서식 판별 (openpyxl.styles.numbers.is_date_format)
+_BUILTIN_DATE_FORMATS = {14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47}
+_FORMAT_STRIP_RE = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_CHAR_RE = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+_CELL_REF_RE = re.compile(r"([A-Z]+)(\d+)")
+_DIMENSION_RE = re.compile(r"\$?([A-Z]+)?\$?(\d+)?(?::\$?([A-Z]+)?\$?(\d+)?)?$")
+
+
+class UnsupportedWorkbook(ValueError):
+    """빠른 경로로 openpyxl과 같은 값을 낼 수 없는 통합문서 (openpyxl로 다시 읽어야 함)."""
+
+
+class _NeedsOpenpyxl:
+    """날짜 서식 등 openpyxl 변환이 필요한 셀 값. 실제로 문자열로 쓰일 때만 빠른 경로를 포기."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def __str__(self):
+        raise UnsupportedWorkbook(f"날짜/시간 셀은 openpyxl로 읽어야 합니다: {self.raw}")
+
+
+def _is_date_format(fmt: str) -> bool:
+    fmt = (fmt or "").split(";")[0]
+    fmt = _FORMAT_STRIP_RE.sub("", fmt)
+    return _DATE_CHAR_RE.search(fmt) is not None
+
+
+def _column_number(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch) - 64)
+    return n
+
+
+def _cast_number(value: str):
+    """openpyxl과 동일: 소수점/지수가 있으면 float, 아니면 int."""
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+def _text_content(element) -> str:
+    """<si> / <is> 요소의 글자만 (openpyxl Text.content 와 동일: <t> + <r><t>, 윗주 <rPh> 제외)."""
+    parts = []
+    for child in element:
+        if child.tag == NS_MAIN + "t":
+            parts.append(child.text or "")
+        elif child.tag == NS_MAIN + "r":
+            t = child.find(NS_MAIN + "t")
+            if t is not None:
+                parts.append(t.text or "")
+    return "".join(parts)
+
+
+def read_shared_strings(source) -> list:
+    """sharedStrings.xml → 문자열 목록 (sys.intern으로 같은 문자열은 하나만 보관)."""
+    strings = []
+    for _event, element in iterparse(source):
+        if element.tag == NS_MAIN + "si":
+            strings.append(sys.intern(_text_content(element).replace("x005F_", "")))
+            element.clear()
+    return strings
+
+
+def read_sheet_targets(workbook_xml: bytes, rels_xml: bytes) -> list:
+    """workbook.xml + workbook.xml.rels → [(시트 이름, zip 내부 경로)] (통합문서 순서)."""
+    targets = {}
+    for _event, element in iterparse(io.BytesIO(rels_xml)):
+        if element.tag == NS_PKG_REL + "Relationship":
+            targets[element.get("Id")] = _resolve_target(element.get("Target") or "")
+    sheets = []
+    for _event, element in iterparse(io.BytesIO(workbook_xml)):
+        if element.tag == NS_MAIN + "sheet":
+            rid = element.get(NS_REL + "id")
+            if rid in targets:
+                sheets.append((element.get("name") or "", targets[rid]))
+    return sheets
+
+
+def _resolve_target(target: str) -> str:
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join("xl", target))
+
+
+def _read_date_styles(source) -> set:
+    """styles.xml → 날짜 서식이 적용된 cellXfs 인덱스 집합."""
+    custom = {}
+    date_styles = set()
+    in_cell_xfs = False
+    xf_index = 0
+    for event, element in iterparse(source, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == NS_MAIN + "cellXfs":
+                in_cell_xfs = True
+            continue
+        if tag == NS_MAIN + "numFmt":
+            custom[int(element.get("numFmtId", "0"))] = element.get("formatCode") or ""
+        elif tag == NS_MAIN + "xf" and in_cell_xfs:
+            fmt_id = int(element.get("numFmtId", "0"))
+            if fmt_id in custom:
+                is_date = _is_date_format(custom[fmt_id])
+            else:
+                is_date = fmt_id in _BUILTIN_DATE_FORMATS
+            if is_date:
+                date_styles.add(xf_index)
+            xf_index += 1
+        elif tag == NS_MAIN + "cellXfs":
+            in_cell_xfs = False
+    return date_styles
+
+
+def iter_sheet_rows(source, shared_strings: list, date_styles: set = frozenset()):
+    """시트 XML을 한 행씩 파싱해 값 튜플을 생성 (빠진 행은 빈 튜플, 1행부터).
+    openpyxl read_only처럼 <dimension>의 마지막 행·열까지만 읽음."""
+    max_row = max_col = None
+    counter = 1
+    row_counter = 0
+    context = iterparse(source, events=("start", "end"))
+    for event, element in context:
+        tag = element.tag
+        if event == "start":
+            continue
+        if tag == NS_MAIN + "dimension":
+            m = _DIMENSION_RE.match(element.get("ref") or "")
+            if not m:
+                raise UnsupportedWorkbook("시트 범위(dimension)를 해석할 수 없습니다.")
+            start_col, start_row, end_col, end_row = m.groups()
+            if end_col is None and end_row is None:
+                end_col, end_row = start_col, start_row
+            max_col = _column_number(end_col) if end_col else None
+            max_row = int(end_row) if end_row else None
+        elif tag == NS_MAIN + "row":
+            r = element.get("r")
+            row_counter = int(float(r)) if r else row_counter + 1
+            if max_row is not None and row_counter > max_row:
+                break
+            values = _row_values(element, shared_strings, date_styles, max_col)
+            element.clear()
+            while counter < row_counter:
+                counter += 1
+                yield ()
+            if counter <= row_counter:
+                counter += 1
+                yield values
+
+
+def _row_values(row, shared_strings: list, date_styles: set, max_col) -> tuple:
+    cells = []
+    col = 0
+    width = 0
+    for c in row:
+        if c.tag != NS_MAIN + "c":
+            continue
+        ref = c.get("r")
+        if ref:
+            m = _CELL_REF_RE.match(ref)
+            col = _column_number(m.group(1)) if m else col + 1
+        else:
+            col += 1
+        if max_col is not None and col > max_col:
+            continue
+        value = _cell_value(c, shared_strings, date_styles)
+        cells.append((col, value))
+        if col > width:
+            width = col
+    if max_col is not None:
+        width = max_col
+    values = [None] * width
+    for col, value in cells:
+        values[col - 1] = value
+    return tuple(values)
+
+
+def _cell_value(c, shared_strings: list, date_styles: set):
+    data_type = c.get("t", "n")
+    if data_type == "inlineStr":
+        child = c.find(NS_MAIN + "is")
+        return _text_content(child) if child is not None else None
+    value = c.findtext(NS_MAIN + "v") or None
+    if value is None:
+        return None
+    if data_type == "n":
+        style = c.get("s")
+        if style and int(style) in date_styles:
+            return _NeedsOpenpyxl(value)
+        return _cast_number(value)
+    if data_type == "s":
+        return shared_strings[int(value)]
+    if data_type == "b":
+        return bool(int(value))
+    if data_type == "d":
+        return _NeedsOpenpyxl(value)
+    return value  # str(수식 결과), e(오류)
+
+
+class FastWorkbook:
+    """zip으로 연 xlsx. sheetnames / iter_rows(시트 이름) 만 제공 (openpyxl read_only 대체용)."""
+
+    def __init__(self, raw: bytes):
+        try:
+            self._zip = zipfile.ZipFile(io.BytesIO(raw))
+            names = set(self._zip.namelist())
+            rels = self._zip.read("xl/_rels/workbook.xml.rels")
+            self._sheets = dict(read_sheet_targets(self._zip.read("xl/workbook.xml"), rels))
+            self.sheetnames = list(self._sheets)
+            self._shared_strings = []
+            if "xl/sharedStrings.xml" in names:
+                with self._zip.open("xl/sharedStrings.xml") as f:
+                    self._shared_strings = read_shared_strings(f)
+            self._date_styles = set()
+            if "xl/styles.xml" in names:
+                with self._zip.open("xl/styles.xml") as f:
+                    self._date_styles = _read_date_styles(f)
+        except UnsupportedWorkbook:
+            raise
+        except Exception as e:
+            raise UnsupportedWorkbook(f"xlsx 구조를 읽을 수 없습니다: {e}") from e
+
+    def iter_rows(self, name: str):
+        """시트의 행을 값 튜플로 하나씩 생성 (첫 행부터)."""
+        with self._zip.open(self._sheets[name]) as f:
+            yield from iter_sheet_rows(f, self._shared_strings, self._date_styles)
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+원격 xlsx 일부만 읽기 (HTTP Range): 통합문서 전체를 받지 않고 시트 하나의 앞쪽 몇 행만 읽습니다.
+check_data_update가 GitHub의 heartowiki.xlsx에서 '도감 정보' 시트의 도감 버전만 확인할 때 사용합니다.
+
+  - RangeFile: seek/read를 Range 요청으로 바꾸는 읽기 전용 파일 객체 (BLOCK 단위로 받아 둠).
+    zipfile이 끝의 중앙 디렉터리(EOCD)를 찾고, 필요한 멤버의 압축 데이터만 읽게 됨
+  - 서버가 Range를 무시하고 200으로 전체를 주면 그 내용을 그대로 씀 (전체 다운로드로 대체)
+  - 공유 문자열(sharedStrings.xml)은 시트 앞 행에서 쓰는 번호까지만 압축을 풀며 읽음
+"""
+
+import io
+import zipfile
+from itertools import islice
+
+import http_client
+import xlsx_fast
+
+BLOCK = 16 * 1024  # 한 번에 받는 최소 단위
+TAIL = 16 * 1024  # 처음 요청: 파일 끝 (EOCD + 중앙 디렉터리)
+
+
+class RangeFile(io.RawIOBase):
+    """URL을 Range 요청으로 읽는 파일 객체. requests / bytes_fetched로 받은 양 확인."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.pos = 0
+        self.blocks = {}  # 블록 번호 → 바이트
+        self.full = None  # 서버가 Range를 무시했을 때 전체 내용
+        self.requests = 0
+        self.bytes_fetched = 0
+        r = self._get(f"bytes=-{TAIL}")
+        if r.status_code == 206:
+            total = r.headers.get("Content-Range", "").rsplit("/", 1)[-1]
+            if not total.isdigit():
+                raise ValueError("Content-Range에 전체 크기가 없습니다.")
+            self.size = int(total)
+            self._store(self.size - len(r.content), r.content)
+        else:
+            self.full = r.content
+            self.size = len(self.full)
+
+    def _get(self, byte_range: str):
+        r = http_client.get(self.url, kind="data", headers={"Range": byte_range, "Accept-Encoding": "identity"})
+        if r.status_code not in (200, 206):
+            r.raise_for_status()
+            raise ValueError(f"예상하지 못한 응답: {r.status_code}")
+        self.requests += 1
+        self.bytes_fetched += len(r.content)
+        return r
+
+    def _store(self, start: int, data: bytes) -> None:
+        # 블록 경계에 걸친 앞뒤 조각은 버리고 온전한 블록만 보관 (끝 블록은 파일 끝이면 보관)
+        first = -(-start // BLOCK)
+        for b in range(first, (start + len(data)) // BLOCK + 1):
+            lo = b * BLOCK - start
+            chunk = data[lo:lo + BLOCK]
+            if len(chunk) == BLOCK or b * BLOCK + len(chunk) == self.size:
+                self.blocks[b] = chunk
+
+    def _ensure(self, start: int, end: int) -> None:
+        missing = [b for b in range(start // BLOCK, (end - 1) // BLOCK + 1) if b not in self.blocks]
+        if not missing:
+            return
+        lo, hi = missing[0] * BLOCK, min(self.size, (missing[-1] + 1) * BLOCK)
+        r = self._get(f"bytes={lo}-{hi - 1}")
+        if r.status_code == 200:
+            self.full = r.content
+            self.size = len(self.full)
+            return
+        self._store(lo, r.content)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = {0: 0, 1: self.pos, 2: self.size}[whence]
+        self.pos = max(0, base + offset)
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+    def read(self, n: int = -1) -> bytes:
+        end = self.size if n is None or n < 0 else min(self.size, self.pos + n)
+        if end <= self.pos:
+            return b""
+        if self.full is None:
+            self._ensure(self.pos, end)
+        if self.full is not None:
+            data = self.full[self.pos:end]
+        else:
+            data = b"".join(self.blocks[b] for b in range(self.pos // BLOCK, (end - 1) // BLOCK + 1))
+            skip = self.pos - (self.pos // BLOCK) * BLOCK
+            data = data[skip:skip + end - self.pos]
+        self.pos = end
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class _StringRef:
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+
+class _LazyStrings:
+    """shared_strings 자리에 넘겨, 시트가 쓰는 공유 문자열 번호만 모음."""
+
+    def __init__(self):
+        self.used = set()
+
+    def __getitem__(self, index: int):
+        self.used.add(index)
+        return _StringRef(index)
+
+
+def _read_strings_until(source, last: int) -> list:
+    """sharedStrings.xml 앞에서부터 last번까지만 읽음 (그 뒤의 압축 데이터는 받지 않음)."""
+    strings = []
+    for _event, element in xlsx_fast.iterparse(source):
+        if element.tag == xlsx_fast.NS_MAIN + "si":
+            strings.append(xlsx_fast._text_content(element).replace("x005F_", ""))
+            element.clear()
+            if len(strings) > last:
+                break
+    return strings
+
+
+def read_sheet_head(url: str, sheet: str, rows: int = 2):
+    """원격 xlsx의 시트 앞 rows행 (값 튜플 목록)과 받은 양 { requests, bytes, size, ranged }.
+    시트가 없으면 행 목록은 []."""
+    f = RangeFile(url)
+    stats = lambda: {"requests": f.requests, "bytes": f.bytes_fetched, "size": f.size, "ranged": f.full is None}
+    with zipfile.ZipFile(f) as z:
+        names = set(z.namelist())
+        targets = dict(xlsx_fast.read_sheet_targets(z.read("xl/workbook.xml"), z.read("xl/_rels/workbook.xml.rels")))
+        if sheet not in targets:
+            return [], stats()
+        lazy = _LazyStrings()
+        with z.open(targets[sheet]) as s:
+            head = list(islice(xlsx_fast.iter_sheet_rows(s, lazy), rows))
+        strings = []
+        if lazy.used and "xl/sharedStrings.xml" in names:
+            with z.open("xl/sharedStrings.xml") as s:
+                strings = _read_strings_until(s, max(lazy.used))
+
+        def resolve(v):
+            if isinstance(v, _StringRef):
+                return strings[v.index] if v.index < len(strings) else None
+            return v
+
+        return [tuple(resolve(v) for v in row) for row in head], stats()